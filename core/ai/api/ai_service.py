@@ -1,29 +1,90 @@
 from fastapi import FastAPI
 import json
+import os
+import sys
 
-from recommender.recommender import recommend_opportunities
-from recommender.ranking import rank_by_deadline
-from recommender.explanation import generate_explanation
+# Shared helpers (telemetry) live in core/
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from recommender.recommender import eligible_indices
+from eligibility.columnar import EligibilityMatrix
+from eligibility.engine import EligibilityPlan
+from recommender.ranking import RankingIndex
+from recommender.explanation import generate_explanation, generate_ineligibility_explanation
+from telemetry import instrument, span
 
 app = FastAPI(title="SETU AI Service")
 
+# /metrics + per-route latency; recommendations must answer within 3 s
+instrument(app, "ai_service", slos={
+    "/recommend": "recommendations",
+    "/eligibility": "recommendations",
+})
+
+# Curated list + records extracted from scraped portals
+# (scripts/scraper/extract_opportunities.py); the first file wins on id clashes
+OPPORTUNITY_FILES = os.getenv(
+    "OPPORTUNITY_FILES", os.pathsep.join(["data/oppotunities.json", "data/opportunities.json"])
+).split(os.pathsep)
+
 # Load data
-with open("data/opportunities.json") as f:
-    opportunities = json.load(f)
+opportunities = []
+_seen_ids = set()
+for path in OPPORTUNITY_FILES:
+    if not os.path.exists(path):
+        continue
+    with open(path) as f:
+        for opp in json.load(f):
+            if str(opp["id"]) not in _seen_ids:
+                _seen_ids.add(str(opp["id"]))
+                opportunities.append(opp)
+
+# Eligibility constraints as columns + compiled rule plan, built once
+eligibility_matrix = EligibilityMatrix(opportunities)
+eligibility_plan = EligibilityPlan(opportunities)
+
+# Deadlines parsed once into ordinals, plus a deadline-sorted index
+ranking_index = RankingIndex(opportunities)
 
 @app.post("/recommend")
-def recommend(student: dict):
-    eligible_opps = recommend_opportunities(student, opportunities)
-    ranked = rank_by_deadline(eligible_opps)
+def recommend(student: dict, limit: int = 10):
+    with span("eligibility"):
+        candidates = eligible_indices(student, eligibility_matrix, eligibility_plan)
+    with span("ranking"):
+        match = eligibility_matrix.match_scores(student, candidates)
+        top = ranking_index.top_k(candidates, limit=limit, match=match)
+
+    # Only the returned opportunities are materialized
+    response = []
+    with span("explanation"):
+        for i in top:
+            opp = opportunities[i]
+            response.append({
+                "id": opp["id"],
+                "title": opp["title"],
+                "deadline": opp["deadline"],
+                "link": opp["link"],
+                "explanation": generate_explanation(student, opp)
+            })
+
+    return response
+
+@app.post("/eligibility")
+def eligibility(student: dict):
+    with span("eligibility"):
+        results = eligibility_plan.evaluate(student)
 
     response = []
-    for opp in ranked:
+    for i, ok, _ in results:
+        opp = opportunities[i]
         response.append({
             "id": opp["id"],
             "title": opp["title"],
-            "deadline": opp["deadline"],
-            "link": opp["link"],
-            "explanation": generate_explanation(student, opp)
+            "eligible": ok,
+            "explanation": (
+                generate_explanation(student, opp) if ok
+                else generate_ineligibility_explanation(eligibility_plan.explain(student, i))
+            )
         })
 
-    return response
\ No newline at end of file
+    return response
@@ -1,18 +1,23 @@
 from fastapi import APIRouter, Request
-from core.intent_detector import detect_intent
-from core.entity_extractor import extract_profile
-from core.response_generator import handle_sms
-from services.sms_service import send_sms
+from fastapi.concurrency import run_in_threadpool
 
 router = APIRouter()
 
+# JSON variant of /sms/webhook ({"message", "phone", "message_id"}) for
+# gateways that don't read a reply from the response: the pipeline's send
+# stage queues it as an outbound SMS. Same dialog as ai/full_sms.
+# Mount from core/ (ai.full_sms must be importable).
+
+
 @router.post("/sms-webhook")
 async def sms_webhook(request: Request):
+    from ai.full_sms.pipeline import get_pipeline
+
     data = await request.json()
     message = data.get("message", "")
     phone = data.get("phone", "")
-    
-    response = handle_sms(message, phone)
-    await send_sms(phone, response)
-    
-    return {"status": "success"}
\ No newline at end of file
+
+    ctx = await run_in_threadpool(
+        get_pipeline().process, phone, message, data.get("message_id"), True
+    )
+    return {"status": "success", "duplicate": ctx.duplicate}
@@ -1,3 +1,16 @@
+import os
+
+from nlu import get_model, predict
+
+# Minimum model probability to accept when no keyword matched
+INTENT_THRESHOLD = float(os.getenv("NLU_INTENT_THRESHOLD", "0.55"))
+
+# Classifier labels -> the intents this handler knows
+MODEL_INTENTS = {"scheme": "govt_scheme"}
+
+get_model("intent")
+
+
 def detect_intent(message: str) -> str:
     msg = message.lower().strip()
 
@@ -12,4 +25,9 @@ def detect_intent(message: str) -> str:
     if "scheme" in msg or "yojana" in msg:
         return "govt_scheme"
 
-    return "unknown"
\ No newline at end of file
+    # No keyword: fall back to the n-gram classifier (nlu/)
+    guess = predict("intent", msg, INTENT_THRESHOLD)
+    if guess and guess[0] != "unknown":
+        return MODEL_INTENTS.get(guess[0], guess[0])
+
+    return "unknown"
@@ -1,20 +1,9 @@
-from data.rough_data import KNOWLEDGE_BASE
-from core.intent_detector import detect_intent
-from core.entity_extractor import extract_profile
-
 def handle_sms(message: str, phone: str) -> str:
-    print("📨 Incoming SMS:", repr(message))
-
-    intent = detect_intent(message)
-    profile = extract_profile(message)
-
-    print("🧠 Detected intent:", intent)
-    print("👤 Detected profile:", profile)
+    """Same dialog as the SMS webhook (ai/full_sms pipeline); needs core/ on sys.path."""
+    from ai.full_sms.core.response_generator import handle_sms as full_sms_handle
 
-    if intent == "unknown":
-        return "Sorry, I couldn't understand. Try jobs, internship or schemes."
+    return full_sms_handle(message, phone)
 
-    return f"Found {intent} opportunities for {profile} profile. Visit https://www.myscheme.gov.in"
 
 def generate_response(intent: str, entities: dict) -> str:
-    return handle_sms(entities.get("message", ""), entities.get("phone", ""))
\ No newline at end of file
+    return handle_sms(entities.get("message", ""), entities.get("phone", ""))
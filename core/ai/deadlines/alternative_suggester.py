@@ -1,12 +1,113 @@
-def suggest_alternatives(missed_opportunity, all_opportunities):
-    alternatives = []
-
-    for opp in all_opportunities:
-        if (
-            opp["category"] == missed_opportunity["category"]
-            and opp["education_level"] == missed_opportunity["education_level"]
-            and opp["id"] != missed_opportunity["id"]
-        ):
+from bisect import bisect_left
+from datetime import date
+from heapq import nsmallest
+
+from recommender.ranking import deadline_ordinal
+
+
+class AlternativeIndex:
+    """
+    (category, education_level) -> opportunities sorted by deadline.
+
+    Finding open alternatives is a binary search to today's date plus a
+    walk over the next few entries. Per-category and per-level bucket lists
+    back the similarity fallback when the exact bucket has nothing left.
+    """
+
+    def __init__(self, all_opportunities):
+        self.buckets = {}
+        self.by_category = {}
+        self.by_level = {}
+
+        for opp in all_opportunities:
+            key = (opp.get("category"), opp.get("education_level"))
+            self.buckets.setdefault(key, []).append((deadline_ordinal(opp.get("deadline")), str(opp["id"]), opp))
+
+        for key, entries in self.buckets.items():
+            entries.sort(key=lambda e: (e[0], e[1]))
+            self.by_category.setdefault(key[0], []).append(key)
+            self.by_level.setdefault(key[1], []).append(key)
+
+        # Parallel deadline lists for bisect
+        self._deadlines = {key: [e[0] for e in entries] for key, entries in self.buckets.items()}
+
+    def _open(self, key, today, exclude, limit):
+        entries = self.buckets.get(key, [])
+        start = bisect_left(self._deadlines.get(key, []), today)
+        found = []
+        for _, opp_id, opp in entries[start:]:
+            if opp_id not in exclude:
+                found.append(opp)
+                if len(found) == limit:
+                    break
+        return found
+
+    def suggest(self, missed_opportunity, limit=3, today=None):
+        today = today or date.today().toordinal()
+        category = missed_opportunity.get("category")
+        level = missed_opportunity.get("education_level")
+        exclude = {str(missed_opportunity["id"])}
+
+        alternatives = self._open((category, level), today, exclude, limit)
+        if len(alternatives) >= limit:
+            return alternatives
+
+        # Near matches: same category (other level) ranks above same level
+        # (other category); within a tier, soonest open deadline first
+        exclude |= {str(o["id"]) for o in alternatives}
+        near = []
+        for tier, keys in ((0, self.by_category.get(category, [])), (1, self.by_level.get(level, []))):
+            for key in keys:
+                if key == (category, level):
+                    continue
+                for opp in self._open(key, today, exclude, limit):
+                    near.append((tier, deadline_ordinal(opp.get("deadline")), str(opp["id"]), opp))
+
+        seen = set()
+        for _, _, opp_id, opp in nsmallest(len(near), near, key=lambda n: n[:3]):
+            if opp_id in seen:
+                continue
+            seen.add(opp_id)
             alternatives.append(opp)
+            if len(alternatives) == limit:
+                break
+        return alternatives
+
+    def expiring_on(self, day):
+        """Every opportunity whose deadline is exactly `day` (an ordinal)."""
+        expiring = []
+        for key, deadlines in self._deadlines.items():
+            start = bisect_left(deadlines, day)
+            end = bisect_left(deadlines, day + 1)
+            expiring.extend(e[2] for e in self.buckets[key][start:end])
+        return expiring
+
+    def bulk_suggest(self, day=None, limit=3):
+        """
+        Alternatives for everything expiring on `day` (default today), for
+        the nightly reminder job. Opportunities in the same bucket share
+        one lookup.
+        """
+        day = day or date.today().toordinal()
+        results = {}
+        by_bucket = {}
+        for opp in self.expiring_on(day):
+            by_bucket.setdefault((opp.get("category"), opp.get("education_level")), []).append(opp)
+
+        for key, expiring in by_bucket.items():
+            # Alternatives must still be open tomorrow
+            exclude = {str(o["id"]) for o in expiring}
+            shared = self._open(key, day + 1, exclude, limit)
+            for opp in expiring:
+                if len(shared) >= limit:
+                    results[str(opp["id"])] = list(shared)
+                else:
+                    results[str(opp["id"])] = self.suggest(opp, limit, today=day + 1)
+        return results
+
+
+def suggest_alternatives(missed_opportunity, all_opportunities, index=None, limit=3):
+    if index is None:
+        index = AlternativeIndex(all_opportunities)
 
-    return alternatives[:3]
\ No newline at end of file
+    return index.suggest(missed_opportunity, limit)
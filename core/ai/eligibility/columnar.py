@@ -0,0 +1,118 @@
+import numpy as np
+
+ANY_LEVEL = -1
+UNKNOWN_LEVEL = -2
+
+
+def _level_key(level):
+    return level.strip().lower() if isinstance(level, str) else level
+
+
+def student_age(student):
+    """
+    The student's age as a number, or None when missing or unreadable.
+    Same coercion as the rule engine's Predicate, so "20" counts as 20.
+    """
+    age = student.get("age")
+    if age is None:
+        return None
+    if isinstance(age, str):
+        try:
+            return float(age.replace(",", ""))
+        except ValueError:
+            return None
+    try:
+        return float(age)
+    except (TypeError, ValueError):
+        return None
+
+
+class EligibilityMatrix:
+    """
+    Column-per-constraint view of a catalog's eligibility rules.
+
+    Built once per catalog load; checking a student is then a handful of
+    vectorised comparisons over all opportunities instead of a Python loop
+    with per-pair dict lookups. Levels are compared case-insensitively and
+    ages coerced like EligibilityPlan does, so both paths agree.
+    """
+
+    def __init__(self, opportunities):
+        self.opportunities = list(opportunities)
+        m = len(self.opportunities)
+
+        self.level_codes = {}
+        self.education = np.full(m, ANY_LEVEL, dtype=np.int32)
+        self.min_age = np.full(m, -np.inf)
+        self.max_age = np.full(m, np.inf)
+
+        for i, opp in enumerate(self.opportunities):
+            level = opp.get("education_level")
+            if level:
+                self.education[i] = self.level_codes.setdefault(_level_key(level), len(self.level_codes))
+
+            eligibility = opp.get("eligibility") or {}
+            if isinstance(eligibility, dict):
+                if eligibility.get("min_age") is not None:
+                    self.min_age[i] = eligibility["min_age"]
+                if eligibility.get("max_age") is not None:
+                    self.max_age[i] = eligibility["max_age"]
+
+        self.unbounded_age = np.isneginf(self.min_age) & np.isposinf(self.max_age)
+
+    def __len__(self):
+        return len(self.opportunities)
+
+    def _level_code(self, student):
+        level = student.get("education_level")
+        if level is None:
+            return UNKNOWN_LEVEL
+        return self.level_codes.get(_level_key(level), UNKNOWN_LEVEL)
+
+    def mask(self, student) -> np.ndarray:
+        """Boolean array: True where `student` meets every constraint."""
+        education_ok = (self.education == ANY_LEVEL) | (self.education == self._level_code(student))
+
+        age = student_age(student)
+        if age is None:
+            age_ok = self.unbounded_age
+        else:
+            age_ok = (self.min_age <= age) & (age <= self.max_age)
+
+        return education_ok & age_ok
+
+    def match_scores(self, student, indices) -> np.ndarray:
+        """
+        0..1 per index: the share of the two targeting constraints
+        (education level, age range) that name this student specifically,
+        so an opportunity aimed at the student outranks an open-to-all one.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        level_hit = self.education[indices] == self._level_code(student)
+
+        age = student_age(student)
+        if age is None:
+            age_hit = np.zeros(len(indices), dtype=bool)
+        else:
+            age_hit = (~self.unbounded_age[indices]
+                       & (self.min_age[indices] <= age) & (age <= self.max_age[indices]))
+
+        return (level_hit.astype(float) + age_hit) / 2
+
+    def batch_mask(self, students) -> np.ndarray:
+        """N students x M opportunities boolean matrix, computed by broadcasting."""
+        codes = np.array([self._level_code(s) for s in students], dtype=np.int32)[:, None]
+        ages = [student_age(s) for s in students]
+        ages = np.array([np.nan if age is None else age for age in ages], dtype=float)[:, None]
+
+        education_ok = (self.education[None, :] == ANY_LEVEL) | (self.education[None, :] == codes)
+
+        with np.errstate(invalid="ignore"):
+            age_ok = (self.min_age[None, :] <= ages) & (ages <= self.max_age[None, :])
+        # Students without an age only pass opportunities with no age limits
+        age_ok |= np.isnan(ages) & self.unbounded_age[None, :]
+
+        return education_ok & age_ok
+
+    def select(self, mask: np.ndarray):
+        return [self.opportunities[i] for i in np.flatnonzero(mask)]
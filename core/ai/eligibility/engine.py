@@ -1,10 +1,122 @@
-from .eligibility_rules import check_age, check_education
+from .rules import DEFAULT_PASS_RATE, OPERATORS, normalize_rule, reason_for, rules_for
 
-def is_eligible(student, opportunity):
-    if not check_education(student["education_level"], opportunity["education_level"]):
-        return False, "Education level does not match"
+NUMERIC_OPS = ("gte", "lte", "between")
+
+
+class Predicate:
+    """One distinct (field, op, value) test, shared by every opportunity using it."""
+
+    __slots__ = ("id", "field", "op", "value", "reason", "test", "passed", "seen")
+
+    def __init__(self, pred_id, field, op, value):
+        self.id = pred_id
+        self.field = field
+        self.op = op
+        self.value = value
+        self.reason = reason_for(field)
+        self.test = OPERATORS[op]
+        self.passed = 0
+        self.seen = 0
+
+    @property
+    def pass_rate(self):
+        if self.seen < 20:
+            return DEFAULT_PASS_RATE[self.op]
+        return self.passed / self.seen
+
+    def __call__(self, student):
+        actual = student.get(self.field)
+        if actual is None:
+            return False
+        if self.op in NUMERIC_OPS and isinstance(actual, str):
+            try:
+                actual = float(actual.replace(",", ""))
+            except ValueError:
+                return False
+        try:
+            return bool(self.test(actual, self.value))
+        except TypeError:
+            return False
+
+
+class EligibilityPlan:
+    """
+    Rules for a whole catalog compiled into one evaluation plan.
+
+    Identical predicates across opportunities are stored once, and each
+    student evaluates every distinct predicate at most once per call.
+    Each opportunity checks its predicates in order of pass rate (most
+    likely to fail first) and stops at the first failure.
+    """
+
+    def __init__(self, opportunities):
+        self.opportunities = list(opportunities)
+        self.predicates = []
+        self._by_key = {}
+        self.plans = []
 
-    if not check_age(student["age"], opportunity["eligibility"]):
-        return False, "Age criteria not satisfied"
+        for opp in self.opportunities:
+            ids = []
+            for rule in rules_for(opp):
+                key = normalize_rule(rule)
+                pred = self._by_key.get(key)
+                if pred is None:
+                    pred = Predicate(len(self.predicates), *key)
+                    self._by_key[key] = pred
+                    self.predicates.append(pred)
+                if pred.id not in ids:
+                    ids.append(pred.id)
+            self.plans.append(ids)
+
+        # Rules the columnar EligibilityMatrix doesn't cover
+        self.has_extra_rules = [bool(opp.get("rules")) for opp in self.opportunities]
+
+        self.reorder()
+
+    def reorder(self):
+        """Sort each opportunity's predicates by current pass rate."""
+        rates = [p.pass_rate for p in self.predicates]
+        self.plans = [sorted(ids, key=rates.__getitem__) for ids in self.plans]
+
+    def calibrate(self, students):
+        """Measure real pass rates on sample students, then reorder."""
+        for student in students:
+            for pred in self.predicates:
+                pred.seen += 1
+                pred.passed += pred(student)
+        self.reorder()
+
+    def evaluate(self, student, indices=None):
+        """List of (index, eligible, reason) for the given opportunity indices."""
+        memo = {}
+        results = []
+        for i in range(len(self.plans)) if indices is None else indices:
+            reason = None
+            for pred_id in self.plans[i]:
+                ok = memo.get(pred_id)
+                if ok is None:
+                    ok = memo[pred_id] = self.predicates[pred_id](student)
+                if not ok:
+                    reason = self.predicates[pred_id].reason
+                    break
+            results.append((i, reason is None, reason))
+        return results
+
+    def eligible(self, student):
+        return [self.opportunities[i] for i, ok, _ in self.evaluate(student) if ok]
+
+    def explain(self, student, index):
+        """Every failing reason for one opportunity (no short-circuit)."""
+        return [
+            self.predicates[pred_id].reason
+            for pred_id in self.plans[index]
+            if not self.predicates[pred_id](student)
+        ]
+
+
+def is_eligible(student, opportunity):
+    _, ok, reason = EligibilityPlan([opportunity]).evaluate(student)[0]
+    if not ok:
+        return False, reason
 
-    return True, "All eligibility criteria satisfied"
\ No newline at end of file
+    return True, "All eligibility criteria satisfied"
@@ -2,4 +2,93 @@ def check_age(student_age, eligibility):
     return eligibility["min_age"] <= student_age <= eligibility["max_age"]
 
 def check_education(student_level, required_level):
-    return student_level == required_level
\ No newline at end of file
+    return student_level == required_level
+
+
+# ================== DECLARATIVE RULES ==================
+# An opportunity may carry extra rules as plain JSON, e.g.
+#   "rules": [
+#     {"field": "category", "op": "in", "value": ["SC", "ST"]},
+#     {"field": "income", "op": "lte", "value": 250000},
+#     {"field": "gender", "op": "eq", "value": "female"},
+#     {"field": "disability", "op": "eq", "value": true}
+#   ]
+# education_level and eligibility.min_age/max_age are turned into rules too.
+
+
+def _norm(value):
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+OPERATORS = {
+    "eq": lambda actual, expected: _norm(actual) == expected,
+    "ne": lambda actual, expected: _norm(actual) != expected,
+    "in": lambda actual, expected: _norm(actual) in expected,
+    "not_in": lambda actual, expected: _norm(actual) not in expected,
+    "gte": lambda actual, expected: actual >= expected,
+    "lte": lambda actual, expected: actual <= expected,
+    "between": lambda actual, expected: expected[0] <= actual <= expected[1],
+}
+
+# Rough share of students that pass, used to order predicates before any
+# real traffic has been seen (lowest first = fail fast)
+DEFAULT_PASS_RATE = {
+    "eq": 0.3,
+    "in": 0.5,
+    "not_in": 0.8,
+    "ne": 0.8,
+    "gte": 0.6,
+    "lte": 0.6,
+    "between": 0.5,
+}
+
+REASONS = {
+    "education_level": "Education level does not match",
+    "age": "Age criteria not satisfied",
+    "category": "Category criteria not satisfied",
+    "income": "Family income is above the limit",
+    "gender": "Gender criteria not satisfied",
+    "state": "Only open to students from specific states",
+    "disability": "Only open to students with a disability",
+}
+
+
+def reason_for(field):
+    return REASONS.get(field, f"{field.replace('_', ' ').capitalize()} criteria not satisfied")
+
+
+def normalize_rule(rule):
+    """Validated (field, op, value) with strings lower-cased and lists frozen."""
+    field, op, value = rule["field"], rule["op"], rule["value"]
+    if op not in OPERATORS:
+        raise ValueError(f"Unknown rule operator: {op}")
+
+    if op in ("in", "not_in"):
+        value = frozenset(_norm(v) for v in value)
+    elif op == "between":
+        value = (value[0], value[1])
+    else:
+        value = _norm(value)
+    return field, op, value
+
+
+def rules_for(opportunity):
+    """All rules for an opportunity: legacy fields first, then `rules`."""
+    rules = []
+
+    if opportunity.get("education_level"):
+        rules.append({"field": "education_level", "op": "eq", "value": opportunity["education_level"]})
+
+    eligibility = opportunity.get("eligibility")
+    if isinstance(eligibility, dict):
+        low = eligibility.get("min_age")
+        high = eligibility.get("max_age")
+        if low is not None and high is not None:
+            rules.append({"field": "age", "op": "between", "value": [low, high]})
+        elif low is not None:
+            rules.append({"field": "age", "op": "gte", "value": low})
+        elif high is not None:
+            rules.append({"field": "age", "op": "lte", "value": high})
+
+    rules.extend(opportunity.get("rules") or [])
+    return rules
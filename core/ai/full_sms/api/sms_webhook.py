@@ -1,19 +1,30 @@
+from typing import Optional
+from xml.sax.saxutils import escape
+
 from fastapi import APIRouter, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import PlainTextResponse
-from core.response_generator import handle_sms
+from ai.full_sms.pipeline import get_pipeline
+
 router = APIRouter()
 
 @router.post("/sms/webhook")
 async def sms_webhook(
     Body: str = Form(...),
-    From: str = Form(...)
+    From: str = Form(...),
+    MessageSid: Optional[str] = Form(None)
 ):
-    reply = handle_sms(Body, From)
+    # Carrier retries reuse MessageSid and get the first reply back instead
+    # of advancing the dialog again (dedupe stage). Runs off the event loop
+    # so one slow conversation doesn't hold up the others. The reply goes
+    # back inline as TwiML, so the send stage has nothing to do.
+    ctx = await run_in_threadpool(get_pipeline().process, From, Body, MessageSid)
+    reply = ctx.reply
 
     return PlainTextResponse(
         f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
-    <Message>{reply}</Message>
+    <Message>{escape(reply)}</Message>
 </Response>""",
         media_type="application/xml"
     )
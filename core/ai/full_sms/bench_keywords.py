@@ -0,0 +1,90 @@
+# ai/full_sms/bench_keywords.py
+#
+# Micro-benchmark: compiled keyword matcher vs. the old substring scans.
+# Run from core/:  python -m ai.full_sms.bench_keywords
+
+import random
+import string
+import time
+
+from ai.full_sms.core.keyword_matcher import KeywordMatcher, analyze
+
+MESSAGES = [
+    "mujhe naukri chahiye",
+    "I need an internship in Bhubaneswar, do you have any?",
+    "mu scholarship khojuchi, mo paain kana achhi",
+    "amar ekta govt scheme lagbe",
+    "mala fellowship pahije research grant sathi",
+    "hello",
+    "Is there any yojana for SC students in Odisha who are in class 12 and want to study engineering?",
+    "my music kit is broken",
+]
+
+
+def legacy_detect(message):
+    """The substring scans detect_intent/detect_language used to run."""
+    msg = message.lower()
+    intents = []
+    for intent, words in (
+        ("job", ["job", "naukri", "employment"]),
+        ("internship", ["intern", "internship", "training"]),
+        ("scholarship", ["scholarship", "stipend"]),
+        ("fellowship", ["fellowship", "research grant"]),
+        ("scheme", ["scheme", "yojana", "govt scheme"]),
+    ):
+        if any(word in msg for word in words):
+            intents.append(intent)
+
+    language = "en"
+    for lang, words in (
+        ("hi", ["chahiye", "mujhe", "kya", "kaise", "hai"]),
+        ("or", ["mu", "tume", "khojuchi", "darkar"]),
+        ("mr", ["mala", "pahije", "ahe", "kaay"]),
+        ("bn", ["amar", "chai", "ki", "lagbe"]),
+    ):
+        if any(w in msg for w in words):
+            language = lang
+            break
+    return intents or ["unknown"], language
+
+
+def per_message_us(func, messages, repeat=2000):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for message in messages:
+            func(message)
+    return (time.perf_counter() - start) / (repeat * len(messages)) * 1e6
+
+
+def synthetic_registry(size, labels=20, seed=7):
+    rng = random.Random(seed)
+    registry = {f"label{i}": [] for i in range(labels)}
+    for n in range(size):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+        registry[f"label{n % labels}"].append(word)
+    return registry
+
+
+def main():
+    print("📊 Keyword detection, µs per message")
+    print(f"  legacy substring scans : {per_message_us(legacy_detect, MESSAGES):8.2f}")
+    print(f"  compiled matcher       : {per_message_us(analyze.__wrapped__, MESSAGES):8.2f}")
+    print(f"  compiled matcher (LRU) : {per_message_us(analyze, MESSAGES):8.2f}")
+
+    print("\n📈 Scaling with registry size, µs per message")
+    print(f"  {'keywords':>8}  {'substring':>10}  {'compiled':>10}")
+    for size in (50, 500, 5000):
+        registry = synthetic_registry(size)
+        words = [(label, kws) for label, kws in registry.items()]
+        matcher = KeywordMatcher(registry)
+
+        def naive(message):
+            msg = message.lower()
+            return [label for label, kws in words if any(w in msg for w in kws)]
+
+        print(f"  {size:>8}  {per_message_us(naive, MESSAGES, 200):10.2f}  "
+              f"{per_message_us(matcher.counts, MESSAGES, 200):10.2f}")
+
+
+if __name__ == "__main__":
+    main()
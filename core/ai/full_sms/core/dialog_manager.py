@@ -5,7 +5,7 @@ from ai.full_sms.data.questions import QUESTION_FLOW
 
 def get_next_question(intent: str, profile: dict):
     """
-    Returns (field, question) for the next unanswered field
+    Returns (field, question message id) for the next unanswered field
     """
     if intent not in QUESTION_FLOW:
         return None, None
@@ -0,0 +1,86 @@
+# ai/full_sms/core/idempotency.py
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from persistence import KeyedLock
+
+# ===== CONFIG =====
+SMS_DEDUP_SIZE = int(os.getenv("SMS_DEDUP_SIZE", "10000"))
+SMS_DEDUP_TTL = float(os.getenv("SMS_DEDUP_TTL", "86400"))          # carriers retry for hours at most
+SMS_PHONE_LOCK_STRIPES = int(os.getenv("SMS_PHONE_LOCK_STRIPES", "256"))
+# ==================
+
+
+class ReplyCache:
+    """Bounded message-id -> reply map with expiry (oldest evicted first)."""
+
+    def __init__(self, maxsize: int = SMS_DEDUP_SIZE, ttl: float = SMS_DEDUP_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            reply, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self.hits += 1
+            return reply
+
+    def set(self, key: str, reply: str, ttl: float = None):
+        with self._lock:
+            self._data[key] = (reply, time.monotonic() + (self.ttl if ttl is None else ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+replies = ReplyCache()
+phone_locks = KeyedLock(SMS_PHONE_LOCK_STRIPES)
+
+
+def message_key(message_id: str) -> str:
+    return "id:" + message_id
+
+
+def process_once(message_id: Optional[str], phone: str, body: str, handler) -> str:
+    """
+    Run `handler(body, phone)` once per delivered message.
+
+    A redelivery of a message already handled (same carrier message id)
+    gets the stored reply back without touching the dialog. Without an id
+    a retry can't be told apart from the user sending the same answer
+    again ("no", "no"), so the message is always handled. Messages from
+    one phone run one at a time (so a retry that races the original waits
+    and then hits the cache); different phones run in parallel.
+    """
+    if not message_id:
+        with phone_locks(phone):
+            return handler(body, phone)
+
+    key = message_key(message_id)
+    cached = replies.get(key)
+    if cached is not None:
+        return cached
+
+    with phone_locks(phone):
+        cached = replies.get(key)
+        if cached is not None:
+            return cached
+
+        reply = handler(body, phone)
+        replies.set(key, reply)
+        return reply
@@ -1,24 +1,25 @@
-def detect_intent(message: str) -> list:
-    msg = message.lower()
-    intents = []
+import os
 
-    # Job related
-    if any(word in msg for word in ["job", "naukri", "employment"]):
-        intents.append("job")
+from ai.full_sms.core.keyword_matcher import analyze
+from ai.nlu import predict
 
-    # Internship
-    if any(word in msg for word in ["intern", "internship", "training"]):
-        intents.append("internship")
+# Minimum model probability to accept when no keyword matched
+INTENT_THRESHOLD = float(os.getenv("NLU_INTENT_THRESHOLD", "0.55"))
 
-    # Scholarship / Fellowship
-    if any(word in msg for word in ["scholarship", "stipend"]):
-        intents.append("scholarship")
 
-    if any(word in msg for word in ["fellowship", "research grant"]):
-        intents.append("fellowship")
+def detect_intent(message: str) -> list:
+    """
+    Every intent whose keywords appear in the message (whole words),
+    e.g. ["internship", "scholarship"], or ["unknown"].
 
-    # Government / Financial schemes
-    if any(word in msg for word in ["scheme", "yojana", "govt scheme"]):
-        intents.append("scheme")
+    Keywords live in data/keywords.py. Messages no keyword matches go to
+    the n-gram classifier (ai/nlu), accepted above INTENT_THRESHOLD.
+    """
+    intents = analyze(message).intents
+    if intents != ("unknown",):
+        return list(intents)
 
-    return intents or ["unknown"]
+    guess = predict("intent", message, INTENT_THRESHOLD)
+    if guess and guess[0] != "unknown":
+        return [guess[0]]
+    return ["unknown"]
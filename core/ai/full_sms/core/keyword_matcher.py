@@ -0,0 +1,132 @@
+# ai/full_sms/core/keyword_matcher.py
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from ai.full_sms.data.keywords import INTENT_KEYWORDS, LANGUAGE_KEYWORDS
+
+# Letters, digits and Indic vowel signs (which are not \w) all continue a word
+WORD = "[\\w\u0900-\u0d7f]"
+
+
+def _normalize(phrase: str) -> str:
+    return " ".join(phrase.lower().split())
+
+
+class KeywordMatcher:
+    """
+    Many keywords compiled into one regex, matched in a single pass.
+
+    The keywords are merged into a character trie before compiling, so the
+    regex branches on the next character instead of trying every keyword
+    in turn: adding keywords does not add per-message work. Matches only
+    count on word boundaries ("ki" does not fire inside "kit").
+    """
+
+    def __init__(self, registry: Dict[str, Iterable[str]]):
+        self.labels: Dict[str, List[str]] = {}     # exact keyword -> labels
+        self.prefixes: Dict[str, List[str]] = {}   # "internship*" stored as "internship"
+        self._memo: Dict[str, List[str]] = {}      # matched text -> labels
+        trie: Dict = {}
+
+        for label, keywords in registry.items():
+            for keyword in keywords:
+                is_prefix = keyword.endswith("*")
+                phrase = _normalize(keyword.rstrip("*"))
+                if not phrase:
+                    continue
+                target = self.prefixes if is_prefix else self.labels
+                target.setdefault(phrase, [])
+                if label not in target[phrase]:
+                    target[phrase].append(label)
+
+                node = trie
+                for char in phrase:
+                    node = node.setdefault(char, {})
+                node[""] = node.get("") or ("*" if is_prefix else "=")
+
+        self.pattern = re.compile(f"(?<!{WORD})(?:{self._compile(trie)})(?!{WORD})")
+
+    def _compile(self, node: Dict) -> str:
+        end = node.get("")
+        if end == "*":
+            return f"{WORD}*"   # everything longer is covered by the prefix
+
+        branches = []
+        for char in sorted(k for k in node if k):
+            piece = r"\s+" if char == " " else re.escape(char)
+            branches.append(piece + self._compile(node[char]))
+
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            # Longer keywords first; the bare node is the fallback
+            body = f"(?:{body})?" if len(branches) == 1 else body[:-1] + "|)"
+        return body
+
+    def _labels_for(self, match: str) -> List[str]:
+        labels = self._memo.get(match)
+        if labels is not None:
+            return labels
+
+        phrase = _normalize(match)
+        labels = self.labels.get(phrase)
+        if labels is None:
+            size = next((n for n in range(len(phrase), 0, -1) if phrase[:n] in self.prefixes), 0)
+            labels = self.prefixes[phrase[:size]] if size else []
+        if len(self._memo) < 10000:
+            self._memo[match] = labels
+        return labels
+
+    def scan(self, text: str) -> List[str]:
+        """Label of every keyword occurrence, in order (repeats included)."""
+        labels_for = self._labels_for
+        return [label for m in self.pattern.finditer(text.lower()) for label in labels_for(m.group())]
+
+    def counts(self, text: str) -> Dict[str, int]:
+        counts = {}
+        for label in self.scan(text):
+            counts[label] = counts.get(label, 0) + 1
+        return counts
+
+
+class MessageAnalysis(NamedTuple):
+    intents: Tuple[str, ...]
+    language: str
+    language_scores: Tuple[Tuple[str, int], ...]
+
+
+def _registry():
+    registry = {}
+    for intent, keywords in INTENT_KEYWORDS.items():
+        registry["intent:" + intent] = keywords
+    for language, keywords in LANGUAGE_KEYWORDS.items():
+        registry["lang:" + language] = keywords
+    return registry
+
+
+MATCHER = KeywordMatcher(_registry())
+_INTENT_LABELS = [("intent:" + i, i) for i in INTENT_KEYWORDS]
+_LANGUAGE_LABELS = [("lang:" + lang, lang) for lang in LANGUAGE_KEYWORDS]
+
+
+@lru_cache(maxsize=4096)
+def analyze(message: str) -> MessageAnalysis:
+    """Intents and language of one message from a single scan."""
+    counts = MATCHER.counts(message)
+
+    if not counts:
+        return MessageAnalysis(("unknown",), "en", ())
+
+    intents = tuple(intent for label, intent in _INTENT_LABELS if label in counts)
+    scores = tuple((lang, counts[label]) for label, lang in _LANGUAGE_LABELS if label in counts)
+
+    # Most keyword hits wins; ties go to the earlier language in the registry
+    language = "en"
+    if scores:
+        best = max(score for _, score in scores)
+        language = next(lang for lang, score in scores if score == best)
+
+    return MessageAnalysis(intents or ("unknown",), language, scores)
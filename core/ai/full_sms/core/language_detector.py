@@ -1,22 +1,29 @@
 # ai/full_sms/core/language_detector.py
 
-def detect_language(message: str) -> str:
-    msg = message.lower()
+import os
+
+from ai.full_sms.core.keyword_matcher import analyze
+from ai.nlu import predict
 
-    # Hindi (roman)
-    if any(w in msg for w in ["chahiye", "mujhe", "kya", "kaise", "hai"]):
-        return "hi"
+# Keyword votes must be at least this one-sided to skip the classifier
+RULE_CONFIDENCE = float(os.getenv("NLU_LANGUAGE_RULE_CONFIDENCE", "0.6"))
+# Minimum model probability to override the keyword answer
+LANGUAGE_THRESHOLD = float(os.getenv("NLU_LANGUAGE_THRESHOLD", "0.5"))
 
-    # Odia (roman)
-    if any(w in msg for w in ["mu", "tume", "khojuchi", "darkar"]):
-        return "or"
 
-    # Marathi (roman)
-    if any(w in msg for w in ["mala", "pahije", "ahe", "kaay"]):
-        return "mr"
+def detect_language(message: str) -> str:
+    """
+    Language with the most keyword hits (see data/keywords.py); "en" when
+    nothing matches. Shares one scan with detect_intent.
 
-    # Bengali (roman)
-    if any(w in msg for w in ["amar", "chai", "ki", "lagbe"]):
-        return "bn"
+    When no keyword matched, or the hits are split between languages, the
+    n-gram classifier (ai/nlu) decides if it is confident enough.
+    """
+    analysis = analyze(message)
+    total = sum(score for _, score in analysis.language_scores)
+    best = max((score for _, score in analysis.language_scores), default=0)
+    if total and best / total >= RULE_CONFIDENCE:
+        return analysis.language
 
-    return "en"
+    guess = predict("language", message, LANGUAGE_THRESHOLD)
+    return guess[0] if guess else analysis.language
@@ -0,0 +1,127 @@
+# ai/full_sms/core/segments.py
+
+import os
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple
+
+# ===== CONFIG =====
+SMS_SEGMENT_PRICE = float(os.getenv("SMS_SEGMENT_PRICE", "0"))   # per billed segment, for estimates
+# ==================
+
+# GSM 03.38 default alphabet (one septet each) and its extension table
+# (escape + character, two septets each)
+GSM7_BASIC = frozenset(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+GSM7_EXTENDED = frozenset("^{}\\[~]|€\f")
+
+# characters per segment: (single message, each part of a multipart message)
+LIMITS = {"gsm7": (160, 153), "ucs2": (70, 67)}
+
+
+class SegmentInfo(NamedTuple):
+    encoding: str      # "gsm7" or "ucs2"
+    units: int         # septets (gsm7) or UTF-16 code units (ucs2)
+    segments: int
+    remaining: int     # units left in the last segment
+
+
+def _units(char: str, encoding: str) -> int:
+    if encoding == "gsm7":
+        return 2 if char in GSM7_EXTENDED else 1
+    return 2 if ord(char) > 0xFFFF else 1   # surrogate pair
+
+
+def encoding_of(text: str) -> str:
+    """gsm7 when every character is in the GSM alphabet, otherwise ucs2."""
+    for char in text:
+        if char not in GSM7_BASIC and char not in GSM7_EXTENDED:
+            return "ucs2"
+    return "gsm7"
+
+
+@lru_cache(maxsize=8192)
+def count_segments(text: str) -> SegmentInfo:
+    """How many SMS segments the carrier bills for `text`."""
+    encoding = encoding_of(text)
+    single, part = LIMITS[encoding]
+    units = sum(_units(char, encoding) for char in text)
+
+    if units <= single:
+        return SegmentInfo(encoding, units, 1 if units else 0, single - units)
+
+    # Parts are cut by the phone/carrier without splitting an escape
+    # sequence or surrogate pair, so count them the same way
+    segments, used = 1, 0
+    for char in text:
+        size = _units(char, encoding)
+        if used + size > part:
+            segments += 1
+            used = 0
+        used += size
+    return SegmentInfo(encoding, units, segments, part - used)
+
+
+def split_parts(text: str) -> List[str]:
+    """
+    `text` cut into the parts a multipart SMS is sent as, breaking at
+    spaces where possible so words and links are not split across parts.
+    """
+    info = count_segments(text)
+    if info.segments <= 1:
+        return [text] if text else []
+
+    limit = LIMITS[info.encoding][1]
+    parts, current, used = [], [], 0
+    for word in text.split(" "):
+        piece = word if not current else " " + word
+        size = sum(_units(char, info.encoding) for char in piece)
+        if current and used + size > limit:
+            parts.append("".join(current))
+            piece = word
+            size = sum(_units(char, info.encoding) for char in piece)
+            current, used = [], 0
+        while size > limit:   # a single word longer than a part
+            cut, taken = 0, 0
+            for char in piece:
+                step = _units(char, info.encoding)
+                if taken + step > limit - used:
+                    break
+                taken += step
+                cut += 1
+            current.append(piece[:cut])
+            parts.append("".join(current))
+            piece = piece[cut:]
+            size -= taken
+            current, used = [], 0
+        current.append(piece)
+        used += size
+    if current:
+        parts.append("".join(current))
+    return parts
+
+
+def segment_cost(texts: Iterable[str]) -> Dict:
+    """
+    Billed segments for a batch of messages (e.g. a digest campaign),
+    before anything is sent. Identical texts are measured once.
+    """
+    counts = Counter(texts)
+    total = 0
+    by_encoding: Dict[str, Dict[str, int]] = {}
+    for text, n in counts.items():
+        info = count_segments(text)
+        total += info.segments * n
+        bucket = by_encoding.setdefault(info.encoding, {"messages": 0, "segments": 0})
+        bucket["messages"] += n
+        bucket["segments"] += info.segments * n
+
+    return {
+        "messages": sum(counts.values()),
+        "unique_texts": len(counts),
+        "segments": total,
+        "by_encoding": by_encoding,
+        "estimated_cost": round(total * SMS_SEGMENT_PRICE, 4),
+    }
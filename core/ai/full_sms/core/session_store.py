@@ -0,0 +1,370 @@
+# ai/full_sms/core/session_store.py
+
+import atexit
+import json
+import os
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+from persistence import FileLock, atomic_write_json, atomic_write_text
+
+# Absolute, so the backend (run from core/backend) shares the same sessions
+STATE_FILE = os.getenv(
+    "SMS_STATE_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "user_sessions.json")
+)
+
+# ================== SESSION CONFIG ==================
+SESSION_SHARDS = int(os.getenv("SESSION_SHARDS", "64"))
+SESSION_TTL = float(os.getenv("SESSION_TTL", str(7 * 24 * 3600)))       # max session age
+SESSION_IDLE_TIMEOUT = float(os.getenv("SESSION_IDLE_TIMEOUT", str(24 * 3600)))
+SESSION_FLUSH_INTERVAL = float(os.getenv("SESSION_FLUSH_INTERVAL", "1.0"))
+SESSION_COMPACT_EVERY = int(os.getenv("SESSION_COMPACT_EVERY", "10000"))
+# =====================================================
+
+
+class _Shard:
+    __slots__ = ("sessions", "dirty", "lock")
+
+    def __init__(self):
+        self.sessions: Dict[str, Dict] = {}
+        self.dirty = set()
+        self.lock = threading.RLock()
+
+
+class SessionStore:
+    """
+    In-memory SMS dialog sessions, sharded by phone number.
+
+    Every call touches one shard only, so the cost per message does not
+    depend on how many phones are active. Changes are written behind by a
+    background thread: dirty sessions are appended to a journal next to
+    STATE_FILE, and the journal is folded back into STATE_FILE (same
+    format as before) every SESSION_COMPACT_EVERY records.
+
+    Sessions older than `ttl`, or untouched for `idle_timeout`, are dropped.
+
+    Several processes can share one STATE_FILE (the backend's /sms-webhook
+    and the SMS apps do). Appends and compaction happen under a cross-process
+    lock, each process tails the journal (one stat() per lookup) to pick up
+    the others' changes, and a compaction starts a new journal file that the
+    others notice and reload from. The last write to a phone wins.
+    """
+
+    def __init__(
+        self,
+        path: str = STATE_FILE,
+        shards: int = SESSION_SHARDS,
+        ttl: float = SESSION_TTL,
+        idle_timeout: float = SESSION_IDLE_TIMEOUT,
+        flush_interval: float = SESSION_FLUSH_INTERVAL,
+        compact_every: int = SESSION_COMPACT_EVERY
+    ):
+        self.path = path
+        self.journal_path = os.path.splitext(path)[0] + ".journal"
+        self.ttl = ttl
+        self.idle_timeout = idle_timeout
+        self.flush_interval = flush_interval
+        self.compact_every = compact_every
+
+        self._shards: List[_Shard] = [_Shard() for _ in range(shards)]
+        self._file_lock = FileLock(path)
+        self._tail_lock = threading.Lock()
+        self._journal_records = 0
+        self._journal_offset = 0
+        self._journal_inode = None
+        self.evicted = 0
+
+        with self._file_lock, self._tail_lock:
+            self._reload()
+
+        self._stop = threading.Event()
+        self._thread = None
+        if flush_interval > 0:
+            self._thread = threading.Thread(target=self._run, name="session-flush", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    # ---------- helpers ----------
+
+    def _shard(self, phone: str) -> _Shard:
+        return self._shards[zlib.crc32(phone.encode("utf-8")) % len(self._shards)]
+
+    def _expired(self, session: Dict, now: float) -> bool:
+        return (
+            now - session.get("created_at", now) > self.ttl
+            or now - session.get("updated_at", now) > self.idle_timeout
+        )
+
+    def _touch(self, shard: _Shard, phone: str, session: Dict):
+        session["updated_at"] = time.time()
+        shard.dirty.add(phone)
+
+    # ---------- API ----------
+
+    def get(self, phone: str) -> Dict:
+        """Live session dict for `phone`, or {} if none / expired."""
+        self._catch_up()
+        shard = self._shard(phone)
+        with shard.lock:
+            session = shard.sessions.get(phone)
+            if session is None:
+                return {}
+            if self._expired(session, time.time()):
+                del shard.sessions[phone]
+                shard.dirty.add(phone)
+                self.evicted += 1
+                return {}
+            return session
+
+    def create(self, phone: str, intent: str, language: str = "en") -> Dict:
+        now = time.time()
+        session = {
+            "intent": intent,
+            "language": language,
+            "profile": {},
+            "step": "start",
+            "completed": False,
+            "created_at": now,
+            "updated_at": now
+        }
+        shard = self._shard(phone)
+        with shard.lock:
+            shard.sessions[phone] = session
+            shard.dirty.add(phone)
+        return session
+
+    def update(self, phone: str, key: str, value):
+        shard = self._shard(phone)
+        with shard.lock:
+            session = shard.sessions.get(phone)
+            if session is None:
+                return
+            session[key] = value
+            self._touch(shard, phone, session)
+
+    def update_profile(self, phone: str, field: str, value):
+        shard = self._shard(phone)
+        with shard.lock:
+            session = shard.sessions.get(phone)
+            if session is None:
+                return
+            session["profile"][field] = value
+            self._touch(shard, phone, session)
+
+    def set_step(self, phone: str, step: str):
+        self.update(phone, "step", step)
+
+    def complete(self, phone: str):
+        self.update(phone, "completed", True)
+
+    def reset(self, phone: str):
+        shard = self._shard(phone)
+        with shard.lock:
+            if shard.sessions.pop(phone, None) is not None:
+                shard.dirty.add(phone)
+
+    def __len__(self):
+        return sum(len(s.sessions) for s in self._shards)
+
+    def iter_sessions(self):
+        """Yield (phone, session) one shard at a time."""
+        for shard in self._shards:
+            with shard.lock:
+                items = list(shard.sessions.items())
+            yield from items
+
+    # ---------- eviction ----------
+
+    def evict_expired(self) -> int:
+        now = time.time()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                stale = [p for p, s in shard.sessions.items() if self._expired(s, now)]
+                for phone in stale:
+                    del shard.sessions[phone]
+                    shard.dirty.add(phone)
+                removed += len(stale)
+        self.evicted += removed
+        return removed
+
+    # ---------- persistence ----------
+
+    def _reload(self):
+        """
+        Rebuild memory from STATE_FILE + journal, keeping changes not yet
+        flushed. Caller holds the file lock.
+        """
+        data = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        if not os.path.exists(self.journal_path):
+            atomic_write_text(self.journal_path, "")
+        with open(self.journal_path, "rb") as f:
+            chunk = f.read()
+        end = chunk.rfind(b"\n") + 1
+        if end < len(chunk):
+            self._drop_torn_tail(end)
+        self._journal_records = 0
+        for phone, session in self._parse_journal(chunk[:end]):
+            if session is None:
+                data.pop(phone, None)
+            else:
+                data[phone] = session
+        self._journal_offset = end
+        self._journal_inode = os.stat(self.journal_path).st_ino
+
+        now = time.time()
+        by_shard = [{} for _ in self._shards]
+        for phone, session in data.items():
+            # Sessions saved before TTLs existed start their clock now
+            session.setdefault("created_at", now)
+            session.setdefault("updated_at", now)
+            by_shard[zlib.crc32(phone.encode("utf-8")) % len(self._shards)][phone] = session
+
+        for shard, sessions in zip(self._shards, by_shard):
+            with shard.lock:
+                for phone in shard.dirty:
+                    if phone in shard.sessions:
+                        sessions[phone] = shard.sessions[phone]
+                    else:
+                        sessions.pop(phone, None)
+                shard.sessions = sessions
+
+    def _drop_torn_tail(self, end: int):
+        # Only called with the file lock held, when nobody is mid-append:
+        # the partial line was torn by a crash, and the next append would
+        # otherwise be glued onto it and lost with it
+        print("⚠️ Dropping torn session journal record")
+        with open(self.journal_path, "r+b") as f:
+            f.truncate(end)
+
+    def _parse_journal(self, chunk: bytes) -> List:
+        """(phone, session or None) records from complete journal lines."""
+        records = []
+        for line in chunk.splitlines():
+            try:
+                phone, session = json.loads(line)
+            except ValueError:
+                continue
+            records.append((phone, session))
+        self._journal_records += len(records)
+        return records
+
+    def _catch_up(self):
+        """Apply journal records other processes appended since our last look."""
+        try:
+            st = os.stat(self.journal_path)
+        except FileNotFoundError:
+            st = None
+        if st and st.st_ino == self._journal_inode and st.st_size == self._journal_offset:
+            return
+
+        if st is None or st.st_ino != self._journal_inode or st.st_size < self._journal_offset:
+            # Another process compacted: start over from its snapshot
+            with self._file_lock, self._tail_lock:
+                self._reload()
+            return
+
+        with self._tail_lock:
+            with open(self.journal_path, "rb") as f:
+                f.seek(self._journal_offset)
+                chunk = f.read()
+            # A partial last line is another process mid-append
+            end = chunk.rfind(b"\n") + 1
+            for phone, session in self._parse_journal(chunk[:end]):
+                shard = self._shard(phone)
+                with shard.lock:
+                    if phone in shard.dirty:
+                        continue    # our own, newer change is about to be written
+                    if session is None:
+                        shard.sessions.pop(phone, None)
+                    else:
+                        shard.sessions[phone] = session
+            self._journal_offset += end
+
+    def flush(self):
+        """Append every dirty session to the journal (one write + fsync)."""
+        with self._file_lock:
+            self._catch_up()
+            if os.path.getsize(self.journal_path) > self._journal_offset:
+                self._drop_torn_tail(self._journal_offset)
+
+            lines = []
+            for shard in self._shards:
+                with shard.lock:
+                    if not shard.dirty:
+                        continue
+                    for phone in shard.dirty:
+                        lines.append(json.dumps([phone, shard.sessions.get(phone)], ensure_ascii=False))
+                    shard.dirty.clear()
+
+            if not lines:
+                return
+
+            # Under the tail lock, so our own lines are never read back as news
+            with self._tail_lock:
+                with open(self.journal_path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._journal_offset = os.path.getsize(self.journal_path)
+                self._journal_records += len(lines)
+            if self._journal_records >= self.compact_every:
+                self.compact()
+
+    def compact(self):
+        """
+        Rewrite STATE_FILE from memory (caught up with every process's
+        journal first) and start a new, empty journal.
+        """
+        with self._file_lock:
+            self._catch_up()
+            with self._tail_lock:
+                snapshot = {}
+                for phone, session in self.iter_sessions():
+                    snapshot[phone] = session
+                atomic_write_json(self.path, snapshot, indent=2)
+                # New inode tells other processes to reload
+                atomic_write_text(self.journal_path, "")
+                self._journal_inode = os.stat(self.journal_path).st_ino
+                self._journal_offset = 0
+                self._journal_records = 0
+
+    def _run(self):
+        last_sweep = time.time()
+        while not self._stop.wait(self.flush_interval):
+            try:
+                if time.time() - last_sweep > 60:
+                    self.evict_expired()
+                    last_sweep = time.time()
+                self.flush()
+            except Exception as e:
+                print("❌ Session flush failed:", e)
+
+    def close(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.flush()
+
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """Process-wide store, created on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SessionStore()
+    return _store
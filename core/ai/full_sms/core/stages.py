@@ -0,0 +1,114 @@
+# ai/full_sms/core/stages.py
+#
+# Default stage implementations for ai.full_sms.pipeline. Each takes the
+# SmsContext and fills in its part; heavier modules are imported inside
+# the stage so loading this file costs nothing.
+
+def _session(ctx):
+    """The caller's dialog session (None for a new phone), looked up once."""
+    if not ctx.session_loaded:
+        from ai.full_sms.core.session_store import get_session_store
+        ctx.session = get_session_store().get(ctx.phone)
+        ctx.session_loaded = True
+    return ctx.session
+
+
+def dedupe(ctx):
+    """
+    Carrier redeliveries (same message id) get the first reply back and
+    stop here. Holds the phone's lock for the rest of the run, so a retry
+    racing the original waits for it and then hits the cache. Messages
+    without an id are never deduplicated: a retry looks exactly like the
+    user sending the same answer twice.
+    """
+    from ai.full_sms.core.idempotency import message_key, phone_locks, replies
+
+    if not ctx.message_id:
+        ctx.resources.enter_context(phone_locks(ctx.phone))
+        return
+
+    key = message_key(ctx.message_id)
+    cached = replies.get(key)
+    if cached is None:
+        ctx.resources.enter_context(phone_locks(ctx.phone))
+        cached = replies.get(key)
+    if cached is not None:
+        ctx.reply = cached
+        ctx.duplicate = True
+        ctx.done = True
+        return
+
+    ctx.on_success.append(lambda: replies.set(key, ctx.reply))
+
+
+def language(ctx):
+    session = _session(ctx)
+    if session:
+        ctx.language = session.get("language", "en")
+        return
+    from ai.full_sms.core.language_detector import detect_language
+    ctx.language = detect_language(ctx.body)
+
+
+def intent(ctx):
+    session = _session(ctx)
+    if session:
+        ctx.intent = session["intent"]
+        return
+    from ai.full_sms.core.intent_detector import detect_intent
+    ctx.intent = detect_intent(ctx.body)[0]
+
+
+def dialog(ctx):
+    """Record the answer and pick the next question, or the final reply."""
+    from ai.full_sms.core.dialog_manager import get_next_question
+    from ai.full_sms.core.session_store import get_session_store
+    from ai.full_sms.data.knowledge_base import KNOWLEDGE_BASE
+
+    sessions = get_session_store()
+    state = _session(ctx)
+    if not state:
+        state = ctx.session = sessions.create(ctx.phone, ctx.intent, ctx.language)
+    elif state["step"] != "start" and not state["completed"]:
+        sessions.update_profile(ctx.phone, state["step"], ctx.body.lower())
+
+    field, question = get_next_question(ctx.intent, state["profile"])
+    if question:
+        sessions.set_step(ctx.phone, field)
+        ctx.message = question
+        return
+
+    sessions.complete(ctx.phone)
+    if ctx.intent not in KNOWLEDGE_BASE:
+        ctx.message = "error.not_understood"
+        return
+
+    data = KNOWLEDGE_BASE[ctx.intent]["general"]
+    ctx.message = data["message"]
+    ctx.links = tuple(data["links"])
+
+
+def render(ctx):
+    from ai.full_sms.services.translation_service import render as render_message
+
+    text = render_message(ctx.message, ctx.language, **ctx.params)
+    if ctx.links:
+        text = render_message("reply.with_links", ctx.language, text=text, links=", ".join(ctx.links))
+    ctx.reply = text
+
+
+def summarize(ctx):
+    from ai.full_sms.core.summarizer import compose_reply, summarize_if_needed
+
+    if ctx.links and not ctx.params:
+        ctx.reply = compose_reply(ctx.message, ctx.language, ctx.links)
+    else:
+        ctx.reply = summarize_if_needed(ctx.reply)
+
+
+def send(ctx):
+    """Queue the reply as an outbound SMS (JSON webhooks; TwiML replies inline)."""
+    if not ctx.deliver or not ctx.reply:
+        return
+    from ai.full_sms.services.sms_service import send_sms
+    ctx.sms_id = send_sms(ctx.phone, ctx.reply)
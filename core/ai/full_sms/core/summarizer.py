@@ -1,15 +1,156 @@
-MAX_SMS_CHARS = 160
+# ai/full_sms/core/summarizer.py
 
+import os
+import re
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+from ai.full_sms.core.segments import count_segments
+from ai.full_sms.data.link_aliases import LINK_ALIASES
+from ai.full_sms.services.translation_service import CATALOG, render
+
+# ===== CONFIG =====
+SMS_TARGET_SEGMENTS = int(os.getenv("SMS_TARGET_SEGMENTS", "1"))
+SMS_COMPOSE_CACHE_SIZE = int(os.getenv("SMS_COMPOSE_CACHE_SIZE", "1024"))
+# ==================
+
+# Look-alikes that would switch a whole message from GSM-7 (160 chars)
+# to UCS-2 (70 chars)
+GSM_SAFE = str.maketrans({
+    "‘": "'", "’": "'", "“": '"', "”": '"',
+    "–": "-", "—": "-", "…": "...", "\u00a0": " ", "₹": "Rs.",
+})
+
+URL_RE = re.compile(r"(?:https?://|www\.)[^\s,;]+|\b[\w-]+(?:\.[\w-]+)*\.(?:in|com|org|gov|net|io)\b[^\s,;]*")
+CLAUSE_RE = re.compile(r"(?<=[.!?।,;])\s+")
+
+
+def gsm_safe(text: str) -> str:
+    return text.translate(GSM_SAFE)
+
+
+def alias_link(url: str) -> str:
+    """Shortest known form of a link: configured alias, or without scheme and www."""
+    bare = re.sub(r"^https?://", "", url)
+    bare = re.sub(r"^www\.", "", bare).rstrip("/")
+    forms = [url, bare]
+    if url in LINK_ALIASES:
+        forms.append(LINK_ALIASES[url])
+    return min(forms, key=len)
+
+
+def _fits(text: str) -> bool:
+    return count_segments(text).segments <= SMS_TARGET_SEGMENTS
+
+
+def _pick(candidates: Iterator[str]) -> str:
+    """First candidate within the segment budget, else the cheapest one seen."""
+    best = None
+    for text in candidates:
+        text = gsm_safe(text)
+        if _fits(text):
+            return text
+        if best is None or count_segments(text).segments < count_segments(best).segments:
+            best = text
+    return best
+
+
+def _truncate(text: str, budget_text: str) -> str:
+    """
+    Cut `text` at a word boundary so `text + budget_text` fits the budget.
+
+    Dropping words never adds segments, so the longest prefix that fits
+    is found by binary search over the word count.
+    """
+    words = text.split(" ")
+
+    def candidate(n: int) -> str:
+        return " ".join(words[:n]).rstrip(",;:") + "..."
+
+    lo, hi = 0, len(words) - 1          # longest fitting prefix has lo..hi words (0 = none)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _fits(candidate(mid) + budget_text):
+            lo = mid
+        else:
+            hi = mid - 1
+    return candidate(lo) if lo else ""
+
+
+def _reply_candidates(message_id: str, lang: str, links: Tuple[str, ...]) -> Iterator[str]:
+    text = render(message_id, lang)
+    aliased = tuple(alias_link(link) for link in links)
+
+    def with_links(body: str, urls: Tuple[str, ...], template: str = "reply.with_links") -> str:
+        if not urls:
+            return body
+        return render(template, lang, text=body, links=", ".join(urls))
+
+    yield with_links(text, links)
+    yield with_links(text, aliased)
+
+    # Later clauses are the least important
+    clauses = CLAUSE_RE.split(text)
+    for n in range(len(clauses) - 1, 0, -1):
+        yield with_links(" ".join(clauses[:n]), aliased)
+
+    short_id = message_id + ".short"
+    if CATALOG.has(short_id, lang):
+        short = render(short_id, lang)
+        yield with_links(short, aliased, "reply.short")
+        for n in range(len(aliased) - 1, 0, -1):
+            yield with_links(short, aliased[:n], "reply.short")
+
+    for n in range(len(aliased) - 1, 0, -1):
+        yield with_links(text, aliased[:n])
+
+    # Last resort: shorten the text itself, links stay whole
+    urls = aliased[:1]
+    tail = with_links("", urls)
+    yield with_links(_truncate(text, tail), urls)
+
+
+@lru_cache(maxsize=SMS_COMPOSE_CACHE_SIZE)
+def compose_reply(message_id: str, lang: str, links: Tuple[str, ...] = ()) -> str:
+    """
+    Reply for `message_id` in `lang` followed by `links`, compressed to
+    SMS_TARGET_SEGMENTS billed segments where possible.
+
+    Lossless steps come first (GSM-safe punctuation, link aliases), then
+    dropping trailing clauses, the catalog's `.short` variant, extra links
+    and finally cutting the text at a word boundary. Links are never cut.
+    Memoized per (message id, language, links).
+    """
+    return _pick(_reply_candidates(message_id, lang, tuple(links)))
+
+
+def _split_links(text: str) -> Tuple[str, List[str]]:
+    links = URL_RE.findall(text)
+    body = URL_RE.sub("", text)
+    body = re.sub(r"\s*(?:Links|दुवे):\s*[,\s]*$", "", body.strip(" ,"))
+    return body.strip(), links
+
+
+@lru_cache(maxsize=SMS_COMPOSE_CACHE_SIZE)
 def summarize_if_needed(text: str) -> str:
-    if len(text) <= MAX_SMS_CHARS:
+    """
+    Free-form text trimmed to SMS_TARGET_SEGMENTS segments (counted as
+    GSM-7 or UCS-2, not Python characters) without cutting links.
+    """
+    text = gsm_safe(text)
+    if _fits(text):
         return text
 
-    # split links
-    parts = text.split("Links:")
-    main_text = parts[0].strip()
-    links = "Links:" + parts[1] if len(parts) > 1 else ""
+    body, links = _split_links(text)
+    aliased = [alias_link(link) for link in links]
+    tail = (" Links: " + ", ".join(aliased)) if aliased else ""
+    if _fits(body + tail):
+        return body + tail
 
-    allowed_main_len = MAX_SMS_CHARS - len(links) - 3
-    short_main = main_text[:allowed_main_len]
+    for n in range(len(aliased) - 1, 0, -1):
+        shorter = " Links: " + ", ".join(aliased[:n])
+        if _fits(body + shorter):
+            return body + shorter
 
-    return short_main + "... " + links
\ No newline at end of file
+    tail = (" Links: " + aliased[0]) if aliased else ""
+    return (_truncate(body, tail) + tail).strip()
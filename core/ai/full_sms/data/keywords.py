@@ -0,0 +1,50 @@
+# ai/full_sms/data/keywords.py
+
+# Keyword registry for intent and language detection.
+# Entries match whole words; a trailing "*" also matches longer words
+# ("internship*" -> internship, internships). Multi-word phrases match
+# with any whitespace between the words.
+
+INTENT_KEYWORDS = {
+    # 🔹 JOB
+    "job": [
+        "job*", "naukri", "naukari", "employment", "rozgar", "rojgar", "vacancy", "vacancies",
+        "hiring", "recruitment", "kaam", "chakri", "chakiri", "nokri",
+        "नौकरी", "रोजगार", "ଚାକିରି", "ନିଯୁକ୍ତି",
+    ],
+
+    # 🔹 INTERNSHIP
+    "internship": ["intern", "interns", "internship*", "training", "apprentice*", "trainee"],
+
+    # 🔹 SCHOLARSHIP
+    "scholarship": [
+        "scholarship*", "stipend*", "chhatravritti", "chatravriti", "vritti", "vruti", "britti",
+        "shishyavrutti", "छात्रवृत्ति", "ଛାତ୍ରବୃତ୍ତି", "ବୃତ୍ତି",
+    ],
+
+    # 🔹 FELLOWSHIP
+    "fellowship": ["fellowship*", "research grant*"],
+
+    # 🔹 GOVT SCHEME
+    "scheme": ["scheme*", "yojana", "yojna", "govt scheme", "sarkari yojana", "subsidy", "pension",
+               "योजना", "ଯୋଜନା"],
+}
+
+# Words typical of each language (romanized and native script).
+# Ties between languages are broken in this order.
+LANGUAGE_KEYWORDS = {
+    "hi": ["chahiye", "mujhe", "kya", "kaise", "hai", "hain", "mera", "meri", "kripya", "batao",
+           "चाहिए", "मुझे", "क्या", "कैसे", "है"],
+    "or": ["mu", "tume", "khojuchi", "darkar", "mote", "kana", "achhi", "heba",
+           "ମୁଁ", "ମୋତେ", "ଦରକାର", "କଣ"],
+    "mr": ["mala", "pahije", "ahe", "kaay", "kasa", "majha", "mazha", "sanga",
+           "मला", "पाहिजे", "आहे"],
+    "bn": ["amar", "chai", "ki", "lagbe", "ami", "kothay", "bolo",
+           "আমার", "চাই", "লাগবে"],
+    "ta": ["enakku", "venum", "vendum", "enna", "eppadi", "naan", "எனக்கு", "வேண்டும்"],
+    "te": ["naaku", "kavali", "emiti", "ela", "nenu", "నాకు", "కావాలి"],
+    "gu": ["mane", "joiye", "joie", "shu", "kem", "મને", "જોઈએ"],
+    "kn": ["nanage", "beku", "yenu", "hege", "ನನಗೆ", "ಬೇಕು"],
+    "ml": ["enikku", "venam", "entha", "engane", "എനിക്ക്", "വേണം"],
+    "pa": ["mainu", "chahida", "kiven", "ਮੈਨੂੰ", "ਚਾਹੀਦਾ"],
+}
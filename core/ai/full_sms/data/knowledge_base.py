@@ -1,19 +1,23 @@
+# ai/full_sms/data/knowledge_base.py
+
+# Reply message ids (see ai/full_sms/locales) and the links sent with them
+
 KNOWLEDGE_BASE = {
     "job": {
         "general": {
-            "text": "Here are some job opportunities.",
+            "message": "results.job",
             "links": ["https://example.com/jobs"]
         }
     },
     "internship": {
         "general": {
-            "text": "Here are some internship opportunities.",
+            "message": "results.internship",
             "links": ["https://example.com/internships"]
         }
     },
     "scholarship": {
         "general": {
-            "text": "Here are some scholarship opportunities for students.",
+            "message": "results.scholarship",
             "links": [
                 "https://scholarships.gov.in",
                 "https://www.buddy4study.com"
@@ -22,7 +26,7 @@ KNOWLEDGE_BASE = {
     },
     "fellowship": {
         "general": {
-            "text": "Here are some fellowship and research grant opportunities.",
+            "message": "results.fellowship",
             "links": [
                 "https://www.ugc.ac.in",
                 "https://www.dst.gov.in"
@@ -31,7 +35,7 @@ KNOWLEDGE_BASE = {
     },
     "scheme": {
         "general": {
-            "text": "Here are some government schemes you may be eligible for.",
+            "message": "results.scheme",
             "links": ["https://www.myscheme.gov.in"]
         }
     }
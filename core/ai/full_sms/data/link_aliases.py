@@ -0,0 +1,10 @@
+# ai/full_sms/data/link_aliases.py
+
+# Short forms for links sent by SMS (e.g. shortener URLs created once for
+# long portal links). The summarizer picks the shortest of the original
+# link, the link without "https://www." and the alias listed here.
+LINK_ALIASES = {
+    "https://scholarships.gov.in": "scholarships.gov.in",
+    "https://www.buddy4study.com": "buddy4study.com",
+    "https://www.myscheme.gov.in": "myscheme.gov.in",
+}
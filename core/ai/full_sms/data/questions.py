@@ -1,50 +1,52 @@
 # ai/full_sms/data/questions.py
 
+# (profile field, message id); the texts live in ai/full_sms/locales/<lang>.json
+
 QUESTION_FLOW = {
 
     # 🔹 JOB / INTERNSHIP
     "job": [
-        ("age", "What is your age?"),
-        ("education", "What is your education or experience?"),
-        ("location", "Which city/state are you from?"),
-        ("work_mode", "Do you prefer WFH or WFO?")
+        ("age", "ask.age"),
+        ("education", "ask.education_experience"),
+        ("location", "ask.city_state"),
+        ("work_mode", "ask.work_mode")
     ],
 
     "internship": [
-        ("education", "Which degree or class are you studying in?"),
-        ("field", "Which field are you interested in?"),
-        ("location", "Which city/state are you from?"),
-        ("work_mode", "Do you prefer WFH or WFO?")
+        ("education", "ask.degree_or_class"),
+        ("field", "ask.field_interest"),
+        ("location", "ask.city_state"),
+        ("work_mode", "ask.work_mode")
     ],
 
     # 🔹 SCHOLARSHIP
     "scholarship": [
-        ("education", "Which class or degree are you studying in?"),
-        ("category", "Your category? (General / OBC / SC / ST)"),
-        ("gender", "Your gender?"),
-        ("location", "Which state are you from?")
+        ("education", "ask.class_or_degree"),
+        ("category", "ask.category"),
+        ("gender", "ask.gender"),
+        ("location", "ask.state")
     ],
 
     # 🔹 FELLOWSHIP
     "fellowship": [
-        ("education", "Your highest qualification?"),
-        ("field", "Which field or subject?"),
-        ("gender", "Your gender?"),
-        ("location", "Which state are you from?")
+        ("education", "ask.highest_qualification"),
+        ("field", "ask.field_or_subject"),
+        ("gender", "ask.gender"),
+        ("location", "ask.state")
     ],
 
     # 🔹 EDUCATION (subject / exam help)
     "education": [
-        ("class", "Which class or semester?"),
-        ("subject", "Which subject do you need help with?")
+        ("class", "ask.class_or_semester"),
+        ("subject", "ask.subject_help")
     ],
 
     # 🔹 GOVERNMENT / FINANCIAL SCHEMES
     "scheme": [
-        ("age", "What is your age?"),
-        ("gender", "Your gender?"),
-        ("category", "Your category? (General / OBC / SC / ST)"),
-        ("income", "Approx annual family income?"),
-        ("location", "Which state are you from?")
+        ("age", "ask.age"),
+        ("gender", "ask.gender"),
+        ("category", "ask.category"),
+        ("income", "ask.income"),
+        ("location", "ask.state")
     ]
 }
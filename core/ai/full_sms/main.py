@@ -1,10 +1,27 @@
 from fastapi import FastAPI
-from api.sms_webhook import router as sms_router
+from ai.full_sms.api.sms_webhook import router as sms_router
+from ai.full_sms.pipeline import get_pipeline
+from telemetry import instrument
 
+# Run from core/:  uvicorn ai.full_sms.main:app --port 8001
 app = FastAPI(title="AI Platform")
 
+instrument(app, "full_sms")
+
 app.include_router(sms_router)
 
+
+@app.on_event("startup")
+async def warm_sms_pipeline():
+    # Serve immediately; stages and models load in the background
+    get_pipeline().warm()
+
+
+@app.get("/sms/stats")
+async def sms_stats():
+    return get_pipeline().stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
@@ -0,0 +1,176 @@
+# ai/full_sms/pipeline.py
+
+import importlib
+import os
+import threading
+import time
+from contextlib import ExitStack
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from telemetry import record
+
+# ===== CONFIG =====
+# Any stage can be replaced with SMS_STAGE_<NAME>="package.module:function"
+STAGES = ("dedupe", "language", "intent", "dialog", "render", "summarize", "send")
+DEFAULT_STAGES = {name: f"ai.full_sms.core.stages:{name}" for name in STAGES}
+
+# What the default stages import on first use; warm() loads them up front
+WARM_MODULES = (
+    "ai.full_sms.core.idempotency",
+    "ai.full_sms.core.session_store",
+    "ai.full_sms.core.language_detector",
+    "ai.full_sms.core.intent_detector",
+    "ai.full_sms.core.dialog_manager",
+    "ai.full_sms.services.translation_service",
+    "ai.full_sms.core.summarizer",
+    "ai.full_sms.services.sms_service",
+)
+# ==================
+
+StageRef = Union[str, Callable]
+
+
+class SmsContext:
+    """Everything one inbound SMS accumulates on its way through the stages."""
+
+    def __init__(self, phone: str, body: str, message_id: Optional[str] = None, deliver: bool = False):
+        self.phone = phone
+        self.body = body
+        self.message_id = message_id
+        self.deliver = deliver          # also queue the reply as an outbound SMS
+
+        self.session = None
+        self.session_loaded = False
+        self.language = "en"
+        self.intent = "unknown"
+        self.message = None             # message id to render
+        self.params: Dict = {}
+        self.links = ()
+        self.reply = ""
+        self.sms_id = None
+        self.duplicate = False
+        self.done = False               # set by a stage to skip the rest
+
+        self.timings: Dict[str, float] = {}   # stage -> ms
+        self.resources = ExitStack()          # released after the last stage
+        self.on_success = []                  # callbacks once a reply exists
+
+
+def _resolve(ref: StageRef) -> Callable:
+    if callable(ref):
+        return ref
+    module, _, name = ref.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+class SmsPipeline:
+    """
+    One path for every inbound SMS:
+
+        dedupe -> language -> intent -> dialog -> render -> summarize -> send
+
+    Stages are plain functions of an SmsContext, named by import path and
+    imported on first use, so starting a worker loads none of them. Any
+    stage can be swapped (constructor argument or SMS_STAGE_<NAME>), and
+    every run is timed per stage.
+    """
+
+    def __init__(self, stages: Dict[str, StageRef] = None):
+        refs = dict(DEFAULT_STAGES)
+        for name in STAGES:
+            override = os.getenv(f"SMS_STAGE_{name.upper()}")
+            if override:
+                refs[name] = override
+        refs.update(stages or {})
+
+        unknown = set(refs) - set(STAGES)
+        if unknown:
+            raise ValueError(f"Unknown SMS stages: {sorted(unknown)}")
+
+        self._refs = refs
+        self._stages: Dict[str, Callable] = {}
+        self._lock = threading.Lock()
+        self.stats_by_stage = {name: {"calls": 0, "total_ms": 0.0, "max_ms": 0.0} for name in STAGES}
+
+    def stage(self, name: str) -> Callable:
+        fn = self._stages.get(name)
+        if fn is None:
+            fn = self._stages[name] = _resolve(self._refs[name])
+        return fn
+
+    def replace(self, name: str, ref: StageRef):
+        if name not in STAGES:
+            raise ValueError(f"Unknown SMS stage: {name}")
+        self._refs[name] = ref
+        self._stages.pop(name, None)
+
+    def _record(self, name: str, ms: float):
+        with self._lock:
+            stats = self.stats_by_stage[name]
+            stats["calls"] += 1
+            stats["total_ms"] += ms
+            if ms > stats["max_ms"]:
+                stats["max_ms"] = ms
+
+    def run(self, ctx: SmsContext, skip: Iterable[str] = ()) -> SmsContext:
+        skip = set(skip)
+        clock = time.perf_counter
+        with ctx.resources:
+            for name in STAGES:
+                if ctx.done:
+                    break
+                if name in skip:
+                    continue
+                start = clock()
+                self.stage(name)(ctx)
+                seconds = clock() - start
+                ctx.timings[name] = seconds * 1000
+                self._record(name, seconds * 1000)
+                record("sms." + name, seconds)
+            for callback in ctx.on_success:
+                callback()
+        return ctx
+
+    def process(self, phone: str, body: str, message_id: Optional[str] = None,
+                deliver: bool = False, skip: Iterable[str] = ()) -> SmsContext:
+        return self.run(SmsContext(phone, body, message_id, deliver), skip)
+
+    def warm(self, background: bool = True):
+        """Import every stage and load the NLU models ahead of the first SMS."""
+        def load():
+            start = time.perf_counter()
+            for name in STAGES:
+                self.stage(name)
+            for module in WARM_MODULES:
+                importlib.import_module(module)
+            from ai.nlu import get_model
+            for model in ("intent", "language"):
+                get_model(model)
+            print(f"🔥 SMS pipeline warm in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        if background:
+            threading.Thread(target=load, name="sms-warmup", daemon=True).start()
+        else:
+            load()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                name: {**s, "avg_ms": round(s["total_ms"] / s["calls"], 3) if s["calls"] else 0.0,
+                       "total_ms": round(s["total_ms"], 3), "max_ms": round(s["max_ms"], 3)}
+                for name, s in self.stats_by_stage.items()
+            }
+
+
+_pipeline: Optional[SmsPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline() -> SmsPipeline:
+    """Process-wide pipeline, created on first use."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = SmsPipeline()
+    return _pipeline
@@ -0,0 +1,354 @@
+"""
+Deadline digests: SMS every matching recipient about opportunities
+whose deadline is coming up.
+
+    cd core
+    python -m ai.full_sms.services.digest_service plan             # -> campaign id
+    python -m ai.full_sms.services.digest_service send <campaign>  # resumable
+    python -m ai.full_sms.services.digest_service status <campaign>
+
+`plan` streams backend users and SMS sessions, matches each profile
+against the catalog (once per distinct profile), groups recipients that
+get the same opportunities in the same language, and renders every
+distinct message once. The recipient list is spooled to disk, so memory
+does not grow with the audience. `send` streams the spool into the SMS
+queue at DIGEST_RATE messages/second inside DIGEST_WINDOW, checkpointing
+its position; running it again continues where it stopped.
+"""
+import argparse
+import itertools
+import json
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.catalog import OpportunityCatalog
+from persistence import atomic_write_json
+
+from ai.full_sms.core.segments import count_segments, segment_cost
+from ai.full_sms.core.summarizer import alias_link, gsm_safe
+from ai.full_sms.services.digest_sources import Recipient, iter_recipients
+from ai.full_sms.services.translation_service import render
+
+# ===== CONFIG =====
+DIGEST_DIR = os.getenv("DIGEST_DIR", "ai/full_sms/data/digests")
+DIGEST_HORIZON_DAYS = int(os.getenv("DIGEST_HORIZON_DAYS", "7"))     # deadlines within this many days
+DIGEST_MAX_ITEMS = int(os.getenv("DIGEST_MAX_ITEMS", "3"))
+DIGEST_MAX_SEGMENTS = int(os.getenv("DIGEST_MAX_SEGMENTS", "2"))
+DIGEST_RATE = float(os.getenv("DIGEST_RATE", "50"))                  # messages per second
+DIGEST_WINDOW = os.getenv("DIGEST_WINDOW", "09:00-20:00")            # local time, "" = any time
+DIGEST_CHECKPOINT_EVERY = int(os.getenv("DIGEST_CHECKPOINT_EVERY", "1000"))
+# ==================
+
+
+def upcoming_ids(snapshot, today: date, horizon_days: int) -> List[str]:
+    """
+    Ids with a deadline between `today` and today + horizon, nearest
+    first. Compared on each record's own deadline: the snapshot's
+    deadline buckets are relative to the day it was built.
+    """
+    first = today.isoformat()
+    last = (today + timedelta(days=horizon_days)).isoformat()
+    ids = []
+    for opp_id, opp in snapshot.records.items():   # already in deadline order
+        deadline = (opp.get("deadline") or "")[:10]
+        if deadline > last:
+            break
+        if deadline >= first:
+            ids.append(opp_id)
+    return ids
+
+
+def _fits(text: str, max_segments: int) -> bool:
+    return count_segments(text).segments <= max_segments
+
+
+def digest_text(records: List[Dict], lang: str, max_segments: int = DIGEST_MAX_SEGMENTS) -> str:
+    """
+    One SMS listing `records` (nearest deadline first) in `lang`. Items
+    are dropped from the end, then links, then title words, until the
+    text fits `max_segments`.
+    """
+    header = render("digest.header", lang)
+
+    def item(opp, with_link=True, title=None):
+        # Numeric day/month: the same in every language and process locale
+        deadline = date.fromisoformat(opp["deadline"][:10])
+        deadline = f"{deadline.day:02d}/{deadline.month:02d}"
+        link = alias_link(opp["link"]) if with_link and opp.get("link") else ""
+        return render("digest.item", lang, title=title or opp["title"], date=deadline, link=link).strip()
+
+    def build(items):
+        return gsm_safe(header + " " + "; ".join(items))
+
+    for n in range(len(records), 0, -1):
+        text = build([item(opp) for opp in records[:n]])
+        if _fits(text, max_segments):
+            return text
+
+    first = records[0]
+    text = build([item(first, with_link=False)])
+    words = first["title"].split()
+    while not _fits(text, max_segments) and len(words) > 1:
+        words.pop()
+        text = build([item(first, with_link=False, title=" ".join(words) + "...")])
+    return text
+
+
+class DigestPlanner:
+    """
+    Matches recipients to upcoming opportunities.
+
+    Matching runs once per distinct profile (facet values), and each
+    distinct (language, opportunities) message is rendered once; a large
+    audience mostly hits these two caches.
+    """
+
+    def __init__(self, snapshot, today: Optional[date] = None, horizon_days: int = DIGEST_HORIZON_DAYS,
+                 max_items: int = DIGEST_MAX_ITEMS, max_segments: int = DIGEST_MAX_SEGMENTS):
+        self.snapshot = snapshot
+        self.today = today or date.today()
+        self.max_items = max_items
+        self.max_segments = max_segments
+        self.upcoming = upcoming_ids(snapshot, self.today, horizon_days)
+        self._upcoming_set = set(self.upcoming)
+        self._matches: Dict[Tuple, Tuple[str, ...]] = {}
+        self._texts: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
+    def match(self, query: Tuple) -> Tuple[str, ...]:
+        ids = self._matches.get(query)
+        if ids is None:
+            matched = self._upcoming_set
+            for facet, values in query:
+                if not matched:
+                    break
+                matched = matched & self.snapshot.postings(facet, values)
+            ids = tuple(opp_id for opp_id in self.upcoming if opp_id in matched)[:self.max_items]
+            self._matches[query] = ids
+        return ids
+
+    def text(self, lang: str, ids: Tuple[str, ...]) -> str:
+        key = (lang, ids)
+        text = self._texts.get(key)
+        if text is None:
+            records = [self.snapshot.records[opp_id] for opp_id in ids]
+            text = self._texts[key] = digest_text(records, lang, self.max_segments)
+        return text
+
+
+def _campaign_paths(campaign_dir: str) -> Dict[str, str]:
+    return {
+        "recipients": os.path.join(campaign_dir, "recipients.ndjson"),
+        "messages": os.path.join(campaign_dir, "messages.json"),
+        "state": os.path.join(campaign_dir, "state.json"),
+    }
+
+
+def plan_campaign(recipients: Iterable[Recipient], planner: DigestPlanner,
+                  campaign_id: Optional[str] = None, root: str = DIGEST_DIR) -> Dict:
+    """
+    Spool `recipients` that have at least one upcoming opportunity to
+    <root>/<campaign_id>/recipients.ndjson as [phone, group] lines, with
+    one rendered message per group in messages.json.
+    """
+    campaign_id = campaign_id or datetime.now().strftime("digest-%Y%m%d-%H%M%S")
+    campaign_dir = os.path.join(root, campaign_id)
+    os.makedirs(campaign_dir, exist_ok=True)
+    paths = _campaign_paths(campaign_dir)
+
+    groups: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    counts: Dict[str, int] = {}
+    seen = skipped = 0
+    with open(paths["recipients"], "w", encoding="utf-8") as out:
+        for recipient in recipients:
+            seen += 1
+            ids = planner.match(recipient.query)
+            if not ids:
+                skipped += 1
+                continue
+            key = (recipient.language, ids)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = f"g{len(groups)}"
+            counts[group] = counts.get(group, 0) + 1
+            out.write(json.dumps([recipient.phone, group]) + "\n")
+
+    messages = {
+        group: {"language": lang, "opportunities": list(ids), "text": planner.text(lang, ids),
+                "recipients": counts[group]}
+        for (lang, ids), group in groups.items()
+    }
+    atomic_write_json(paths["messages"], messages, indent=2)
+
+    cost = segment_cost(itertools.chain.from_iterable(
+        itertools.repeat(m["text"], m["recipients"]) for m in messages.values()))
+    state = {
+        "campaign": campaign_id,
+        "status": "planned",
+        "planned_at": datetime.now().isoformat(timespec="seconds"),
+        "total": sum(counts.values()),
+        "offset": 0,
+        "queued": 0,
+        "sent": 0,
+        "failed": 0,
+        "profiles_seen": seen,
+        "no_match": skipped,
+        "groups": len(messages),
+        "segments": cost["segments"],
+        "estimated_cost": cost["estimated_cost"],
+        "estimated_send_seconds": round(sum(counts.values()) / DIGEST_RATE, 1) if DIGEST_RATE > 0 else None,
+    }
+    atomic_write_json(paths["state"], state, indent=2)
+    print(f"📝 Digest {campaign_id}: {state['total']} recipients, {len(messages)} distinct messages, "
+          f"{cost['segments']} segments")
+    return state
+
+
+def _parse_window(window: str):
+    if not window:
+        return None
+    start, end = window.split("-")
+    return (datetime.strptime(start.strip(), "%H:%M").time(), datetime.strptime(end.strip(), "%H:%M").time())
+
+
+def in_window(window: str, now: Optional[datetime] = None) -> bool:
+    bounds = _parse_window(window)
+    if bounds is None:
+        return True
+    current = (now or datetime.now()).time()
+    start, end = bounds
+    if start <= end:
+        return start <= current < end
+    return current >= start or current < end   # window over midnight
+
+
+class DigestJob:
+    """
+    Streams one planned campaign into the SMS queue.
+
+    The spool is read from the saved byte offset, so a job stopped by a
+    crash, a deploy or the end of the send window picks up where it left
+    off. The offset is saved only after the queue has drained, so a
+    crash can re-send at most DIGEST_CHECKPOINT_EVERY messages, never
+    skip one. Messages count as "sent" or "failed" once the queue has
+    delivered or given up on them; "queued" is the spool position.
+    """
+
+    def __init__(self, campaign_dir: str, sms_queue=None, rate: float = DIGEST_RATE,
+                 window: str = DIGEST_WINDOW, checkpoint_every: int = DIGEST_CHECKPOINT_EVERY):
+        self.paths = _campaign_paths(campaign_dir)
+        self.rate = rate
+        self.window = window
+        self.checkpoint_every = max(1, checkpoint_every)
+        if sms_queue is None:
+            from ai.messaging import get_sms_queue
+            sms_queue = get_sms_queue()
+        self.queue = sms_queue
+
+        with open(self.paths["messages"], "r", encoding="utf-8") as f:
+            self.texts = {group: m["text"] for group, m in json.load(f).items()}
+        with open(self.paths["state"], "r", encoding="utf-8") as f:
+            self.state = json.load(f)
+        self.state.setdefault("queued", self.state["sent"] + self.state["failed"])
+
+        self._pending: set = set()                   # ids queued since the last checkpoint
+        self._failed_seen = len(self.queue.failed)   # dead letters from before this job
+
+    def _checkpoint(self, offset: int, status: str):
+        self.queue.flush()
+        dead = self.queue.failed[self._failed_seen:]
+        self._failed_seen += len(dead)
+        failed = sum(1 for message in dead if message["id"] in self._pending)
+        self.state.update(offset=offset, status=status,
+                          queued=self.state["queued"] + len(self._pending),
+                          sent=self.state["sent"] + len(self._pending) - failed,
+                          failed=self.state["failed"] + failed,
+                          updated_at=datetime.now().isoformat(timespec="seconds"))
+        self._pending.clear()
+        atomic_write_json(self.paths["state"], self.state, indent=2)
+
+    def _enqueue(self, phone: str, text: str):
+        from ai.messaging import QueueFull
+        while True:
+            try:
+                self._pending.add(self.queue.enqueue(phone, text))
+                return
+            except QueueFull:
+                time.sleep(0.05)   # back-pressure from the workers
+
+    def run(self, max_messages: Optional[int] = None) -> Dict:
+        if self.state["status"] == "done":
+            return self.state
+
+        offset = self.state["offset"]
+        interval = 1.0 / self.rate if self.rate > 0 else 0.0
+        # The plan estimated DIGEST_RATE; `send --rate` may differ
+        remaining = self.state["total"] - self.state["queued"]
+        self.state["estimated_send_seconds"] = round(remaining * interval, 1) if interval else None
+        next_at = time.monotonic()
+        queued = 0
+        status = "done"
+
+        with open(self.paths["recipients"], "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if max_messages is not None and queued >= max_messages:
+                    status = "paused"
+                    break
+                if not in_window(self.window):
+                    status = "paused"
+                    print(f"⏸️ Outside send window {self.window}; resume later")
+                    break
+
+                if interval:
+                    delay = next_at - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    next_at = max(next_at, time.monotonic() - 1.0) + interval   # allow a 1 s burst after stalls
+
+                phone, group = json.loads(line)
+                self._enqueue(phone, self.texts[group])
+                offset += len(line)
+                queued += 1
+                if len(self._pending) >= self.checkpoint_every:
+                    self._checkpoint(offset, "sending")
+
+        self._checkpoint(offset, status)
+        print(f"📤 Digest {self.state['campaign']}: {self.state['sent']} sent, {self.state['failed']} failed "
+              f"of {self.state['total']} ({status})")
+        return self.state
+
+
+def plan(campaign_id: Optional[str] = None, today: Optional[date] = None, root: str = DIGEST_DIR) -> Dict:
+    snapshot = OpportunityCatalog().snapshot
+    planner = DigestPlanner(snapshot, today=today)
+    return plan_campaign(iter_recipients(), planner, campaign_id, root)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("plan")
+    p.add_argument("--campaign")
+    p.add_argument("--today", type=date.fromisoformat)
+    p = sub.add_parser("send")
+    p.add_argument("campaign")
+    p.add_argument("--rate", type=float, default=DIGEST_RATE)
+    p.add_argument("--window", default=DIGEST_WINDOW)
+    p = sub.add_parser("status")
+    p.add_argument("campaign")
+    args = parser.parse_args()
+
+    if args.command == "plan":
+        state = plan(args.campaign, args.today)
+        print(state["campaign"])
+    elif args.command == "send":
+        DigestJob(os.path.join(DIGEST_DIR, args.campaign), rate=args.rate, window=args.window).run()
+    else:
+        with open(_campaign_paths(os.path.join(DIGEST_DIR, args.campaign))["state"], "r", encoding="utf-8") as f:
+            print(json.dumps(json.load(f), indent=2))
+
+
+if __name__ == "__main__":
+    main()
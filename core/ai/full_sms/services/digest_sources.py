@@ -0,0 +1,181 @@
+# ai/full_sms/services/digest_sources.py
+
+import json
+import os
+import re
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+from backend.catalog import UNKNOWN_VALUES, user_query
+from persistence import iter_json_array, iter_json_object
+
+from ai.full_sms.core.session_store import STATE_FILE
+
+# ===== CONFIG =====
+BACKEND_DB_PATH = os.getenv("DIGEST_BACKEND_DB", "backend/db.json")
+SMS_STATE_FILE = os.getenv("DIGEST_SMS_STATE", STATE_FILE)
+# ==================
+
+# SMS dialog intent -> catalog types (same grouping as backend INTENT_TYPES)
+SESSION_INTENT_TYPES = {
+    "scholarship": ["scholarship"],
+    "fellowship": ["scholarship"],
+    "scheme": ["scheme"],
+    "internship": ["internship"],
+    "job": ["internship"],
+}
+
+# Free-text education answers -> catalog education_level
+EDUCATION_LEVELS = [
+    ("phd", re.compile(r"\b(?:phd|ph\.d|doctor\w*)\b")),
+    ("pg", re.compile(r"\b(?:m\.?tech|m\.?sc|m\.?a|m\.?com|mba|mca|pg|post ?grad\w*|master\w*)\b")),
+    ("diploma", re.compile(r"\b(?:diploma|polytechnic|iti)\b")),
+    ("ug", re.compile(r"\b(?:b\.?tech|b\.?e|b\.?sc|b\.?a|b\.?com|bba|bca|ug|grad\w*|degree|college)\b")),
+]
+GENDERS = [
+    ("female", re.compile(r"\b(?:f|female|girl|woman|women|mahila)\b")),
+    ("male", re.compile(r"\b(?:m|male|boy|man|men|purush)\b")),
+]
+CATEGORIES = ("general", "obc", "sc", "st", "ews")
+
+PHONE_FIELDS = ("phone", "mobile", "phone_number")
+
+
+class Recipient(NamedTuple):
+    phone: str
+    language: str
+    query: Tuple[Tuple[str, Tuple[str, ...]], ...]   # facet -> values, hashable
+
+
+def _freeze(query: Dict[str, List[str]]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    return tuple(sorted((facet, tuple(sorted(values))) for facet, values in query.items()))
+
+
+def _first_match(text: str, table) -> str:
+    for value, pattern in table:
+        if pattern.search(text):
+            return value
+    return ""
+
+
+def session_query(session: Dict) -> Dict[str, List[str]]:
+    """Facet values implied by an SMS dialog session's answers."""
+    profile = session.get("profile") or {}
+    query = {}
+
+    types = SESSION_INTENT_TYPES.get(session.get("intent"))
+    if types:
+        query["type"] = types
+
+    level = _first_match(str(profile.get("education", "")).lower(), EDUCATION_LEVELS)
+    if level:
+        query["education_level"] = [level]
+
+    gender = _first_match(str(profile.get("gender", "")).lower(), GENDERS)
+    if gender:
+        query["gender"] = [gender]
+
+    category = str(profile.get("category", "")).strip().lower()
+    if category in CATEGORIES:
+        query["category"] = [category]
+
+    state = str(profile.get("location", "")).strip().lower()
+    if state not in UNKNOWN_VALUES:
+        query["state"] = [state]
+
+    return query
+
+
+def _user_phone(user: Dict) -> str:
+    for field in PHONE_FIELDS:
+        value = str(user.get(field) or "").strip()
+        if value:
+            return value
+    return ""
+
+
+def _read_wal(path: str) -> Dict[str, Tuple[str, Dict]]:
+    """Net effect of the backend log per user id: ("put", user) or ("patch", fields)."""
+    changes: Dict[str, Tuple[str, Dict]] = {}
+    if not os.path.exists(path):
+        return changes
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("op") == "put":
+                changes[record["user"]["id"]] = ("put", record["user"])
+            elif record.get("op") == "patch":
+                op, data = changes.get(record["id"], ("patch", {}))
+                changes[record["id"]] = (op, {**data, **record["fields"]})
+    return changes
+
+
+def iter_backend_users(db_path: str = BACKEND_DB_PATH) -> Iterator[Dict]:
+    """
+    Every backend user, streamed from the compacted snapshot with the
+    (small, bounded) write-ahead log applied on top.
+    """
+    base, _ = os.path.splitext(db_path)
+    snapshot_path, wal_path = base + ".snapshot.json", base + ".wal"
+    if not os.path.exists(snapshot_path):
+        if os.path.exists(db_path):
+            yield from iter_json_array(db_path, "users")
+        return
+
+    changes = _read_wal(wal_path)
+    seen = set()
+    for user in iter_json_array(snapshot_path, "users"):
+        change = changes.get(user["id"])
+        if change:
+            seen.add(user["id"])
+            op, data = change
+            user = data if op == "put" else {**user, **data}
+        yield user
+    for user_id, (op, data) in changes.items():
+        if op == "put" and user_id not in seen:
+            yield data
+
+
+def iter_sms_sessions(state_file: str = SMS_STATE_FILE) -> Iterator[Tuple[str, Dict]]:
+    """(phone, session) from the SMS state file plus its journal, streamed."""
+    journal = {}
+    journal_path = os.path.splitext(state_file)[0] + ".journal"
+    if os.path.exists(journal_path):
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    phone, session = json.loads(line)
+                except ValueError:
+                    break   # torn tail
+                journal[phone] = session
+
+    if os.path.exists(state_file):
+        for phone, session in iter_json_object(state_file):
+            if phone in journal:
+                continue
+            yield phone, session
+    for phone, session in journal.items():
+        if session is not None:
+            yield phone, session
+
+
+def iter_recipients(db_path: str = BACKEND_DB_PATH, state_file: str = SMS_STATE_FILE) -> Iterator[Recipient]:
+    """
+    Everyone who can get an SMS digest: backend users with a phone number
+    first, then SMS dialog sessions not already covered by a backend user.
+    Only the set of backend phone numbers is kept in memory.
+    """
+    backend_phones = set()
+    for user in iter_backend_users(db_path):
+        phone = _user_phone(user)
+        if not phone or phone in backend_phones:
+            continue
+        backend_phones.add(phone)
+        yield Recipient(phone, user.get("language") or "en", _freeze(user_query(user)))
+
+    for phone, session in iter_sms_sessions(state_file):
+        if phone in backend_phones or not session.get("profile"):
+            continue
+        yield Recipient(phone, session.get("language") or "en", _freeze(session_query(session)))
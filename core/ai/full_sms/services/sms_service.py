@@ -1,14 +1,11 @@
-from twilio.rest import Client
-import os
+from ai.messaging import get_sms_queue
 
-client = Client(
-    os.getenv("TWILIO_ACCOUNT_SID"),
-    os.getenv("TWILIO_AUTH_TOKEN")
-)
 
-def send_sms(to_number: str, message: str):
-    print("📩 Simulated SMS")
-    print("To:", to_number)
-    print("Message:", message)
-   
-    
+def send_sms(to_number: str, message: str) -> int:
+    """
+    Queue an SMS for background delivery and return its queue id.
+
+    The provider (SMS_TRANSPORT: twilio / console) is contacted by the
+    queue's workers, never by the caller.
+    """
+    return get_sms_queue().enqueue(to_number, message)
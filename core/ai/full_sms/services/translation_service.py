@@ -1,96 +1,143 @@
 # ai/full_sms/services/translation_service.py
 
-TRANSLATIONS = {
-
-    # 🔹 HINDI (roman)
-    "hi": {
-        "Here are some scholarship opportunities for students.":
-        "Yahan students ke liye kuch scholarship ke avsar diye gaye hain.",
-
-        " Links: ":
-        " Links: ",
-
-        "Which class or degree are you studying in?":
-        "Aap kis class ya degree mein padh rahe ho?",
-
-        "Your category? (General / OBC / SC / ST)":
-        "Aapki category kya hai? (General / OBC / SC / ST)",
-
-        "Your gender?":
-        "Aapka gender kya hai?",
-
-        "Which state are you from?":
-        "Aap kis rajya se ho?"
-    },
-
-    # 🔹 ODIA (roman)
-    "or": {
-        "Here are some scholarship opportunities for students.":
-        "Ethi students mananka pain kichhi scholarship sujog achhi.",
-
-        " Links: ":
-        " Links: ",
-
-        "Which class or degree are you studying in?":
-        "Apana kon class ba degree re padhuchanti?",
-
-        "Your category? (General / OBC / SC / ST)":
-        "Apananka category kana? (General / OBC / SC / ST)",
-
-        "Your gender?":
-        "Apananka gender kana?",
-
-        "Which state are you from?":
-        "Apana kon rajya ru?"
-    },
-
-    # 🔹 MARATHI
-    "mr": {
-        "Here are some scholarship opportunities for students.":
-        "विद्यार्थ्यांसाठी काही शिष्यवृत्ती संधी येथे दिल्या आहेत.",
-
-        " Links: ":
-        " दुवे: ",
-
-        "Which class or degree are you studying in?":
-        "तुम्ही कोणत्या वर्गात किंवा पदवीत शिक्षण घेत आहात?",
-
-        "Your category? (General / OBC / SC / ST)":
-        "तुमची प्रवर्ग कोणती आहे? (General / OBC / SC / ST)",
-
-        "Your gender?":
-        "तुमचे लिंग काय आहे?",
-
-        "Which state are you from?":
-        "तुम्ही कोणत्या राज्यातून आहात?"
-    },
-
-    # 🔹 BENGALI (roman)
-    "bn": {
-        "Here are some scholarship opportunities for students.":
-        "Chhatro der jonno kichu scholarship sujog ekhane dewa holo.",
-
-        " Links: ":
-        " Links: ",
-
-        "Which class or degree are you studying in?":
-        "Tumi kon class ba degree e porcho?",
-
-        "Your category? (General / OBC / SC / ST)":
-        "Tomar category ki? (General / OBC / SC / ST)",
-
-        "Your gender?":
-        "Tomar gender ki?",
-
-        "Which state are you from?":
-        "Tumi kon rajyer?"
-    }
-}
-
+import json
+import os
+import string
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# ===== CONFIG =====
+LOCALES_DIR = os.getenv(
+    "SMS_LOCALES_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "locales"),
+)
+DEFAULT_LANGUAGE = "en"
+RENDER_CACHE_SIZE = int(os.getenv("SMS_RENDER_CACHE_SIZE", "4096"))
+# ==================
+
+_FORMATTER = string.Formatter()
+
+
+def _compile(template: str):
+    """
+    A template as a plain string (no placeholders) or a tuple of
+    (literal, param name or None) parts, parsed once at load time.
+    """
+    parts = tuple((literal, field) for literal, field, _, _ in _FORMATTER.parse(template))
+    if all(field is None for _, field in parts):
+        return template
+    return parts
+
+
+class TranslationCatalog:
+    """
+    Message-ID keyed translations, one JSON file per language.
+
+    Every file maps message ids ("ask.age", "results.scholarship") to
+    templates with `{param}` placeholders, plus a `_meta.fallback` list
+    of languages to try when an id is missing ("mr" -> "hi" -> "en").
+    At load time the chains are resolved, so each language becomes a
+    complete id -> compiled template table and a lookup is one dict get.
+    """
+
+    def __init__(self, locales_dir: str = LOCALES_DIR, default: str = DEFAULT_LANGUAGE):
+        self.default = default
+        raw: Dict[str, Dict[str, str]] = {}
+        chains: Dict[str, List[str]] = {}
+
+        for name in sorted(os.listdir(locales_dir)):
+            if not name.endswith(".json"):
+                continue
+            lang = sys.intern(name[:-5])
+            with open(os.path.join(locales_dir, name), encoding="utf-8") as f:
+                data = json.load(f)
+            meta = data.pop("_meta", {})
+            raw[lang] = data
+            chains[lang] = list(meta.get("fallback", []))
+
+        if default not in raw:
+            raise ValueError(f"No catalog for default language {default!r} in {locales_dir}")
+
+        self.native = {lang: frozenset(ids) for lang, ids in raw.items()}
+        self.tables: Dict[str, Dict[str, object]] = {}
+        for lang in raw:
+            table = {}
+            for source in reversed(self.chain(lang, chains)):
+                for message_id, template in raw[source].items():
+                    table[sys.intern(message_id)] = _compile(template)
+            self.tables[lang] = table
+
+        # English text -> id, for callers that still pass source strings
+        self.source_ids = {text: message_id for message_id, text in raw[default].items()}
+
+    def chain(self, lang: str, chains: Dict[str, List[str]]) -> List[str]:
+        """`lang`, its fallbacks (transitively) and the default, without repeats."""
+        order, pending = [], [lang]
+        while pending:
+            current = pending.pop(0)
+            if current in order or current not in chains:
+                continue
+            order.append(current)
+            pending.extend(chains[current])
+        if self.default not in order:
+            order.append(self.default)
+        return order
+
+    def languages(self) -> List[str]:
+        return sorted(self.tables)
+
+    def has(self, message_id: str, lang: str) -> bool:
+        """True if `lang`'s own file defines `message_id` (fallbacks don't count)."""
+        return message_id in self.native.get(lang, ())
+
+    def template(self, message_id: str, lang: str) -> Optional[object]:
+        table = self.tables.get(lang) or self.tables[self.default]
+        return table.get(message_id)
+
+    def render(self, message_id: str, lang: str, params: Tuple[Tuple[str, object], ...] = ()) -> str:
+        template = self.template(message_id, lang)
+        if template is None:
+            print(f"⚠️ Missing message id: {message_id}")
+            return message_id
+        if isinstance(template, str):
+            return template
+
+        values = dict(params)
+        out = []
+        for literal, field in template:
+            out.append(literal)
+            if field is not None:
+                # A missing param stays visible instead of failing the reply
+                out.append(str(values[field]) if field in values else "{" + field + "}")
+        return "".join(out)
+
+
+CATALOG = TranslationCatalog()
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_cached(message_id: str, lang: str, params: Tuple[Tuple[str, object], ...]) -> str:
+    return CATALOG.render(message_id, lang, params)
+
+
+def render(message_id: str, lang: str, **params) -> str:
+    """
+    Text of `message_id` in `lang` with `params` filled in.
+
+    Results are memoized on (message_id, lang, params), so the handful of
+    questions and replies every conversation repeats are built once.
+    """
+    key = tuple(sorted(params.items()))
+    try:
+        return _render_cached(message_id, lang, key)
+    except TypeError:   # unhashable param value
+        return CATALOG.render(message_id, lang, key)
 
 
 def translate(text: str, lang: str) -> str:
-    if lang == "en":
+    """Translate an English source string; unknown text is returned as is."""
+    message_id = CATALOG.source_ids.get(text)
+    if message_id is None:
         return text
-
-    return TRANSLATIONS.get(lang, {}).get(text, text)
+    return render(message_id, lang)
@@ -1,11 +1,26 @@
 from fastapi import FastAPI
 from ai.full_sms.api.sms_webhook import router as sms_router
+from ai.full_sms.pipeline import get_pipeline
+from telemetry import instrument
 
 
 app = FastAPI(title="SETU AI Service")
 
+instrument(app, "ai")
+
 app.include_router(sms_router, prefix="/api")
 
+
+@app.on_event("startup")
+async def warm_sms_pipeline():
+    get_pipeline().warm()
+
+
+@app.get("/api/sms/stats")
+async def sms_stats():
+    return get_pipeline().stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,16 @@
+from .outbox import QueueFull, SmsQueue, get_sms_queue
+from .transports import (
+    ConsoleTransport, MemoryTransport, SendError, Transport, TwilioTransport, create_transport
+)
+
+__all__ = [
+    "QueueFull",
+    "SmsQueue",
+    "get_sms_queue",
+    "ConsoleTransport",
+    "MemoryTransport",
+    "SendError",
+    "Transport",
+    "TwilioTransport",
+    "create_transport",
+]
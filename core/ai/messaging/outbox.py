@@ -0,0 +1,249 @@
+import atexit
+import heapq
+import itertools
+import os
+import queue
+import random
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+from .transports import Transport, create_transport
+
+# ===== CONFIG =====
+SMS_WORKERS = int(os.getenv("SMS_WORKERS", "4"))
+SMS_BATCH_SIZE = int(os.getenv("SMS_BATCH_SIZE", "10"))
+SMS_MAX_RETRIES = int(os.getenv("SMS_MAX_RETRIES", "5"))
+SMS_BACKOFF = float(os.getenv("SMS_BACKOFF", "0.5"))          # first retry delay, doubles
+SMS_MAX_BACKOFF = float(os.getenv("SMS_MAX_BACKOFF", "30"))
+SMS_QUEUE_LIMIT = int(os.getenv("SMS_QUEUE_LIMIT", "10000"))  # per worker
+SMS_DRAIN_SECONDS = float(os.getenv("SMS_DRAIN_SECONDS", "5"))  # flush on exit
+# ==================
+
+
+class QueueFull(Exception):
+    pass
+
+
+class SmsQueue:
+    """
+    Outbound SMS queue drained by a pool of background threads.
+
+    Every destination number is pinned to one worker (crc32 of the number),
+    so messages to the same phone go out in the order they were queued
+    while different phones are sent in parallel. Each worker sends up to
+    `batch_size` queued messages per transport call and retries failures
+    with exponential backoff; while a retry waits, later messages to that
+    phone are held back (so it is never overtaken) and other phones keep
+    going.
+
+    `enqueue` only appends to an in-memory queue, so callers (webhooks)
+    never wait on the provider.
+    """
+
+    def __init__(self, transport: Transport = None, workers: int = SMS_WORKERS,
+                 batch_size: int = SMS_BATCH_SIZE, max_retries: int = SMS_MAX_RETRIES,
+                 backoff: float = SMS_BACKOFF, max_backoff: float = SMS_MAX_BACKOFF,
+                 maxsize: int = SMS_QUEUE_LIMIT):
+        self.transport = transport or create_transport()
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._queues = [queue.Queue(maxsize) for _ in range(max(1, workers))]
+        self._threads: List[threading.Thread] = []
+        self._ids = itertools.count(1)
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self.failed: List[Dict] = []          # gave up after retries (dead letters)
+        self.counters = {"queued": 0, "sent": 0, "retried": 0, "failed": 0, "batches": 0}
+
+    # ---------- producer side ----------
+
+    def start(self):
+        with self._lock:
+            if self._threads:
+                return self
+            for n, q in enumerate(self._queues):
+                thread = threading.Thread(target=self._run, args=(q,), name=f"sms-worker-{n}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def enqueue(self, to_number: str, body: str) -> int:
+        """Queue one SMS and return its id. Raises QueueFull if the worker is backed up."""
+        if not self._threads:
+            self.start()
+
+        message = {"id": next(self._ids), "to": to_number, "body": body, "attempts": 0,
+                   "queued_at": time.time()}
+        q = self._queues[zlib.crc32(to_number.encode("utf-8")) % len(self._queues)]
+        try:
+            q.put_nowait(message)
+        except queue.Full:
+            raise QueueFull(f"SMS queue full for {to_number}") from None
+        self._count("queued")
+        return message["id"]
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until everything queued so far was sent or given up on."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for q in self._queues:
+            while q.unfinished_tasks:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.01)
+        return True
+
+    def stop(self, timeout: float = SMS_DRAIN_SECONDS):
+        """
+        Wait up to `timeout` for the queue to drain, then have the workers
+        try everything left once more (no retries); what still fails ends
+        up in `failed`.
+        """
+        self.flush(timeout)
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout=max(1.0, timeout))
+        self._threads = []
+        self._stopping.clear()
+
+    def depth(self) -> int:
+        return sum(q.qsize() for q in self._queues)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = dict(self.counters)
+        return {**counters, "depth": self.depth(), "workers": len(self._queues),
+                "transport": self.transport.name}
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.counters[key] += n
+
+    # ---------- worker side ----------
+
+    def _delay(self, attempt: int) -> float:
+        delay = min(self.backoff * (2 ** (attempt - 1)), self.max_backoff)
+        return delay * random.uniform(0.8, 1.2)
+
+    def _take_batch(self, q: queue.Queue, due: List[Dict], carry: List[Dict],
+                    held: Dict[str, List[Dict]], timeout: float):
+        """
+        Up to `batch_size` messages with at most one per phone: retries
+        that are due first, then the ones held back from the last batch,
+        then new ones. Messages to a phone with a retry outstanding wait
+        in `held` until that retry is sent or given up on, so it can't be
+        overtaken.
+        """
+        batch, deferred, phones = [], [], set()
+
+        def offer(message, is_retry=False):
+            phone = message["to"]
+            if phone in held and not is_retry:
+                held[phone].append(message)
+            elif phone in phones or len(batch) >= self.batch_size:
+                deferred.append(message)
+            else:
+                batch.append(message)
+                phones.add(phone)
+
+        for message in due:
+            offer(message, is_retry=True)
+        for message in carry:
+            offer(message)
+        if not batch:
+            try:
+                offer(q.get(timeout=timeout) if timeout > 0 else q.get_nowait())
+            except queue.Empty:
+                return [], deferred
+        while len(batch) < self.batch_size and len(deferred) < self.batch_size:
+            try:
+                offer(q.get_nowait())
+            except queue.Empty:
+                break
+        return batch, deferred
+
+    def _run(self, q: queue.Queue):
+        """
+        Worker loop. Failed messages go to `retries` (a heap by due time)
+        instead of sleeping, so one failing phone doesn't stall the other
+        phones on this worker. After stop() every message still held here
+        or queued gets one last attempt; failures become dead letters.
+        """
+        carry: List[Dict] = []
+        held: Dict[str, List[Dict]] = {}
+        retries: List = []
+        while True:
+            stopping = self._stopping.is_set()
+            if stopping and not (carry or retries) and q.empty():
+                return
+            now = time.monotonic()
+            due = []
+            while retries and (stopping or retries[0][0] <= now):
+                due.append(heapq.heappop(retries)[-1])
+            if stopping:
+                timeout = 0.0
+            elif retries:
+                timeout = min(0.2, retries[0][0] - now)
+            else:
+                timeout = 0.2
+
+            batch, carry = self._take_batch(q, due, carry, held, timeout)
+            if not batch:
+                continue
+            retry = {message["id"] for message in self._deliver(batch)}
+            now = time.monotonic()
+            for message in batch:
+                if message["id"] in retry:
+                    held.setdefault(message["to"], [])
+                    heapq.heappush(retries, (now + self._delay(message["attempts"]), message["id"], message))
+                    continue
+                q.task_done()
+                # Sent or given up on: what waited behind it goes first
+                carry = held.pop(message["to"], []) + carry
+
+    def _deliver(self, batch: List[Dict]) -> List[Dict]:
+        """Send `batch` once; return the messages to retry later."""
+        for message in batch:
+            message["attempts"] += 1
+        try:
+            results = self.transport.send_batch(batch)
+        except Exception as e:   # a transport that fails the whole call
+            results = [e] * len(batch)
+        self._count("batches")
+
+        retry = []
+        for message, error in zip(batch, results):
+            if error is None:
+                self._count("sent")
+            elif (getattr(error, "retryable", True) and message["attempts"] <= self.max_retries
+                  and not self._stopping.is_set()):
+                retry.append(message)
+            else:
+                message["error"] = str(error)
+                with self._lock:
+                    self.failed.append(message)
+                    self.counters["failed"] += 1
+                print(f"❌ SMS to {message['to']} failed after {message['attempts']} attempts: {error}")
+
+        if retry:
+            self._count("retried", len(retry))
+        return retry
+
+
+_queue: Optional[SmsQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_sms_queue() -> SmsQueue:
+    """Process-wide queue, created (and its transport chosen) on first use."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = SmsQueue().start()
+                atexit.register(_queue.stop)
+    return _queue
@@ -0,0 +1,117 @@
+import os
+import threading
+from typing import Dict, List, Optional
+
+
+class SendError(Exception):
+    """A send failed; `retryable` says whether trying again may help."""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class Transport:
+    """
+    Delivers SMS to a provider. `send` raises SendError on failure.
+
+    Providers with a bulk endpoint can override `send_batch`; the default
+    sends one by one and reports each message's outcome.
+    """
+
+    name = "base"
+
+    def send(self, to_number: str, body: str) -> Optional[str]:
+        """Send one message; returns the provider's message id if any."""
+        raise NotImplementedError
+
+    def send_batch(self, messages: List[Dict]) -> List[Optional[Exception]]:
+        results = []
+        for message in messages:
+            try:
+                self.send(message["to"], message["body"])
+                results.append(None)
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+class ConsoleTransport(Transport):
+    """Local stand-in: prints the SMS instead of sending it."""
+
+    name = "console"
+
+    def send(self, to_number: str, body: str) -> Optional[str]:
+        print("📩 Simulated SMS")
+        print("To:", to_number)
+        print("Message:", body)
+        return None
+
+
+class MemoryTransport(Transport):
+    """Keeps sent messages in a list; optionally fails the first N sends."""
+
+    name = "memory"
+
+    def __init__(self, fail_first: int = 0):
+        self.sent: List[Dict] = []
+        self.fail_first = fail_first
+        self.attempts = 0
+        self._lock = threading.Lock()
+
+    def send(self, to_number: str, body: str) -> Optional[str]:
+        with self._lock:
+            self.attempts += 1
+            if self.attempts <= self.fail_first:
+                raise SendError("simulated provider failure")
+            self.sent.append({"to": to_number, "body": body})
+            return str(len(self.sent))
+
+
+class TwilioTransport(Transport):
+    """Twilio REST API. The client is created on first send, not at import."""
+
+    name = "twilio"
+
+    def __init__(self, account_sid: str = None, auth_token: str = None, from_number: str = None):
+        self.account_sid = account_sid or os.getenv("TWILIO_ACCOUNT_SID")
+        self.auth_token = auth_token or os.getenv("TWILIO_AUTH_TOKEN")
+        self.from_number = from_number or os.getenv("TWILIO_FROM_NUMBER")
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from twilio.rest import Client
+
+                    self._client = Client(self.account_sid, self.auth_token)
+        return self._client
+
+    def send(self, to_number: str, body: str) -> Optional[str]:
+        from twilio.base.exceptions import TwilioRestException
+
+        try:
+            message = self._get_client().messages.create(to=to_number, from_=self.from_number, body=body)
+        except TwilioRestException as e:
+            # 4xx other than rate limiting will fail again the same way
+            raise SendError(str(e), retryable=e.status == 429 or e.status >= 500) from e
+        return message.sid
+
+
+TRANSPORTS = {
+    "console": ConsoleTransport,
+    "memory": MemoryTransport,
+    "twilio": TwilioTransport,
+}
+
+
+def create_transport(kind: str = None) -> Transport:
+    """SMS_TRANSPORT, or Twilio when credentials are set, else the console stand-in."""
+    kind = kind or os.getenv("SMS_TRANSPORT") or (
+        "twilio" if os.getenv("TWILIO_ACCOUNT_SID") else "console"
+    )
+    if kind not in TRANSPORTS:
+        raise ValueError(f"Unknown SMS transport: {kind}")
+    return TRANSPORTS[kind]()
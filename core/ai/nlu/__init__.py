@@ -0,0 +1,3 @@
+from .classifier import HashedLinearModel, get_model, predict
+
+__all__ = ["HashedLinearModel", "get_model", "predict"]
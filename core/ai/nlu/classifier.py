@@ -0,0 +1,94 @@
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .features import hashed_features
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models")
+
+
+class HashedLinearModel:
+    """
+    Multinomial logistic regression over hashed character n-grams.
+
+    The whole model is one float32 weight matrix (classes x buckets) plus
+    a bias vector; predicting touches only the columns of the buckets a
+    message hits, which keeps it well under a millisecond on a CPU.
+    """
+
+    def __init__(self, labels: List[str], weights: np.ndarray, bias: np.ndarray,
+                 min_n: int = 2, max_n: int = 4):
+        self.labels = list(labels)
+        self.weights = np.ascontiguousarray(weights, dtype=np.float32)
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.dim = self.weights.shape[1]
+        self.min_n = min_n
+        self.max_n = max_n
+
+    def features(self, text: str):
+        return hashed_features(text, self.dim, self.min_n, self.max_n)
+
+    def predict_proba(self, text: str) -> np.ndarray:
+        indices, values = self.features(text)
+        scores = self.bias + self.weights[:, indices] @ values
+        scores = np.exp(scores - scores.max())
+        return scores / scores.sum()
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """Best label and its probability."""
+        probs = self.predict_proba(text)
+        best = int(probs.argmax())
+        return self.labels[best], float(probs[best])
+
+    def ranked(self, text: str) -> List[Tuple[str, float]]:
+        probs = self.predict_proba(text)
+        return sorted(zip(self.labels, probs.tolist()), key=lambda p: -p[1])
+
+    # ---------- persistence ----------
+
+    def save(self, path: str):
+        np.savez_compressed(
+            path,
+            labels=np.array(self.labels),
+            weights=self.weights,
+            bias=self.bias,
+            ngrams=np.array([self.min_n, self.max_n])
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "HashedLinearModel":
+        with np.load(path, allow_pickle=False) as data:
+            min_n, max_n = (int(n) for n in data["ngrams"])
+            return cls([str(l) for l in data["labels"]], data["weights"], data["bias"], min_n, max_n)
+
+
+_models: Dict[str, Optional[HashedLinearModel]] = {}
+_lock = threading.Lock()
+
+
+def get_model(name: str) -> Optional[HashedLinearModel]:
+    """
+    The model saved as models/<name>.npz, loaded once per process.
+    None if it has not been trained (callers then rely on their rules).
+    """
+    if name not in _models:
+        with _lock:
+            if name not in _models:
+                path = os.path.join(MODELS_DIR, name + ".npz")
+                if os.path.exists(path):
+                    _models[name] = HashedLinearModel.load(path)
+                else:
+                    print(f"⚠️ NLU model missing: {path} (run python -m nlu.train)")
+                    _models[name] = None
+    return _models[name]
+
+
+def predict(name: str, text: str, threshold: float = 0.0) -> Optional[Tuple[str, float]]:
+    """(label, probability) from model `name`, or None below `threshold` / without a model."""
+    model = get_model(name)
+    if model is None:
+        return None
+    label, prob = model.predict(text)
+    return (label, prob) if prob >= threshold else None
@@ -0,0 +1,40 @@
+import re
+import zlib
+from typing import Tuple
+
+import numpy as np
+
+WORD = re.compile(r"[^\W_]+")
+
+
+def hashed_features(text: str, dim: int, min_n: int = 2, max_n: int = 4) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Character n-grams of each word (padded with spaces) plus the words
+    themselves, hashed into `dim` buckets with a +/-1 sign (the hashing
+    trick). Returns (bucket indices, L2-normalised values).
+
+    Char n-grams make the model robust to the many romanized spellings of
+    one word (chahiye / chaiye / chahie).
+    """
+    counts = {}
+    for word in WORD.findall(text.lower()):
+        grams = ["w:" + word]
+        padded = f" {word} "
+        for n in range(min_n, max_n + 1):
+            grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+        for gram in grams:
+            h = zlib.crc32(gram.encode("utf-8"))
+            bucket = h % dim
+            sign = 1.0 if h & 0x80000000 else -1.0
+            counts[bucket] = counts.get(bucket, 0.0) + sign
+
+    if not counts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+    indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    norm = np.linalg.norm(values)
+    if norm:
+        values /= norm
+    return indices, values
@@ -1,5 +1,14 @@
+from utils.text_templates import TEMPLATES
+
+
 def generate_explanation(student, opportunity):
     return (
         f"This opportunity is recommended because you are a "
         f"{student['education_level']} student and meet the age criteria."
-    )
\ No newline at end of file
+    )
+
+
+def generate_ineligibility_explanation(reasons):
+    """Turn the failing-rule reasons from EligibilityPlan into one message."""
+    reason = "; ".join(r[0].lower() + r[1:] for r in reasons) if reasons else "the criteria are not met"
+    return TEMPLATES["not_eligible"].format(reason=reason)
@@ -1,4 +1,117 @@
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
 from dateutil.parser import parse
 
+NO_DEADLINE = date.max.toordinal()
+
+# Weights of the ranking signals (they don't need to sum to 1)
+WEIGHTS = {
+    "urgency": 0.6,
+    "match": 0.3,
+    "recency": 0.1,
+}
+
+
+@lru_cache(maxsize=65536)
+def deadline_ordinal(deadline):
+    """Deadline string -> date ordinal; ISO dates skip dateutil entirely."""
+    if not deadline:
+        return NO_DEADLINE
+    try:
+        return date.fromisoformat(deadline[:10]).toordinal()
+    except ValueError:
+        pass
+    try:
+        return parse(deadline).date().toordinal()
+    except (ValueError, OverflowError):
+        return NO_DEADLINE
+
+
 def rank_by_deadline(opportunities):
-    return sorted(opportunities, key=lambda x: parse(x["deadline"]))
\ No newline at end of file
+    return sorted(opportunities, key=lambda x: deadline_ordinal(x["deadline"]))
+
+
+class RankingIndex:
+    """
+    Ranking signals for a catalog, parsed once at load time.
+
+    deadlines / posted are arrays aligned with `opportunities`, and
+    `by_deadline` is the catalog sorted by deadline, so the expired prefix
+    is cut off with one binary search. The match signal depends on the
+    student, so callers pass it in (EligibilityMatrix.match_scores).
+    """
+
+    def __init__(self, opportunities):
+        self.opportunities = list(opportunities)
+        self.deadlines = np.array(
+            [deadline_ordinal(o.get("deadline")) for o in self.opportunities], dtype=np.int64
+        )
+        self.posted = np.array(
+            [deadline_ordinal(o.get("posted_at")) if o.get("posted_at") else NO_DEADLINE for o in self.opportunities],
+            dtype=np.int64
+        )
+        self.by_deadline = np.argsort(self.deadlines, kind="stable")
+        self._sorted_deadlines = self.deadlines[self.by_deadline]
+        # Position of every opportunity in by_deadline
+        self._deadline_rank = np.empty(len(self.opportunities), dtype=np.int64)
+        self._deadline_rank[self.by_deadline] = np.arange(len(self.opportunities))
+
+    def _first_active(self, today):
+        return np.searchsorted(self._sorted_deadlines, today, side="left")
+
+    def active(self, today=None):
+        """Indices whose deadline is today or later."""
+        today = today or date.today().toordinal()
+        return self.by_deadline[self._first_active(today):]
+
+    def scores(self, indices, today=None, weights=WEIGHTS, match=None):
+        """`match`: 0..1 per index (aligned with `indices`), 0 when omitted."""
+        today = today or date.today().toordinal()
+        indices = np.asarray(indices, dtype=np.int64)
+
+        days_left = (self.deadlines[indices] - today).astype(float)
+        urgency = np.where(self.deadlines[indices] == NO_DEADLINE, 0.0, 1.0 / (1.0 + np.maximum(days_left, 0) / 7.0))
+
+        posted = self.posted[indices]
+        age = (today - posted).astype(float)
+        recency = np.where(posted == NO_DEADLINE, 0.0, np.exp(-np.maximum(age, 0) / 30.0))
+
+        match = np.zeros(len(indices)) if match is None else np.asarray(match, dtype=float)
+
+        return (
+            weights["urgency"] * urgency
+            + weights["match"] * match
+            + weights["recency"] * recency
+        )
+
+    def top_k(self, candidates=None, limit=10, today=None, weights=WEIGHTS, include_expired=False, match=None):
+        """
+        Best `limit` candidate indices (default: the whole catalog), highest
+        score first. `match` is aligned with `candidates`.
+
+        Uses argpartition, so only the returned slice is ever sorted.
+        """
+        today = today or date.today().toordinal()
+        if candidates is None:
+            candidates = np.arange(len(self.opportunities)) if include_expired else self.active(today)
+        else:
+            candidates = np.asarray(candidates, dtype=np.int64)
+            if not include_expired and len(candidates):
+                live = self._deadline_rank[candidates] >= self._first_active(today)
+                candidates = candidates[live]
+                if match is not None:
+                    match = np.asarray(match, dtype=float)[live]
+        if not len(candidates) or (limit is not None and limit <= 0):
+            return []
+
+        scores = self.scores(candidates, today, weights, match)
+        if limit is None or limit >= len(candidates):
+            top = np.arange(len(candidates))
+        else:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+
+        # Highest score first, then nearest deadline
+        order = sorted(top.tolist(), key=lambda i: (-scores[i], self.deadlines[candidates[i]]))
+        return candidates[order].tolist()
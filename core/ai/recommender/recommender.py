@@ -1,11 +1,48 @@
-from eligibility.eligibility_engine import is_eligible
+from eligibility.columnar import EligibilityMatrix
 
-def recommend_opportunities(student, opportunities):
-    recommendations = []
 
-    for opp in opportunities:
-        eligible, reason = is_eligible(student, opp)
-        if eligible:
-            recommendations.append(opp)
+def _apply_rules(student, candidates, plan):
+    # Columnar mask covers education/age; only opportunities with extra
+    # declarative rules need the compiled plan
+    extra = [i for i in candidates if plan.has_extra_rules[i]]
+    if not extra:
+        return list(candidates)
 
-    return recommendations
\ No newline at end of file
+    failed = {i for i, ok, _ in plan.evaluate(student, extra) if not ok}
+    return [i for i in candidates if i not in failed]
+
+
+def eligible_indices(student, matrix, plan=None):
+    """Catalog positions of the opportunities `student` is eligible for."""
+    candidates = matrix.mask(student).nonzero()[0].tolist()
+    if plan is not None:
+        candidates = _apply_rules(student, candidates, plan)
+    return candidates
+
+
+def recommend_opportunities(student, opportunities, matrix=None, plan=None):
+    """
+    Eligible opportunities for one student.
+
+    Pass a prebuilt EligibilityMatrix / EligibilityPlan (built once per
+    catalog load) to skip re-reading the catalog's constraints on every call.
+    """
+    if matrix is None:
+        matrix = EligibilityMatrix(opportunities)
+
+    return [matrix.opportunities[i] for i in eligible_indices(student, matrix, plan)]
+
+
+def recommend_batch(students, opportunities, matrix=None, plan=None):
+    """Eligible opportunities for many students at once (nightly digests)."""
+    if matrix is None:
+        matrix = EligibilityMatrix(opportunities)
+
+    masks = matrix.batch_mask(students)
+    results = []
+    for student, row in zip(students, masks):
+        candidates = row.nonzero()[0].tolist()
+        if plan is not None:
+            candidates = _apply_rules(student, candidates, plan)
+        results.append([matrix.opportunities[i] for i in candidates])
+    return results
@@ -0,0 +1,284 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set
+
+
+# ================== CATALOG CONFIG ==================
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CATALOG_PATHS = os.getenv(
+    "CATALOG_PATHS",
+    os.pathsep.join([
+        os.path.join(BACKEND_DIR, "opportunities.json"),
+        os.path.join(BACKEND_DIR, "..", "ai", "data", "oppotunities.json"),
+        # Written by scripts/scraper/extract_opportunities.py
+        os.path.join(BACKEND_DIR, "..", "ai", "data", "opportunities.json"),
+    ])
+).split(os.pathsep)
+
+# How often (seconds) to stat the source files for hot reload
+CATALOG_RELOAD_SECONDS = float(os.getenv("CATALOG_RELOAD_SECONDS", "5"))
+# ====================================================
+
+# Facets with an inverted index. A record that does not restrict a facet
+# is posted under "*" and matches every value.
+FACETS = ("type", "education_level", "category", "gender", "state")
+ANY = "*"
+
+# Deadline buckets, relative to the day the indexes were built
+DEADLINE_BUCKETS = ("expired", "week", "month", "quarter", "later", "none")
+
+STUDENT_TYPE_LEVELS = {
+    "undergraduate": "ug",
+    "postgraduate": "pg",
+    "diploma": "diploma",
+    "phd": "phd",
+}
+
+INTENT_TYPES = {
+    "scholarships": ["scholarship"],
+    "fellowships": ["scholarship"],
+    "schemes": ["scheme"],
+    "education loans": ["scheme"],
+    "internships": ["internship"],
+    "hackathons": ["internship"],
+    "competitions": ["internship"],
+}
+
+# Profile answers that mean "don't filter on this"
+UNKNOWN_VALUES = {"", "other", "prefer not to say", "any", "all"}
+
+
+def _norm(value) -> str:
+    return str(value).strip().lower()
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return [_norm(v) for v in value if str(v).strip()]
+    return [_norm(value)] if str(value).strip() else []
+
+
+def normalize_record(raw: Dict) -> Dict:
+    """
+    Accepts both the backend catalog shape (type/criteria/tags) and the
+    AI module shape (category/education_level/eligibility.min_age...).
+    """
+    opp = dict(raw)
+    criteria = dict(raw.get("criteria") or {})
+
+    if "type" not in opp:
+        opp["type"] = _norm(raw.get("category", "")) or "scheme"
+    if "education_level" in raw and "education_level" not in criteria:
+        criteria["education_level"] = raw["education_level"]
+    if isinstance(raw.get("eligibility"), dict):
+        opp["eligibility"] = ", ".join(f"{k.replace('_', ' ')}: {v}" for k, v in raw["eligibility"].items())
+        criteria.setdefault("min_age", raw["eligibility"].get("min_age"))
+        criteria.setdefault("max_age", raw["eligibility"].get("max_age"))
+    # Declarative rules on a facet (extracted records) also feed the index
+    for rule in raw.get("rules") or []:
+        if rule.get("field") in FACETS and rule.get("op") in ("eq", "in"):
+            criteria.setdefault(rule["field"], rule["value"])
+
+    opp["id"] = str(opp["id"])
+    opp["criteria"] = criteria
+    opp.setdefault("provider", "")
+    opp["amount"] = opp.get("amount") or ""
+    opp.setdefault("description", "")
+    opp.setdefault("tags", [])
+    return opp
+
+
+def deadline_bucket(deadline: Optional[str], today: date) -> str:
+    if not deadline:
+        return "none"
+    try:
+        days = (date.fromisoformat(deadline[:10]) - today).days
+    except ValueError:
+        return "none"
+    if days < 0:
+        return "expired"
+    if days <= 7:
+        return "week"
+    if days <= 31:
+        return "month"
+    if days <= 92:
+        return "quarter"
+    return "later"
+
+
+class CatalogSnapshot:
+    """Immutable records + inverted indexes; replaced wholesale on reload."""
+
+    def __init__(self, records: List[Dict], today: date, version: str):
+        self.today = today
+        self.version = version
+        self.records: Dict[str, Dict] = {}
+        self.index: Dict[str, Dict[str, Set[str]]] = {f: {} for f in FACETS}
+        self.deadline_index: Dict[str, Set[str]] = {b: set() for b in DEADLINE_BUCKETS}
+        self.all_ids: Set[str] = set()
+
+        # Stable output order: nearest deadline first, undated last
+        for opp in sorted(records, key=lambda o: (o.get("deadline") or "9999", o["id"])):
+            self._add(opp)
+        self.order = {opp_id: pos for pos, opp_id in enumerate(self.records)}
+
+    def _add(self, opp: Dict):
+        opp_id = opp["id"]
+        self.records[opp_id] = opp
+        self.all_ids.add(opp_id)
+
+        values = {"type": [_norm(opp["type"])]}
+        for facet in FACETS:
+            if facet != "type":
+                values[facet] = _as_list(opp["criteria"].get(facet))
+
+        for facet, vals in values.items():
+            for v in vals or [ANY]:
+                self.index[facet].setdefault(v, set()).add(opp_id)
+
+        self.deadline_index[deadline_bucket(opp.get("deadline"), self.today)].add(opp_id)
+
+    def postings(self, facet: str, wanted: Iterable[str]) -> Set[str]:
+        """Ids matching any of `wanted` for one facet (wildcards included)."""
+        index = self.index[facet]
+        result = set(index.get(ANY, ()))
+        for v in wanted:
+            result |= index.get(v, set())
+        return result
+
+
+class OpportunityCatalog:
+    """
+    Opportunity records loaded once and indexed by facet.
+
+    The source files are re-checked at most every CATALOG_RELOAD_SECONDS,
+    and indexes are rebuilt when they change or when the day rolls over
+    (deadline buckets are relative to today).
+    """
+
+    def __init__(self, paths: List[str] = CATALOG_PATHS, reload_seconds: float = CATALOG_RELOAD_SECONDS):
+        self.paths = [os.path.abspath(p) for p in paths]
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._signature = None
+        self.snapshot: CatalogSnapshot = None
+        self.refresh(force=True)
+
+    def _file_signature(self):
+        sig = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+                sig.append((path, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                sig.append((path, None, None))
+        return tuple(sig), date.today()
+
+    def refresh(self, force: bool = False) -> CatalogSnapshot:
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.reload_seconds:
+            return self.snapshot
+
+        with self._lock:
+            self._checked_at = now
+            signature = self._file_signature()
+            if not force and signature == self._signature:
+                return self.snapshot
+
+            records = {}
+            for path in self.paths:
+                if not os.path.exists(path):
+                    continue
+                with open(path, "r", encoding="utf-8") as f:
+                    for raw in json.load(f):
+                        opp = normalize_record(raw)
+                        records.setdefault(opp["id"], opp)
+
+            version = hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()[:16]
+            self.snapshot = CatalogSnapshot(list(records.values()), signature[1], version)
+            self._signature = signature
+            print(f"📚 Catalog loaded: {len(records)} opportunities")
+            return self.snapshot
+
+
+def user_query(user: Dict) -> Dict[str, List[str]]:
+    """Facet values implied by a stored user profile."""
+    query = {}
+
+    level = STUDENT_TYPE_LEVELS.get(_norm(user.get("student_type") or ""))
+    if level:
+        query["education_level"] = [level]
+
+    for facet, field in (("gender", "gender"), ("state", "location"), ("category", "category")):
+        value = _norm(user.get(field) or "")
+        if value not in UNKNOWN_VALUES:
+            query[facet] = [value]
+
+    types = []
+    for intent in user.get("intents") or []:
+        types.extend(INTENT_TYPES.get(_norm(intent), []))
+    if types:
+        query["type"] = sorted(set(types))
+
+    return query
+
+
+def search(
+    snapshot: CatalogSnapshot,
+    query: Dict[str, List[str]],
+    interests: Iterable[str] = (),
+    intents: Iterable[str] = (),
+    deadline: Optional[str] = None,
+    include_expired: bool = True
+) -> List[Dict]:
+    """
+    Intersect facet postings (smallest first) and score the survivors.
+
+    Returns copies of the matching records with matchScore / whyMatch.
+    """
+    candidate_sets = [snapshot.postings(facet, values) for facet, values in query.items()]
+    if deadline:
+        candidate_sets.append(snapshot.deadline_index.get(deadline, set()))
+    candidate_sets.sort(key=len)
+
+    ids = set(candidate_sets[0]) if candidate_sets else set(snapshot.all_ids)
+    for postings in candidate_sets[1:]:
+        ids &= postings
+        if not ids:
+            break
+    if not include_expired:
+        ids -= snapshot.deadline_index["expired"]
+
+    interest_tags = set(_as_list(interests))
+    intent_tags = set(_as_list(intents))
+
+    results = []
+    for opp_id in sorted(ids, key=snapshot.order.__getitem__):
+        opp = snapshot.records[opp_id]
+        tags = _as_list(opp["tags"])
+        matched_interests = [t for t in tags if t in interest_tags]
+        matched_intents = [t for t in tags if t in intent_tags]
+
+        score = 70 + 10 * min(len(matched_interests), 2) + 8 * bool(matched_intents)
+        if "education_level" in query and opp["criteria"].get("education_level"):
+            score += 2
+
+        if matched_interests:
+            why = "Matches your interests: " + ", ".join(t.upper() if len(t) <= 3 else t.title() for t in matched_interests)
+        elif matched_intents:
+            why = "Matches what you're looking for"
+        else:
+            why = "You meet the listed eligibility"
+
+        results.append({**opp, "matchScore": min(score, 99), "whyMatch": why})
+
+    results.sort(key=lambda o: -o["matchScore"])
+    return results
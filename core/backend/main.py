@@ -1,14 +1,36 @@
-from fastapi import FastAPI, HTTPException, Header
+from fastapi import FastAPI, HTTPException, Header, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional
+import hashlib
 import json
 import os
+import sys
+import time
 from datetime import datetime, timedelta
 import jwt
-from passlib.context import CryptContext
+
+# Shared packages (persistence, telemetry, ai.full_sms) live in core/
+CORE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if CORE_DIR not in sys.path:
+    sys.path.insert(0, CORE_DIR)
+
+from storage import create_engine
+from cache import LRUCache
+from passwords import PasswordPool, PoolSaturated
+from catalog import OpportunityCatalog, search, user_query
+from search_index import SearchIndex
+from telemetry import instrument, span
 
 app = FastAPI()
 
+# /metrics + per-route latency; dashboard and search targets from requirements.md
+instrument(app, "backend", slos={
+    "/me": "dashboard",
+    "/opportunities": "dashboard",
+    "/search": "search",
+})
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -17,11 +39,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt runs in a bounded worker pool, never on the event loop
+password_pool = PasswordPool()
 SECRET_KEY = "your-secret-key-change-in-production"
 ALGORITHM = "HS256"
 
-DB_PATH = os.path.join(os.path.dirname(__file__), "db.json")
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL", "300"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+
+# token -> user id (already verified), user id -> user record
+token_cache = LRUCache(maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL)
+user_cache = LRUCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+DB_PATH = os.getenv("DB_PATH", os.path.join(os.path.dirname(__file__), "db.json"))
 
 def init_db():
     if not os.path.exists(DB_PATH):
@@ -30,19 +62,53 @@ def init_db():
 
 init_db()
 
+# Pluggable engine (see storage.py); endpoints use its keyed lookups directly
+db_engine = create_engine(DB_PATH)
+
+# Opportunities are loaded and indexed once, then hot-reloaded on change
+catalog = OpportunityCatalog()
+
+# Full-text index over the catalog, kept on disk between restarts
+search_index = SearchIndex()
+
 def load_db():
-    with open(DB_PATH, "r") as f:
-        return json.load(f)
+    with span("db.load"):
+        return {"users": db_engine.all_users()}
 
 def save_db(data):
-    with open(DB_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+    with span("db.save"):
+        db_engine.replace_all(data["users"])
+    user_cache.clear()
+
+def load_user(user_id: str) -> Optional[dict]:
+    user = user_cache.get(user_id)
+    if user is None:
+        with span("db.load"):
+            user = db_engine.get_user(user_id)
+        if user is not None:
+            user_cache.set(user_id, user)
+    return user
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+def update_user(user_id: str, fields: dict) -> Optional[dict]:
+    with span("db.save"):
+        user = db_engine.update_user(user_id, fields)
+    user_cache.invalidate(user_id)
+    return user
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+async def hash_password(password: str) -> str:
+    try:
+        with span("bcrypt.hash"):
+            return await password_pool.hash(password)
+    except PoolSaturated:
+        raise HTTPException(status_code=503, detail="Server busy, try again", headers={"Retry-After": "1"})
+
+async def verify_password(plain: str, hashed: str):
+    """Returns (ok, new_hash); new_hash is set when the bcrypt cost changed."""
+    try:
+        with span("bcrypt.verify"):
+            return await password_pool.verify(plain, hashed)
+    except PoolSaturated:
+        raise HTTPException(status_code=503, detail="Server busy, try again", headers={"Retry-After": "1"})
 
 def create_token(user_id: str) -> str:
     payload = {
@@ -52,12 +118,22 @@ def create_token(user_id: str) -> str:
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 def verify_token(token: str) -> Optional[str]:
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload.get("sub")
+        with span("jwt.decode"):
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except:
         return None
 
+    user_id = payload.get("sub")
+    if user_id:
+        # Never keep a token cached past its own expiry
+        token_cache.set(token, user_id, min(TOKEN_CACHE_TTL, payload["exp"] - time.time()))
+    return user_id
+
 def get_current_user(authorization: str = Header(None)):
     if not authorization:
         raise HTTPException(status_code=401, detail="No token")
@@ -67,8 +143,7 @@ def get_current_user(authorization: str = Header(None)):
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
     
-    db = load_db()
-    user = next((u for u in db["users"] if u["id"] == user_id), None)
+    user = load_user(user_id)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
@@ -81,22 +156,22 @@ async def signup(data: dict):
     if not email:
         raise HTTPException(status_code=400, detail="Email required")
     
-    db = load_db()
-    
-    if any(u.get("email") == email for u in db["users"]):
+    with span("db.load"):
+        existing = db_engine.get_user_by_email(email)
+    if existing:
         raise HTTPException(status_code=400, detail="User already exists")
     
     user = {
         "id": email,
         "email": email,
-        "password": hash_password(password),
+        "password": await hash_password(password),
         "onboarding_completed": False,
         "profile_completed": False,
         "created_at": datetime.utcnow().isoformat()
     }
     
-    db["users"].append(user)
-    save_db(db)
+    with span("db.save"):
+        db_engine.insert_user(user)
     
     token = create_token(user["id"])
     return {"access_token": token, "token_type": "bearer"}
@@ -106,15 +181,17 @@ async def login(data: dict):
     identifier = data.get("identifier")
     password = data.get("password")
     
-    db = load_db()
-    
-    user = next((u for u in db["users"] if u.get("email") == identifier), None)
+    with span("db.load"):
+        user = db_engine.get_user_by_email(identifier)
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    if not verify_password(password, user["password"]):
+    ok, new_hash = await verify_password(password, user["password"])
+    if not ok:
         raise HTTPException(status_code=401, detail="Wrong password")
+    if new_hash:
+        update_user(user["id"], {"password": new_hash})
     
     token = create_token(user["id"])
     return {
@@ -125,147 +202,150 @@ async def login(data: dict):
     }
 
 @app.get("/me")
-async def get_me(authorization: str = Header(None)):
-    current_user = get_current_user(authorization)
+async def get_me(current_user: dict = Depends(get_current_user)):
     user_copy = current_user.copy()
     user_copy.pop("password", None)
     return user_copy
 
 @app.post("/profile")
-async def update_profile(data: dict, authorization: str = Header(None)):
-    current_user = get_current_user(authorization)
-    db = load_db()
-    
-    for user in db["users"]:
-        if user["id"] == current_user["id"]:
-            user["student_type"] = data.get("student_type")
-            user["gender"] = data.get("gender")
-            user["location"] = data.get("location")
-            user["semester"] = data.get("semester")
-            user["profile_completed"] = True
-            break
-    
-    save_db(db)
+async def update_profile(data: dict, current_user: dict = Depends(get_current_user)):
+    fields = {
+        "student_type": data.get("student_type"),
+        "gender": data.get("gender"),
+        "location": data.get("location"),
+        "semester": data.get("semester"),
+        "profile_completed": True
+    }
+    # Optional; deadline digests only reach users with a phone number
+    phone = str(data.get("phone") or "").strip()
+    if phone:
+        fields["phone"] = phone
+    update_user(current_user["id"], fields)
     return {"message": "Profile updated"}
 
 @app.post("/language")
-async def update_language(data: dict, authorization: str = Header(None)):
-    current_user = get_current_user(authorization)
-    db = load_db()
-    
-    for user in db["users"]:
-        if user["id"] == current_user["id"]:
-            user["language"] = data.get("language")
-            user["voice_enabled"] = data.get("voice_enabled")
-            break
-    
-    save_db(db)
+async def update_language(data: dict, current_user: dict = Depends(get_current_user)):
+    update_user(current_user["id"], {
+        "language": data.get("language"),
+        "voice_enabled": data.get("voice_enabled")
+    })
     return {"message": "Language updated"}
 
 @app.post("/preferences")
-async def update_preferences(data: dict, authorization: str = Header(None)):
-    current_user = get_current_user(authorization)
-    db = load_db()
-    
-    for user in db["users"]:
-        if user["id"] == current_user["id"]:
-            user["interests"] = data.get("interests")
-            break
-    
-    save_db(db)
+async def update_preferences(data: dict, current_user: dict = Depends(get_current_user)):
+    update_user(current_user["id"], {
+        "interests": data.get("interests")
+    })
     return {"message": "Preferences updated"}
 
 @app.post("/intent")
-async def update_intent(data: dict, authorization: str = Header(None)):
-    current_user = get_current_user(authorization)
-    db = load_db()
-    
-    for user in db["users"]:
-        if user["id"] == current_user["id"]:
-            user["intents"] = data.get("intents")
-            user["onboarding_completed"] = True
-            break
-    
-    save_db(db)
+async def update_intent(data: dict, current_user: dict = Depends(get_current_user)):
+    update_user(current_user["id"], {
+        "intents": data.get("intents"),
+        "onboarding_completed": True
+    })
     return {"message": "Intent updated"}
 
 @app.get("/opportunities")
-async def get_opportunities(authorization: str = Header(None)):
-    current_user = get_current_user(authorization)
-    
-    mock_opps = [
-        {
-            "id": "1",
-            "title": "National Scholarship for SC Students",
-            "type": "scholarship",
-            "provider": "Ministry of Social Justice",
-            "amount": "₹50,000/year",
-            "deadline": "2026-03-31",
-            "description": "Scholarship for SC students pursuing higher education",
-            "eligibility": "SC category, Annual income < 2.5L",
-            "matchScore": 95,
-            "whyMatch": "Matches your education level and category"
-        },
-        {
-            "id": "2",
-            "title": "AICTE Pragati Scholarship for Girls",
-            "type": "scholarship",
-            "provider": "AICTE",
-            "amount": "₹50,000/year",
-            "deadline": "2026-04-15",
-            "description": "Scholarship for girl students in technical education",
-            "eligibility": "Female, Technical degree/diploma",
-            "matchScore": 92,
-            "whyMatch": "Perfect match for female engineering students"
-        },
-        {
-            "id": "3",
-            "title": "Google Summer of Code",
-            "type": "internship",
-            "provider": "Google",
-            "amount": "$3000-$6600",
-            "deadline": "2026-04-02",
-            "description": "Open source development internship",
-            "eligibility": "Students 18+, Programming skills",
-            "matchScore": 88,
-            "whyMatch": "Matches your IT interests"
-        },
-        {
-            "id": "4",
-            "title": "PM-YUVA Scheme",
-            "type": "scheme",
-            "provider": "Ministry of Education",
-            "amount": "₹50,000",
-            "deadline": "2026-05-31",
-            "description": "Mentorship program for young authors",
-            "eligibility": "Age 30 or below",
-            "matchScore": 85,
-            "whyMatch": "Great for creative students"
-        },
-        {
-            "id": "5",
-            "title": "Smart India Hackathon",
-            "type": "internship",
-            "provider": "AICTE",
-            "amount": "₹1,00,000",
-            "deadline": "2026-03-15",
-            "description": "National level hackathon for students",
-            "eligibility": "Students from recognized institutions",
-            "matchScore": 90,
-            "whyMatch": "Perfect for tech enthusiasts"
-        }
-    ]
-    
-    return {"opportunities": mock_opps}
+async def get_opportunities(
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    type: Optional[str] = None,
+    deadline: Optional[str] = None,
+    include_expired: bool = True,
+    current_user: dict = Depends(get_current_user)
+):
+    snapshot = catalog.refresh()
+
+    query = user_query(current_user)
+    if type:
+        query["type"] = [type.lower()]
+
+    interests = current_user.get("interests") or []
+    intents = current_user.get("intents") or []
+
+    # Results depend only on catalog version + these inputs, so the ETag
+    # can be checked before any work is done
+    etag_source = json.dumps(
+        [snapshot.version, query, interests, intents, deadline, include_expired, page, page_size],
+        sort_keys=True
+    )
+    etag = '"' + hashlib.sha1(etag_source.encode("utf-8")).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    with span("catalog.search"):
+        matches = search(snapshot, query, interests, intents, deadline, include_expired)
+    start = (page - 1) * page_size
+
+    response.headers.update(headers)
+    return {
+        "opportunities": matches[start:start + page_size],
+        "page": page,
+        "page_size": page_size,
+        "total": len(matches)
+    }
+
+@app.get("/search")
+async def search_opportunities(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    type: Optional[str] = None,
+    include_expired: bool = True
+):
+    snapshot = catalog.refresh()
+    if search_index.version != snapshot.version:
+        # Only records added or changed since the last sync are re-indexed
+        with span("search.sync"):
+            search_index.sync(snapshot.records.values(), snapshot.version)
+
+    allowed = None
+    if type:
+        allowed = snapshot.index["type"].get(type.lower(), set())
+    if not include_expired:
+        expired = snapshot.deadline_index["expired"]
+        allowed = (allowed if allowed is not None else snapshot.all_ids) - expired
+
+    with span("search.query"):
+        hits = search_index.search(q, limit=limit, allowed=allowed)
+
+    results = []
+    for opp_id, score in hits:
+        opp = snapshot.records.get(opp_id)
+        if opp:
+            results.append({**opp, "score": score})
+
+    return {"query": q, "results": results, "total": len(results)}
+
+@app.get("/cache-stats")
+async def cache_stats():
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
+
+@app.get("/password-stats")
+async def password_stats():
+    return password_pool.stats()
+
+@app.on_event("shutdown")
+async def shutdown_password_pool():
+    password_pool.shutdown()
+    search_index.close()
 
 @app.post("/sms-webhook")
 async def sms_webhook(data: dict):
     message = data.get("message", "")
     phone = data.get("phone", "")
-    
-    response = f"Thanks for your message: {message}. We'll get back to you soon!"
-    
-    return {"status": "success", "response": response, "phone": phone}
+
+    # Same SMS pipeline as the AI service.
+    # Imported here so the API starts without loading the SMS stack.
+    from ai.full_sms.pipeline import get_pipeline
+
+    ctx = await run_in_threadpool(get_pipeline().process, phone, message, data.get("message_id"))
+
+    return {"status": "success", "response": ctx.reply, "phone": phone}
 
 @app.get("/")
 async def root():
@@ -0,0 +1,140 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from passlib.context import CryptContext
+
+
+# ================== PASSWORD POOL CONFIG ==================
+PASSWORD_POOL = os.getenv("PASSWORD_POOL", "thread")          # "thread" or "process"
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_QUEUE_LIMIT = int(os.getenv("PASSWORD_QUEUE_LIMIT", "64"))
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# ==========================================================
+
+_contexts: Dict[int, CryptContext] = {}
+
+
+def _context(rounds: int) -> CryptContext:
+    # Built lazily so process-pool workers get their own copy
+    ctx = _contexts.get(rounds)
+    if ctx is None:
+        ctx = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        _contexts[rounds] = ctx
+    return ctx
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_and_update(plain: str, hashed: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    # new hash is returned only when the stored one uses an outdated cost
+    return _context(rounds).verify_and_update(plain, hashed)
+
+
+class PoolSaturated(Exception):
+    """Raised when too many password operations are already queued."""
+
+
+class PasswordPool:
+    """
+    Runs bcrypt off the event loop with a cap on in-flight work.
+
+    Requests beyond `queue_limit` are rejected straight away instead of
+    piling up behind the workers.
+    """
+
+    def __init__(
+        self,
+        kind: str = PASSWORD_POOL,
+        workers: int = PASSWORD_WORKERS,
+        queue_limit: int = PASSWORD_QUEUE_LIMIT,
+        rounds: int = BCRYPT_ROUNDS
+    ):
+        if kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        elif kind == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        else:
+            raise ValueError(f"Unknown PASSWORD_POOL: {kind}")
+
+        self.kind = kind
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.rounds = rounds
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._rejected = 0
+        self._rehashed = 0
+        self._latency = {
+            "hash": {"count": 0, "total": 0.0, "max": 0.0},
+            "verify": {"count": 0, "total": 0.0, "max": 0.0}
+        }
+
+    def _admit(self):
+        with self._lock:
+            if self._in_flight >= self.queue_limit:
+                self._rejected += 1
+                raise PoolSaturated()
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+
+    def _release(self, op: str, started: float):
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._in_flight -= 1
+            stats = self._latency[op]
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+
+    async def _run(self, op: str, fn, *args):
+        self._admit()
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._release(op, started)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", _hash, password, self.rounds)
+
+    async def verify(self, plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """Returns (ok, new_hash); new_hash is set when the cost setting changed."""
+        ok, new_hash = await self._run("verify", _verify_and_update, plain, hashed, self.rounds)
+        if new_hash:
+            with self._lock:
+                self._rehashed += 1
+        return ok, new_hash
+
+    def stats(self) -> Dict:
+        with self._lock:
+            latency = {
+                op: {
+                    "count": s["count"],
+                    "avg_ms": round(s["total"] / s["count"] * 1000, 2) if s["count"] else 0.0,
+                    "max_ms": round(s["max"] * 1000, 2)
+                }
+                for op, s in self._latency.items()
+            }
+            return {
+                "pool": self.kind,
+                "workers": self.workers,
+                "rounds": self.rounds,
+                "queue_depth": self._in_flight,
+                "max_queue_depth": self._max_in_flight,
+                "queue_limit": self.queue_limit,
+                "rejected": self._rejected,
+                "rehashed": self._rehashed,
+                "latency": latency
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,389 @@
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from persistence import atomic_write_bytes
+
+
+# ================== SEARCH CONFIG ==================
+SEARCH_SEGMENT_PATH = os.getenv(
+    "SEARCH_SEGMENT_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "search.segment")
+)
+# Rewrite the on-disk segment once this many documents changed since the last one
+SEARCH_MERGE_EVERY = int(os.getenv("SEARCH_MERGE_EVERY", "200"))
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Query terms with no exact match fall back to prefix, then typo matches
+PREFIX_LIMIT = 20
+PREFIX_WEIGHT = 0.8
+TYPO_WEIGHT = 0.6
+# ===================================================
+
+# Per-field repetition = field boost
+FIELD_WEIGHTS = (("title", 3), ("tags", 2), ("provider", 1), ("type", 1),
+                 ("description", 1), ("eligibility", 1), ("amount", 1))
+
+STOPWORDS = {"the", "of", "for", "and", "to", "in", "a", "an", "on", "with", "by", "is",
+             "ki", "ka", "ke", "ko", "se", "hai", "aur", "ra", "re"}
+
+MAGIC = b"SIDX0001"
+_TOKEN = re.compile(r"[^\W_]+")
+# Romanized Hindi/Odia spellings of one word vary a lot:
+# chhatravritti / chatravriti, yojana / yojna, vikas / vikash
+_FOLDS = (("ph", "f"), ("sh", "s"), ("w", "v"), ("z", "j"), ("q", "k"), ("ck", "k"),
+          ("ee", "i"), ("oo", "u"))
+_REPEATS = re.compile(r"(.)\1+")
+
+
+def normalize_term(token: str) -> str:
+    token = "".join(c for c in unicodedata.normalize("NFKD", token.lower()) if not unicodedata.combining(c))
+    if not token.isascii() or not token.isalpha():
+        return token  # native script and numbers are matched as-is
+    for old, new in _FOLDS:
+        token = token.replace(old, new)
+    token = _REPEATS.sub(r"\1", token)
+    # Hindi "a" between consonants is often dropped: yojana / yojna
+    if len(token) > 4:
+        token = re.sub(r"(?<=[^aeiou])a(?=[^aeiou]a$)", "", token)
+        if token.endswith("a"):
+            token = token[:-1]
+        elif token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    terms = []
+    for token in _TOKEN.findall(text or ""):
+        if len(token) < 2 or token.lower() in STOPWORDS:
+            continue
+        terms.append(normalize_term(token))
+    return terms
+
+
+def document_terms(record: Dict) -> List[str]:
+    terms = []
+    for field, weight in FIELD_WEIGHTS:
+        value = record.get(field)
+        if isinstance(value, (list, tuple)):
+            value = " ".join(str(v) for v in value)
+        elif isinstance(value, dict):
+            value = " ".join(f"{k} {v}" for k, v in value.items())
+        field_terms = tokenize(str(value)) if value else []
+        terms.extend(field_terms * weight)
+    return terms
+
+
+def _fingerprint(terms: List[str]) -> str:
+    return hashlib.sha1(" ".join(terms).encode("utf-8")).hexdigest()[:16]
+
+
+def _deletes(term: str) -> List[str]:
+    return [term[:i] + term[i + 1:] for i in range(len(term))]
+
+
+def _within(a: str, b: str, limit: int) -> bool:
+    """Levenshtein distance <= limit (small limits only)."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+class _Segment:
+    """
+    Read-only postings file, memory-mapped.
+
+    Layout: MAGIC, uint64 header length, JSON header (docs + sorted term
+    dictionary with offsets), then native-endian uint32 (doc slot, term
+    frequency) pairs.
+    Only the dictionary is parsed at startup; postings are read from the
+    page cache when a term is queried.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:8] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a search segment")
+
+        (header_len,) = struct.unpack_from("<Q", self._map, 8)
+        header = json.loads(self._map[16:16 + header_len])
+        self.version = header["version"]
+        self.docs = header["docs"]                       # [id, length, fingerprint]
+        self.terms = {t: (offset, df) for t, offset, df in header["terms"]}
+        start = 16 + header_len
+        start += -start % 4
+        self._postings = memoryview(self._map)[start:].cast("I")
+
+    def postings(self, term: str) -> Iterable[Tuple[int, int]]:
+        entry = self.terms.get(term)
+        if entry is None:
+            return ()
+        offset, df = entry
+        values = self._postings[offset * 2:(offset + df) * 2]
+        return zip(values[::2], values[1::2])
+
+    def close(self):
+        if getattr(self, "_postings", None) is not None:
+            self._postings.release()
+            self._postings = None
+        self._map.close()
+        self._file.close()
+
+    @staticmethod
+    def write(path: str, version: str, docs: List[Tuple[str, int, str]], postings: Dict[str, Dict[int, int]]):
+        terms = []
+        body = array("I")
+        for term in sorted(postings):
+            entries = sorted(postings[term].items())
+            terms.append([term, len(body) // 2, len(entries)])
+            for slot, tf in entries:
+                body.extend((slot, tf))
+
+        header = json.dumps({"version": version, "docs": docs, "terms": terms},
+                            ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        prefix = MAGIC + struct.pack("<Q", len(header)) + header
+        prefix += b"\0" * (-len(prefix) % 4)
+        atomic_write_bytes(path, prefix + body.tobytes())
+
+
+class SearchIndex:
+    """
+    BM25 full-text index over catalog records.
+
+    Documents live in a memory-mapped segment on disk plus an in-memory
+    delta for records added or changed since it was written; replaced
+    documents are masked as deleted. `sync()` applies a new catalog
+    snapshot incrementally and rewrites the segment every
+    SEARCH_MERGE_EVERY changes, so a restart only re-indexes the delta.
+    """
+
+    def __init__(self, path: Optional[str] = SEARCH_SEGMENT_PATH, merge_every: int = SEARCH_MERGE_EVERY):
+        self.path = path
+        self.merge_every = merge_every
+        self.version = None
+        self._lock = threading.RLock()
+        self._segment: Optional[_Segment] = None
+        self._reset()
+
+        if path and os.path.exists(path):
+            try:
+                self._segment = _Segment(path)
+            except (ValueError, OSError, KeyError) as e:
+                print(f"⚠️ Ignoring search segment {path}: {e}")
+            else:
+                self.version = self._segment.version
+                for doc_id, length, fingerprint in self._segment.docs:
+                    self._add_doc(doc_id, length, fingerprint)
+                self._sorted_terms = None
+
+    def _reset(self):
+        self.doc_ids: List[str] = []
+        self.doc_lengths: List[int] = []
+        self.fingerprints: List[str] = []
+        self.slot_of: Dict[str, int] = {}
+        self.deleted = set()
+        self.total_length = 0
+        self.delta: Dict[str, Dict[int, int]] = {}
+        self.changes = 0
+        self._sorted_terms = None
+        self._typo_index = None
+
+    def _add_doc(self, doc_id: str, length: int, fingerprint: str) -> int:
+        slot = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        self.doc_lengths.append(length)
+        self.fingerprints.append(fingerprint)
+        self.slot_of[doc_id] = slot
+        self.total_length += length
+        return slot
+
+    def __len__(self):
+        return len(self.slot_of)
+
+    # ---------- updates ----------
+
+    def remove(self, doc_id: str):
+        with self._lock:
+            slot = self.slot_of.pop(doc_id, None)
+            if slot is not None:
+                self.deleted.add(slot)
+                self.total_length -= self.doc_lengths[slot]
+                self.changes += 1
+
+    def add(self, record: Dict):
+        """Index (or re-index) one record; a no-op if its text is unchanged."""
+        doc_id = str(record["id"])
+        terms = document_terms(record)
+        fingerprint = _fingerprint(terms)
+
+        with self._lock:
+            slot = self.slot_of.get(doc_id)
+            if slot is not None and self.fingerprints[slot] == fingerprint:
+                return
+            self.remove(doc_id)
+
+            slot = self._add_doc(doc_id, len(terms), fingerprint)
+            for term in terms:
+                postings = self.delta.setdefault(term, {})
+                postings[slot] = postings.get(slot, 0) + 1
+            self.changes += 1
+            self._sorted_terms = None
+            self._typo_index = None
+
+    def sync(self, records: Iterable[Dict], version: str = None):
+        """Bring the index in line with a full catalog snapshot."""
+        records = {str(r["id"]): r for r in records}
+        with self._lock:
+            for doc_id in list(self.slot_of):
+                if doc_id not in records:
+                    self.remove(doc_id)
+            for record in records.values():
+                self.add(record)
+            self.version = version
+
+            if self.path and (self.changes >= self.merge_every or self._segment is None):
+                self.merge(records.values())
+
+    def merge(self, records: Iterable[Dict]):
+        """Write every live record into a fresh segment and map it."""
+        with self._lock:
+            docs, postings = [], {}
+            for slot, record in enumerate(records):
+                terms = document_terms(record)
+                docs.append([str(record["id"]), len(terms), _fingerprint(terms)])
+                for term in terms:
+                    entry = postings.setdefault(term, {})
+                    entry[slot] = entry.get(slot, 0) + 1
+
+            if self._segment is not None:
+                self._segment.close()   # Windows cannot replace a mapped file
+                self._segment = None
+            _Segment.write(self.path, self.version, docs, postings)
+
+            self._reset()
+            self._segment = _Segment(self.path)
+            for doc_id, length, fingerprint in self._segment.docs:
+                self._add_doc(doc_id, length, fingerprint)
+
+    def close(self):
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+    # ---------- lookup ----------
+
+    def _postings(self, term: str) -> Iterable[Tuple[int, int]]:
+        if self._segment is not None:
+            yield from self._segment.postings(term)
+        yield from self.delta.get(term, {}).items()
+
+    def _df(self, term: str) -> int:
+        df = len(self.delta.get(term, ()))
+        if self._segment is not None and term in self._segment.terms:
+            df += self._segment.terms[term][1]
+        return df
+
+    def _vocabulary(self) -> List[str]:
+        if self._sorted_terms is None:
+            terms = set(self.delta)
+            if self._segment is not None:
+                terms.update(self._segment.terms)
+            self._sorted_terms = sorted(terms)
+        return self._sorted_terms
+
+    def _typos(self, term: str) -> List[str]:
+        limit = 1 if len(term) < 8 else 2
+        if len(term) < 4:
+            return []
+        if self._typo_index is None:
+            # Single-deletion neighbourhoods (SymSpell): a shared deletion
+            # covers one insert, delete or substitution on either side
+            index = {}
+            for known in self._vocabulary():
+                if len(known) >= 4:
+                    for key in [known] + _deletes(known):
+                        index.setdefault(key, set()).add(known)
+            self._typo_index = index
+
+        candidates = set()
+        for key in [term] + _deletes(term):
+            candidates |= self._typo_index.get(key, set())
+        return sorted(c for c in candidates if c != term and _within(term, c, limit))
+
+    def expand(self, term: str, is_last: bool = False) -> List[Tuple[str, float]]:
+        """Index terms a query term matches, with a weight per match kind."""
+        vocabulary = self._vocabulary()
+        expansions = []
+        if self._df(term):
+            expansions.append((term, 1.0))
+
+        # The last word may still be being typed; short words only match exactly
+        if is_last or not expansions:
+            if len(term) >= 3:
+                start = bisect_left(vocabulary, term)
+                for known in vocabulary[start:start + PREFIX_LIMIT + 1]:
+                    if not known.startswith(term):
+                        break
+                    if known != term:
+                        expansions.append((known, PREFIX_WEIGHT))
+
+        if not expansions:
+            expansions = [(known, TYPO_WEIGHT) for known in self._typos(term)]
+        return expansions
+
+    def search(self, query: str, limit: int = 20, allowed=None) -> List[Tuple[str, float]]:
+        """(doc id, score) pairs, best first. `allowed` optionally restricts ids."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        with self._lock:
+            n = len(self.slot_of)
+            if not n:
+                return []
+            avg_length = self.total_length / n
+            scores: Dict[int, float] = {}
+
+            unique = list(dict.fromkeys(terms))
+            for position, term in enumerate(unique):
+                # A query term scores once per document: its best expansion
+                best: Dict[int, float] = {}
+                for known, weight in self.expand(term, is_last=position == len(unique) - 1):
+                    df = self._df(known)
+                    idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                    for slot, tf in self._postings(known):
+                        if slot in self.deleted:
+                            continue
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[slot] / avg_length)
+                        score = weight * idf * tf * (BM25_K1 + 1) / (tf + norm)
+                        if score > best.get(slot, 0.0):
+                            best[slot] = score
+                for slot, score in best.items():
+                    scores[slot] = scores.get(slot, 0.0) + score
+
+            ranked = (
+                (score, self.doc_ids[slot]) for slot, score in scores.items()
+                if allowed is None or self.doc_ids[slot] in allowed
+            )
+            return [(doc_id, round(score, 4)) for score, doc_id in heapq.nlargest(limit, ranked)]
@@ -0,0 +1,330 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+from persistence import FileLock, GroupCommitter, atomic_write_json, atomic_write_text
+
+
+# ================== ENGINE CONFIG ==================
+# "wal"  -> append-only log + in-memory indexes (default)
+# "json" -> legacy single db.json rewritten on every save
+DB_ENGINE = os.getenv("DB_ENGINE", "wal")
+
+# Rewrite the snapshot once this many records sit in the log
+COMPACT_EVERY = int(os.getenv("DB_COMPACT_EVERY", "1000"))
+
+# fsync after every log append (safer, slower)
+DB_FSYNC = os.getenv("DB_FSYNC", "0") == "1"
+
+# Batch appends arriving within this many ms into one fsync (0 = off)
+DB_GROUP_COMMIT_MS = float(os.getenv("DB_GROUP_COMMIT_MS", "0"))
+# ====================================================
+
+
+class StorageEngine:
+    """Interface every storage backend implements."""
+
+    def get_user(self, user_id: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def get_user_by_email(self, email: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def insert_user(self, user: Dict):
+        raise NotImplementedError
+
+    def update_user(self, user_id: str, fields: Dict) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def all_users(self) -> List[Dict]:
+        raise NotImplementedError
+
+    def replace_all(self, users: List[Dict]):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class JsonFileEngine(StorageEngine):
+    """Original behaviour: the whole db.json is parsed and rewritten per call."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = FileLock(path)
+        with self._lock:
+            if not os.path.exists(path):
+                self._write({"users": []})
+
+    def _read(self) -> Dict:
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def _write(self, data: Dict):
+        atomic_write_json(self.path, data, indent=2)
+
+    def get_user(self, user_id):
+        return next((u for u in self._read()["users"] if u["id"] == user_id), None)
+
+    def get_user_by_email(self, email):
+        return next((u for u in self._read()["users"] if u.get("email") == email), None)
+
+    def insert_user(self, user):
+        with self._lock:
+            data = self._read()
+            data["users"].append(user)
+            self._write(data)
+
+    def update_user(self, user_id, fields):
+        with self._lock:
+            data = self._read()
+            for user in data["users"]:
+                if user["id"] == user_id:
+                    user.update(fields)
+                    self._write(data)
+                    return user
+        return None
+
+    def all_users(self):
+        return self._read()["users"]
+
+    def replace_all(self, users):
+        with self._lock:
+            self._write({"users": users})
+
+
+class LogStructuredEngine(StorageEngine):
+    """
+    Append-only write-ahead log with periodic compaction.
+
+    Files (next to db.json):
+      db.snapshot.json  -> compacted {"users": [...]}
+      db.wal            -> one JSON record per line: put / patch
+
+    All users live in memory, indexed by id (primary) and email (secondary),
+    so reads are dict lookups and an update appends one small log line
+    instead of rewriting every other user.
+
+    Several uvicorn workers can share the files: appends and compaction
+    happen under a cross-process lock, and each process tails the log
+    (one stat() per call) to pick up records written by the others.
+    """
+
+    def __init__(
+        self,
+        legacy_path: str,
+        compact_every: int = COMPACT_EVERY,
+        fsync: bool = DB_FSYNC,
+        group_commit_ms: float = DB_GROUP_COMMIT_MS
+    ):
+        base, _ = os.path.splitext(legacy_path)
+        self.legacy_path = legacy_path
+        self.snapshot_path = base + ".snapshot.json"
+        self.wal_path = base + ".wal"
+        self.compact_every = compact_every
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(self.wal_path)
+        self._users: Dict[str, Dict] = {}
+        self._by_email: Dict[str, str] = {}
+        self._wal_records = 0
+        self._wal_offset = 0
+        self._wal_inode = None
+
+        with self._file_lock:
+            self._recover()
+
+        self._committer = None
+        if group_commit_ms > 0:
+            # Group commit only makes sense when every batch is fsynced
+            self.fsync = True
+            self._committer = GroupCommitter(self._write_records, window=group_commit_ms / 1000)
+
+    # ---------- startup / tailing ----------
+
+    def _recover(self):
+        self._users.clear()
+        self._by_email.clear()
+        self._wal_records = 0
+        self._wal_offset = 0
+
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                users = json.load(f)["users"]
+        elif os.path.exists(self.legacy_path) and not os.path.exists(self.wal_path):
+            # First start on this engine: import the old db.json once
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                users = json.load(f).get("users", [])
+            print(f"📥 Imported {len(users)} users from {self.legacy_path}")
+        else:
+            users = []
+
+        for user in users:
+            self._index(user)
+
+        if not os.path.exists(self.snapshot_path):
+            atomic_write_json(self.snapshot_path, {"users": users})
+        if not os.path.exists(self.wal_path):
+            atomic_write_text(self.wal_path, "")
+
+        self._wal_inode = os.stat(self.wal_path).st_ino
+        self._read_wal_tail()
+        self._drop_torn_tail()
+
+    def _read_wal_tail(self):
+        with open(self.wal_path, "rb") as f:
+            f.seek(self._wal_offset)
+            chunk = f.read()
+
+        # Only consume complete lines; a partial tail is another writer mid-append
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                print("⚠️ Ignoring corrupt WAL record")
+                continue
+            self._apply(record)
+            self._wal_records += 1
+        self._wal_offset += end
+
+    def _drop_torn_tail(self):
+        """
+        Cut off a partial last line. Appends happen under the file lock, so
+        with the lock held a partial line is a write torn by a crash; the
+        next append would otherwise be glued onto it and lost with it.
+        Caller holds the file lock.
+        """
+        if os.path.getsize(self.wal_path) > self._wal_offset:
+            print("⚠️ Dropping torn WAL record")
+            with open(self.wal_path, "r+b") as f:
+                f.truncate(self._wal_offset)
+
+    def _catch_up(self):
+        """Apply records other processes appended since our last look."""
+        try:
+            st = os.stat(self.wal_path)
+        except FileNotFoundError:
+            return
+        if st.st_ino != self._wal_inode or st.st_size < self._wal_offset:
+            # Another process compacted: reload snapshot + new log. Under
+            # the file lock: _recover() may truncate a torn tail or create
+            # files, which must never race another process's append
+            with self._file_lock:
+                self._recover()
+        elif st.st_size > self._wal_offset:
+            self._read_wal_tail()
+
+    def _index(self, user: Dict):
+        old = self._users.get(user["id"])
+        if old and old.get("email") and old.get("email") != user.get("email"):
+            self._by_email.pop(old["email"], None)
+        self._users[user["id"]] = user
+        if user.get("email"):
+            self._by_email[user["email"]] = user["id"]
+
+    def _apply(self, record: Dict):
+        if record["op"] == "put":
+            self._index(record["user"])
+        elif record["op"] == "patch":
+            user = self._users.get(record["id"])
+            if user is not None:
+                self._index({**user, **record["fields"]})
+
+    # ---------- log ----------
+
+    def _write_records(self, records: List[Dict]):
+        with self._lock, self._file_lock:
+            self._catch_up()
+            self._drop_torn_tail()
+            data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+            with open(self.wal_path, "a", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            # Re-apply ours after anything we caught up on, so memory matches log order
+            for record in records:
+                self._apply(record)
+            self._wal_offset = os.stat(self.wal_path).st_size
+            self._wal_records += len(records)
+            if self._wal_records >= self.compact_every:
+                self._compact_locked()
+
+    def _append(self, record: Dict):
+        if self._committer:
+            self._committer.submit(record)
+        else:
+            self._write_records([record])
+
+    def _compact_locked(self):
+        atomic_write_json(self.snapshot_path, {"users": list(self._users.values())})
+        # New inode tells other processes to reload
+        atomic_write_text(self.wal_path, "")
+        self._wal_inode = os.stat(self.wal_path).st_ino
+        self._wal_offset = 0
+        self._wal_records = 0
+
+    def compact(self):
+        """Fold the log into a fresh snapshot and start an empty log."""
+        with self._lock, self._file_lock:
+            self._catch_up()
+            self._compact_locked()
+
+    # ---------- API ----------
+
+    def get_user(self, user_id):
+        with self._lock:
+            self._catch_up()
+            return self._users.get(user_id)
+
+    def get_user_by_email(self, email):
+        with self._lock:
+            self._catch_up()
+            user_id = self._by_email.get(email)
+            return self._users.get(user_id) if user_id is not None else None
+
+    def insert_user(self, user):
+        with self._lock:
+            self._index(dict(user))
+        self._append({"op": "put", "user": user})
+
+    def update_user(self, user_id, fields):
+        with self._lock:
+            self._catch_up()
+            user = self._users.get(user_id)
+            if user is None:
+                return None
+            updated = {**user, **fields}
+            self._index(updated)
+        self._append({"op": "patch", "id": user_id, "fields": fields})
+        return updated
+
+    def all_users(self):
+        with self._lock:
+            self._catch_up()
+            return list(self._users.values())
+
+    def replace_all(self, users):
+        with self._lock, self._file_lock:
+            self._users.clear()
+            self._by_email.clear()
+            for user in users:
+                self._index(dict(user))
+            self._compact_locked()
+
+    def close(self):
+        if self._committer:
+            self._committer.close()
+
+
+def create_engine(legacy_path: str, kind: str = DB_ENGINE) -> StorageEngine:
+    if kind == "json":
+        return JsonFileEngine(legacy_path)
+    if kind == "wal":
+        return LogStructuredEngine(legacy_path)
+    raise ValueError(f"Unknown DB_ENGINE: {kind}")
@@ -0,0 +1,12 @@
+from .harness import compare, latency_summary, load_results, measure, save_results
+from .workspace import SCALES, Workspace
+
+__all__ = [
+    "compare",
+    "latency_summary",
+    "load_results",
+    "measure",
+    "save_results",
+    "SCALES",
+    "Workspace",
+]
@@ -0,0 +1,107 @@
+# Run from core/:
+#   python -m benchmarks run --scale small
+#   python -m benchmarks run --scale medium --baseline benchmarks/results/medium.json
+#   python -m benchmarks compare old.json new.json
+#   python -m benchmarks generate users --count 1000000 --out /tmp/db.json
+
+import argparse
+import atexit
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from benchmarks import generators
+from benchmarks.harness import BENCH_THRESHOLD, compare, environment, load_results, save_results
+from benchmarks.workspace import SCALES, Workspace
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def run(args) -> int:
+    workdir = args.workdir
+    if workdir is None:
+        workdir = tempfile.mkdtemp(prefix="benchmarks-")
+        # Registered first, so it runs after the services' own exit hooks (session flush ...)
+        atexit.register(shutil.rmtree, workdir, ignore_errors=True)
+    ws = Workspace(os.path.join(workdir, f"{args.scale}-{args.seed}"), args.scale, args.seed)
+    ws.prepare()
+
+    # Imported after prepare(): the services read their env settings on import
+    from benchmarks import macro, micro
+
+    results = {}
+    if "micro" in args.suite:
+        results.update(micro.run(ws, args.only))
+    if "macro" in args.suite:
+        results.update(macro.run(ws, args.only))
+
+    meta = {**environment(), "scale": args.scale, "seed": args.seed, "sizes": ws.scale, "suites": args.suite}
+    out = args.out or os.path.join(RESULTS_DIR, f"{args.scale}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    save_results(out, meta, results)
+
+    if args.baseline:
+        return _report(compare(load_results(args.baseline), {"meta": meta, "results": results}, args.threshold))
+    return 0
+
+
+def _report(regressions) -> int:
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("\n✅ No regressions")
+    return 0
+
+
+def generate(args) -> int:
+    if args.kind == "users":
+        generators.write_users_db(args.out, args.count, args.seed)
+    else:
+        make = {
+            "opportunities": generators.opportunities,
+            "students": generators.students,
+            "sms": generators.sms_conversations,
+            "pages": generators.scraped_pages,
+        }[args.kind]
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(make(args.count, args.seed), f, ensure_ascii=False)
+    print(f"✅ {args.count:,} {args.kind} written to {args.out}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Seeded micro/macro benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("run", help="generate data, run benchmarks, write JSON results")
+    p.add_argument("--scale", choices=sorted(SCALES), default="small")
+    p.add_argument("--seed", type=int, default=generators.DEFAULT_SEED)
+    p.add_argument("--suite", nargs="+", choices=["micro", "macro"], default=["micro", "macro"])
+    p.add_argument("--only", nargs="+", help="micro groups (backend recommender sms scraper) / macro name parts")
+    p.add_argument("--out", help="results file (default benchmarks/results/<scale>.json)")
+    p.add_argument("--workdir", help="keep generated data here and reuse it on the next run")
+    p.add_argument("--baseline", help="results file to compare against; exit 1 on regression")
+    p.add_argument("--threshold", type=float, default=BENCH_THRESHOLD)
+    p.set_defaults(func=run)
+
+    p = commands.add_parser("compare", help="compare two results files; exit 1 on regression")
+    p.add_argument("baseline")
+    p.add_argument("current")
+    p.add_argument("--threshold", type=float, default=BENCH_THRESHOLD)
+    p.set_defaults(func=lambda a: _report(compare(load_results(a.baseline), load_results(a.current), a.threshold)))
+
+    p = commands.add_parser("generate", help="write one synthetic data set to a file")
+    p.add_argument("kind", choices=["users", "opportunities", "students", "sms", "pages"])
+    p.add_argument("--count", type=int, required=True)
+    p.add_argument("--seed", type=int, default=generators.DEFAULT_SEED)
+    p.add_argument("--out", required=True)
+    p.set_defaults(func=generate)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+# benchmarks/generators.py
+#
+# Seeded synthetic data shaped like the real files: backend users
+# (db.json), opportunities (ai/data + backend catalog fields), SMS
+# conversations and scraped pages (scripts/scraper log records).
+# The same seed always gives the same data; deadlines are offsets from
+# `today` so the share of expired / closing-soon records stays stable.
+
+import hashlib
+import json
+import random
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# ===== CONFIG =====
+DEFAULT_SEED = 1234
+# bcrypt("benchmark", cost 4) for every user; hashing a million passwords would dominate generation
+PASSWORD_HASH = "$2b$04$7qKjzNrJoorwX9OkjdpnvulITcPvLr3BT42Anzx/Up9t/x7Ypgu4a"
+# ==================
+
+STATES = ["Odisha", "Maharashtra", "West Bengal", "Bihar", "Uttar Pradesh", "Karnataka",
+          "Tamil Nadu", "Delhi", "Gujarat", "Rajasthan", "Assam", "Kerala"]
+STUDENT_TYPES = ["Undergraduate", "Postgraduate", "Diploma", "PhD", "Other"]
+GENDERS = ["Female", "Male", "Prefer not to say"]
+CATEGORIES = ["General", "OBC", "SC", "ST", "EWS"]
+LANGUAGES = ["en", "hi", "or", "mr", "bn"]
+INTERESTS = ["IT", "Engineering", "Sports", "Education", "Government", "Arts", "Medicine",
+             "Agriculture", "Finance", "Law", "Design", "Research"]
+INTENTS = ["Scholarships", "Fellowships", "Schemes", "Education Loans", "Internships",
+           "Hackathons", "Competitions"]
+
+KINDS = ["Scholarship", "Internship", "Scheme", "Fellowship"]
+LEVELS = ["UG", "PG", "Diploma", "PhD", "School"]
+PROVIDERS = ["Ministry of Education", "AICTE", "UGC", "Ministry of Social Justice",
+             "State Government", "DST", "CSIR", "NITI Aayog", "Tata Trusts", "Infosys Foundation"]
+NAME_WORDS = ["National", "Pragati", "Saksham", "Merit", "Kaushal", "Vikas", "Shiksha", "Inspire",
+              "Ishan", "Uday", "Post Matric", "Pre Matric", "Central Sector", "Research",
+              "Digital", "Green", "Rural", "Women", "Startup", "Innovation", "Talent", "Yuva"]
+TOPICS = ["engineering", "medicine", "arts", "science", "commerce", "law", "design", "agriculture",
+          "computer science", "data science", "public policy", "nursing"]
+
+
+def _rng(seed: int, stream: str) -> random.Random:
+    """One independent generator per data set, so adding users never changes opportunities."""
+    return random.Random(f"{seed}:{stream}")
+
+
+# ---------- users ----------
+
+def iter_users(count: int, seed: int = DEFAULT_SEED) -> Iterator[Dict]:
+    """Backend user records as stored in db.json / db.snapshot.json."""
+    rng = _rng(seed, "users")
+    start = datetime(2025, 6, 1, 9)
+    for n in range(count):
+        email = f"user{n:07d}@example.com"
+        user = {
+            "id": email,
+            "email": email,
+            "password": PASSWORD_HASH,
+            "onboarding_completed": True,
+            "profile_completed": rng.random() < 0.9,
+            "created_at": (start + timedelta(minutes=rng.randrange(500_000))).isoformat(),
+            "student_type": rng.choice(STUDENT_TYPES),
+            "gender": rng.choice(GENDERS),
+            "location": rng.choice(STATES),
+            "category": rng.choice(CATEGORIES),
+            "semester": rng.randint(1, 8),
+            "language": rng.choice(LANGUAGES),
+            "voice_enabled": rng.random() < 0.3,
+            "interests": rng.sample(INTERESTS, rng.randint(1, 4)),
+            "intents": rng.sample(INTENTS, rng.randint(1, 3)),
+        }
+        if rng.random() < 0.6:
+            user["phone"] = f"+91{9000000000 + n}"
+        yield user
+
+
+def write_users_db(path: str, count: int, seed: int = DEFAULT_SEED) -> int:
+    """Write {"users": [...]} to `path` one record at a time."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"users": [')
+        for n, user in enumerate(iter_users(count, seed)):
+            if n:
+                f.write(",\n")
+            f.write(json.dumps(user))
+        f.write("]}")
+    return count
+
+
+def students(count: int, seed: int = DEFAULT_SEED) -> List[Dict]:
+    """Student profiles as the AI service receives them (/recommend, /eligibility)."""
+    rng = _rng(seed, "students")
+    result = []
+    for _ in range(count):
+        student = {
+            "age": rng.randint(15, 35),
+            "education_level": rng.choice(LEVELS),
+            "category": rng.choice(CATEGORIES),
+            "income": rng.choice([80_000, 150_000, 250_000, 400_000, 800_000, 1_500_000]),
+            "gender": rng.choice(["female", "male"]),
+            "state": rng.choice(STATES),
+            "disability": rng.random() < 0.05,
+        }
+        if rng.random() < 0.1:
+            student.pop("age")      # incomplete profile
+        result.append(student)
+    return result
+
+
+# ---------- opportunities ----------
+
+def _title(rng: random.Random, kind: str, n: int) -> str:
+    words = " ".join(rng.sample(NAME_WORDS, rng.randint(1, 3)))
+    return f"{words} {kind} {n}"
+
+
+def _rules(rng: random.Random) -> List[Dict]:
+    rules = []
+    if rng.random() < 0.25:
+        rules.append({"field": "category", "op": "in", "value": rng.sample(CATEGORIES[1:], rng.randint(1, 3))})
+    if rng.random() < 0.2:
+        rules.append({"field": "income", "op": "lte", "value": rng.choice([250_000, 450_000, 800_000])})
+    if rng.random() < 0.1:
+        rules.append({"field": "gender", "op": "eq", "value": "female"})
+    if rng.random() < 0.1:
+        rules.append({"field": "state", "op": "in", "value": rng.sample(STATES, rng.randint(1, 2))})
+    if rng.random() < 0.03:
+        rules.append({"field": "disability", "op": "eq", "value": True})
+    return rules
+
+
+def opportunities(count: int, seed: int = DEFAULT_SEED, today: Optional[date] = None) -> List[Dict]:
+    """
+    Opportunities in the AI module shape (category, education_level,
+    eligibility.min_age/max_age, declarative `rules`) plus the text fields
+    the backend catalog and search index read.
+    """
+    rng = _rng(seed, "opportunities")
+    today = today or date.today()
+    result = []
+    for n in range(count):
+        kind = rng.choice(KINDS)
+        min_age = rng.choice([None, 14, 16, 17, 18, 21])
+        max_age = rng.choice([None, 25, 27, 30, 35, 40])
+        eligibility = {}
+        if min_age is not None:
+            eligibility["min_age"] = min_age
+        if max_age is not None:
+            eligibility["max_age"] = max_age
+
+        # ~14% already expired, the rest spread over a year, a few open-ended
+        deadline = None
+        if rng.random() < 0.95:
+            deadline = (today + timedelta(days=rng.randint(-60, 365))).isoformat()
+
+        topic = rng.choice(TOPICS)
+        opp = {
+            "id": f"OPP{n:06d}",
+            "title": _title(rng, kind, n),
+            "category": kind,
+            "education_level": rng.choice(LEVELS + [None]),
+            "eligibility": eligibility,
+            "deadline": deadline,
+            "link": f"https://portal{n % 97}.example.gov.in/{kind.lower()}/{n}",
+            "provider": rng.choice(PROVIDERS),
+            "amount": f"₹{rng.choice([5, 10, 12, 25, 50, 75, 100])},000/year",
+            "description": f"{kind} for students of {topic} in {rng.choice(STATES)}",
+            "tags": rng.sample(INTERESTS, 2),
+        }
+        rules = _rules(rng)
+        if rules:
+            opp["rules"] = rules
+        result.append(opp)
+    return result
+
+
+# ---------- SMS conversations ----------
+
+# Openers per language, {kind} is the intent keyword
+OPENERS = {
+    "en": ["I need a {kind}", "any {kind} for me?", "looking for {kind} in my state", "{kind} please"],
+    "hi": ["mujhe {kind} chahiye", "kya koi {kind} hai", "mujhe {kind} kaise milega"],
+    "or": ["mu {kind} khojuchi", "mo paain {kind} darkar"],
+    "mr": ["mala {kind} pahije", "{kind} kaay ahe"],
+    "bn": ["amar {kind} lagbe", "ami {kind} chai"],
+}
+INTENT_WORDS = {
+    "job": ["job", "naukri"],
+    "internship": ["internship", "training"],
+    "scholarship": ["scholarship", "stipend"],
+    "fellowship": ["fellowship", "research grant"],
+    "scheme": ["scheme", "yojana"],
+    "education": ["padhai", "exam"],
+}
+ANSWERS = {
+    "age": lambda rng: str(rng.randint(15, 35)),
+    "education": lambda rng: rng.choice(["btech", "class 12", "ba 2nd year", "msc", "diploma", "phd", "10th pass"]),
+    "location": lambda rng: rng.choice(STATES),
+    "work_mode": lambda rng: rng.choice(["remote", "office", "hybrid", "any"]),
+    "field": lambda rng: rng.choice(TOPICS),
+    "category": lambda rng: rng.choice(CATEGORIES).lower(),
+    "gender": lambda rng: rng.choice(["female", "male", "f", "m"]),
+    "income": lambda rng: rng.choice(["1 lakh", "2.5 lakh", "50000", "5 lakh"]),
+    "class": lambda rng: rng.choice(["class 10", "class 12", "semester 3"]),
+    "subject": lambda rng: rng.choice(["maths", "physics", "english", "chemistry"]),
+}
+NOISE = ["hello", "hi", "??", "ok", "thanks", "help"]
+
+
+def sms_conversations(count: int, seed: int = DEFAULT_SEED) -> List[List[Tuple[str, str]]]:
+    """
+    Conversations of (phone, message): an opener in one of the five
+    languages, then one answer per question of that intent's flow
+    (ai/full_sms/data/questions.py), with the odd off-script message.
+    """
+    from ai.full_sms.data.questions import QUESTION_FLOW
+
+    rng = _rng(seed, "sms")
+    result = []
+    for n in range(count):
+        phone = f"+9180{n:08d}"
+        intent = rng.choice(sorted(INTENT_WORDS))
+        language = rng.choice(sorted(OPENERS))
+        opener = rng.choice(OPENERS[language]).format(kind=rng.choice(INTENT_WORDS[intent]))
+
+        messages = [opener]
+        for field, _ in QUESTION_FLOW.get(intent, []):
+            if rng.random() < 0.05:
+                messages.append(rng.choice(NOISE))
+            messages.append(ANSWERS[field](rng))
+        result.append([(phone, message) for message in messages])
+    return result
+
+
+# ---------- scraped pages ----------
+
+PAGE_CATEGORIES = ["SCHOLARSHIPS", "INTERNSHIPS", "FELLOWSHIPS", "SOCIAL_WELFARE", "SKILLS", "EDUCATION"]
+BOILERPLATE = ["Home About Us Contact Login Register", "Latest Updates Notices Downloads FAQ",
+               "Screen Reader Access Skip to main content", "Copyright Government of India. All rights reserved."]
+
+
+def _listing(rng: random.Random, n: int, today: date) -> str:
+    kind = rng.choice(["Scholarship", "Fellowship", "Internship", "Scheme", "Yojana"])
+    name = " ".join(w for w in rng.sample(NAME_WORDS, rng.randint(2, 3)))
+    parts = [f"{name} {kind} {n}"]
+    if rng.random() < 0.5:
+        parts.append(f"for {rng.choice(['SC', 'ST', 'OBC', 'Minority'])} students")
+    parts.append(f"is open to {rng.choice(['undergraduate', 'postgraduate', 'PhD', 'diploma', 'class 12'])} students.")
+    if rng.random() < 0.6:
+        parts.append(f"Age {rng.choice([16, 17, 18])} to {rng.choice([25, 30, 35])} years.")
+    if rng.random() < 0.5:
+        parts.append(f"Family income less than Rs {rng.choice(['2.5', '4.5', '8'])} lakh per annum.")
+    if rng.random() < 0.15:
+        parts.append("Only girls may apply.")
+    if rng.random() < 0.7:
+        parts.append(f"Award of Rs {rng.choice([10, 25, 50])},000 per year.")
+    if rng.random() < 0.8:
+        deadline = today + timedelta(days=rng.randint(-30, 200))
+        parts.append(f"Last date: {deadline.day} {deadline.strftime('%B')} {deadline.year}.")
+    return " ".join(parts)
+
+
+def scraped_pages(count: int, seed: int = DEFAULT_SEED, today: Optional[date] = None) -> List[Dict]:
+    """Scraper log records ({"category", "url", "content", "content_hash"}) listing 1-8 opportunities each."""
+    rng = _rng(seed, "pages")
+    today = today or date.today()
+    result = []
+    listing = 0
+    for n in range(count):
+        body = [rng.choice(BOILERPLATE)]
+        for _ in range(rng.randint(1, 8)):
+            body.append(_listing(rng, listing, today))
+            listing += 1
+        body.append(rng.choice(BOILERPLATE))
+        content = "\n".join(body)
+        result.append({
+            "category": rng.choice(PAGE_CATEGORIES),
+            "url": f"https://portal{n % 53}.example.gov.in/page/{n}",
+            "content": content,
+            "content_hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        })
+    return result
@@ -0,0 +1,149 @@
+# benchmarks/harness.py
+
+import gc
+import json
+import math
+import os
+import platform
+import subprocess
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# ===== CONFIG =====
+BENCH_REPEAT = int(os.getenv("BENCH_REPEAT", "5"))
+BENCH_WARMUP = int(os.getenv("BENCH_WARMUP", "1"))
+# A result regresses when its metric grows by more than this fraction
+BENCH_THRESHOLD = float(os.getenv("BENCH_THRESHOLD", "0.10"))
+# ==================
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of an unsorted list."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def measure(fn: Callable[[], object], ops: int = 1, repeat: int = BENCH_REPEAT,
+            warmup: int = BENCH_WARMUP, setup: Optional[Callable[[], None]] = None) -> Dict:
+    """
+    Time `fn` (which performs `ops` operations) `repeat` times after
+    `warmup` untimed runs. `setup` runs before every call, untimed.
+    Compared on the median time per operation.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            if setup:
+                setup()
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) / ops)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    median = percentile(samples, 50)
+    return {
+        "kind": "micro",
+        "ops": ops,
+        "repeat": repeat,
+        "median_us": round(median * 1e6, 3),
+        "min_us": round(min(samples) * 1e6, 3),
+        "max_us": round(max(samples) * 1e6, 3),
+        "ops_per_sec": round(1 / median, 1) if median else None,
+        "metric": "median_us",
+    }
+
+
+def latency_summary(latencies: List[float], wall: float, errors: int) -> Dict:
+    """Per-request latencies (seconds) of one macro scenario; compared on p95."""
+    ms = [s * 1000 for s in latencies]
+    return {
+        "kind": "macro",
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "max_ms": round(max(ms), 3),
+        "rps": round(len(latencies) / wall, 1) if wall else None,
+        "metric": "p95_ms",
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def save_results(path: str, meta: Dict, results: Dict[str, Dict]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+    print(f"💾 Results written to {path}")
+
+
+def load_results(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = BENCH_THRESHOLD) -> List[str]:
+    """
+    Print every benchmark present in both runs with its change and return
+    the names that got slower by more than `threshold`.
+    """
+    for key in ("scale", "seed", "python"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"⚠️ {key} differs: baseline {baseline['meta'].get(key)!r}, "
+                  f"current {current['meta'].get(key)!r}; numbers may not be comparable")
+
+    regressions = []
+    base_results, cur_results = baseline["results"], current["results"]
+    width = max((len(name) for name in cur_results), default=10)
+    print(f"\n{'benchmark':<{width}}  {'metric':<10} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in sorted(set(base_results) & set(cur_results)):
+        metric = cur_results[name]["metric"]
+        before, after = base_results[name].get(metric), cur_results[name].get(metric)
+        if not before or after is None:
+            continue
+        change = after / before - 1
+        if change > threshold:
+            mark = "❌"
+            regressions.append(name)
+        elif change < -threshold:
+            mark = "🚀"
+        else:
+            mark = "✅"
+        print(f"{name:<{width}}  {metric:<10} {before:>12.3f} {after:>12.3f} {change:>+7.1%} {mark}")
+
+    for name in sorted(set(base_results) - set(cur_results)):
+        print(f"➖ {name} missing from the current run")
+    for name in sorted(set(cur_results) - set(base_results)):
+        print(f"➕ {name} is new (no baseline)")
+    return regressions
@@ -0,0 +1,110 @@
+# benchmarks/macro.py
+#
+# Request-level benchmarks: the FastAPI apps served in-process through
+# httpx's ASGI transport (no sockets), with the middleware, validation
+# and threadpool hops of a real deployment. Workers run "sequences"
+# concurrently; a sequence is one request, or a whole SMS conversation
+# whose messages must arrive in order.
+
+import asyncio
+import random
+import time
+from typing import Dict, List, Tuple
+
+import httpx
+
+from benchmarks.harness import latency_summary
+
+Request = Tuple[str, str, Dict]          # method, url, httpx kwargs
+
+ELIGIBILITY_REQUESTS = 12
+
+
+async def _drive(app, sequences: List[List[Request]], concurrency: int, warmup: int) -> Dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Untimed, and not replayed below (SMS dialogs only move forward):
+        # first requests pay for lazy imports, index builds and model loads
+        for sequence in sequences[:warmup]:
+            for method, url, kwargs in sequence:
+                await client.request(method, url, **kwargs)
+
+        queue = asyncio.Queue()
+        for sequence in sequences[warmup:]:
+            queue.put_nowait(sequence)
+        latencies: List[float] = []
+        errors = 0
+
+        async def worker():
+            nonlocal errors
+            while not queue.empty():
+                sequence = queue.get_nowait()
+                for method, url, kwargs in sequence:
+                    start = time.perf_counter()
+                    response = await client.request(method, url, **kwargs)
+                    latencies.append(time.perf_counter() - start)
+                    if response.status_code >= 400:
+                        errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+    result = latency_summary(latencies, wall, errors)
+    result["concurrency"] = concurrency
+    return result
+
+
+def _scenarios(ws) -> Dict[str, Tuple[object, List[List[Request]]]]:
+    """name -> (app, sequences)"""
+    rng = random.Random(f"{ws.seed}:macro")
+    count = ws.scale["requests"]
+    scenarios = {}
+
+    backend = ws.backend()
+    headers = [{"Authorization": "Bearer " + backend.create_token(user_id)}
+               for user_id in ws.sample_user_ids(ws.scale["tokens"])]
+    words = [w for o in ws.opportunities[:500] for w in o["title"].split() if not w.isdigit()]
+    scenarios["backend GET /me"] = (backend.app, [
+        [("GET", "/me", {"headers": rng.choice(headers)})] for _ in range(count)
+    ])
+    scenarios["backend GET /opportunities"] = (backend.app, [
+        [("GET", "/opportunities", {"headers": rng.choice(headers), "params": {"page": rng.randint(1, 3)}})]
+        for _ in range(count)
+    ])
+    scenarios["backend GET /search"] = (backend.app, [
+        [("GET", "/search", {"params": {"q": " ".join(rng.sample(words, rng.randint(1, 2))).lower()}})]
+        for _ in range(count)
+    ])
+
+    ai_service = ws.ai_service()
+    scenarios["ai_service POST /recommend"] = (ai_service.app, [
+        [("POST", "/recommend", {"json": rng.choice(ws.students)})] for _ in range(count)
+    ])
+    # Answers for every opportunity in the catalog (seconds per request at
+    # 10k+), so a fixed handful is enough to track it
+    scenarios["ai_service POST /eligibility"] = (ai_service.app, [
+        [("POST", "/eligibility", {"json": rng.choice(ws.students)})] for _ in range(ELIGIBILITY_REQUESTS)
+    ])
+
+    sms = ws.sms_app()
+    scenarios["full_sms POST /sms/webhook"] = (sms.app, [
+        [("POST", "/sms/webhook", {"data": {"From": phone, "Body": message, "MessageSid": f"SM{n}-{i}"}})
+         for i, (phone, message) in enumerate(conversation)]
+        for n, conversation in enumerate(ws.conversations)
+    ])
+    return scenarios
+
+
+def run(ws, only=None) -> Dict[str, Dict]:
+    concurrency = ws.scale["concurrency"]
+    results = {}
+    for name, (app, sequences) in _scenarios(ws).items():
+        if only and not any(word in name for word in only):
+            continue
+        print(f"🌐 macro: {name} (concurrency {concurrency})")
+        result = asyncio.run(_drive(app, sequences, concurrency, warmup=min(concurrency, len(sequences) // 10)))
+        print(f"   {result['requests']} requests  p50 {result['p50_ms']:.2f} ms  p95 {result['p95_ms']:.2f} ms  "
+              f"{result['rps']:.0f} req/s  errors {result['errors']}")
+        results["macro." + name] = result
+    return results
@@ -0,0 +1,159 @@
+# benchmarks/micro.py
+#
+# Function-level benchmarks. Each group takes the Workspace and returns
+# {name: result}; timings are per operation (one user, one message ...).
+
+import contextlib
+import io
+import itertools
+from typing import Callable, Dict
+
+from benchmarks.harness import measure
+
+GROUPS: Dict[str, Callable] = {}
+
+
+def group(name: str):
+    def register(fn):
+        GROUPS[name] = fn
+        return fn
+    return register
+
+
+@group("backend")
+def backend_benchmarks(ws) -> Dict[str, Dict]:
+    main = ws.backend()
+    results = {}
+
+    results["backend.load_db"] = measure(main.load_db)
+    data = main.load_db()
+    # Every call rewrites the whole snapshot; fewer rounds at 1M users
+    results["backend.save_db"] = measure(lambda: main.save_db(data), repeat=3)
+
+    tokens = ["Bearer " + main.create_token(user_id) for user_id in ws.sample_user_ids(ws.scale["tokens"])]
+
+    def resolve_all():
+        for token in tokens:
+            main.get_current_user(token)
+
+    def clear_caches():
+        main.token_cache.clear()
+        main.user_cache.clear()
+
+    # Cold: JWT decode + keyed lookup for every token; warm: both caches hit
+    results["backend.get_current_user.cold"] = measure(resolve_all, ops=len(tokens), setup=clear_caches)
+    results["backend.get_current_user.warm"] = measure(resolve_all, ops=len(tokens))
+    return results
+
+
+@group("recommender")
+def recommender_benchmarks(ws) -> Dict[str, Dict]:
+    from eligibility.columnar import EligibilityMatrix
+    from eligibility.engine import EligibilityPlan
+    from recommender.ranking import RankingIndex, rank_by_deadline
+    from recommender.recommender import eligible_indices, recommend_opportunities
+
+    opportunities, students = ws.opportunities, ws.students
+    results = {}
+
+    def build():
+        return EligibilityMatrix(opportunities), EligibilityPlan(opportunities), RankingIndex(opportunities)
+
+    results["recommender.build_indexes"] = measure(build, repeat=3)
+    matrix, plan, ranking = build()
+
+    results["recommender.recommend_opportunities"] = measure(
+        lambda: [recommend_opportunities(s, opportunities, matrix, plan) for s in students], ops=len(students)
+    )
+
+    eligible = [recommend_opportunities(s, opportunities, matrix, plan) for s in students]
+    results["recommender.rank_by_deadline"] = measure(
+        lambda: [rank_by_deadline(found) for found in eligible], ops=len(students)
+    )
+
+    # What /recommend actually runs: indices + match scores + top-k over the prebuilt ranking
+    def eligible_top_k(student):
+        candidates = eligible_indices(student, matrix, plan)
+        return ranking.top_k(candidates, match=matrix.match_scores(student, candidates))
+
+    results["recommender.eligible_top_k"] = measure(
+        lambda: [eligible_top_k(s) for s in students], ops=len(students)
+    )
+    return results
+
+
+@group("sms")
+def sms_benchmarks(ws) -> Dict[str, Dict]:
+    from ai.full_sms.core import segments, summarizer
+    from ai.full_sms.core.intent_detector import detect_intent
+    from ai.full_sms.core.keyword_matcher import analyze
+    from ai.full_sms.core.language_detector import detect_language
+    from ai.full_sms.core.response_generator import handle_sms
+    from ai.full_sms.data.knowledge_base import KNOWLEDGE_BASE
+    from ai.full_sms.services.translation_service import CATALOG, render
+
+    results = {}
+    messages = [message for conversation in ws.conversations for _, message in conversation]
+
+    # Cold: the keyword scan cache is emptied before every pass
+    results["sms.detect_intent"] = measure(
+        lambda: [detect_intent(m) for m in messages], ops=len(messages), setup=analyze.cache_clear
+    )
+    results["sms.detect_language"] = measure(
+        lambda: [detect_language(m) for m in messages], ops=len(messages), setup=analyze.cache_clear
+    )
+
+    # Each pass replays every conversation from the first message on new
+    # phone numbers, so the dialog really advances
+    passes = itertools.count()
+
+    def replay():
+        n = next(passes)
+        with contextlib.redirect_stdout(io.StringIO()):   # handle_sms logs every message
+            for conversation in ws.conversations:
+                for phone, message in conversation:
+                    handle_sms(message, f"{phone}-{n}")
+
+    results["sms.handle_sms"] = measure(replay, ops=len(messages))
+
+    # Long free-form replies: final answers in every language plus scraped text
+    texts = []
+    for language in CATALOG.languages():
+        for entry in KNOWLEDGE_BASE.values():
+            data = entry["general"]
+            text = render(data["message"], language)
+            texts.append(render("reply.with_links", language, text=text, links=", ".join(data["links"])))
+    texts.extend(page["content"][:700] for page in ws.pages)
+
+    def clear_summaries():
+        summarizer.summarize_if_needed.cache_clear()
+        segments.count_segments.cache_clear()
+
+    results["sms.summarize_if_needed"] = measure(
+        lambda: [summarizer.summarize_if_needed(t) for t in texts], ops=len(texts), setup=clear_summaries
+    )
+    return results
+
+
+@group("scraper")
+def scraper_benchmarks(ws) -> Dict[str, Dict]:
+    from extract_opportunities import extract_from_text
+
+    pages = ws.pages
+    return {
+        "scraper.extract_from_text": measure(
+            lambda: [extract_from_text(p["content"], p["url"], p["category"]) for p in pages], ops=len(pages)
+        )
+    }
+
+
+def run(ws, groups=None) -> Dict[str, Dict]:
+    results = {}
+    for name, fn in GROUPS.items():
+        if groups and name not in groups:
+            continue
+        print(f"⏱️  micro: {name}")
+        for bench, result in fn(ws).items():
+            print(f"   {bench:<40} {result['median_us']:>12.2f} µs/op")
+            results[bench] = result
+    return results
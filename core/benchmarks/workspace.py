@@ -0,0 +1,111 @@
+# benchmarks/workspace.py
+
+import importlib
+import json
+import os
+import random
+import sys
+from functools import cached_property
+from typing import Dict, List
+
+from benchmarks import generators
+
+CORE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(CORE_DIR, "backend")
+AI_DIR = os.path.join(CORE_DIR, "ai")
+SCRAPER_DIR = os.path.join(CORE_DIR, "scripts", "scraper")
+
+# ===== CONFIG =====
+# users/opportunities span the sizes from the request (10k-1M, 1k-100k);
+# the rest bound how much work one benchmark run does
+SCALES = {
+    "small": {"users": 10_000, "opportunities": 1_000, "students": 200, "conversations": 100,
+              "pages": 100, "tokens": 500, "requests": 300, "concurrency": 8},
+    "medium": {"users": 100_000, "opportunities": 10_000, "students": 500, "conversations": 300,
+               "pages": 500, "tokens": 2_000, "requests": 1_000, "concurrency": 16},
+    "large": {"users": 1_000_000, "opportunities": 100_000, "students": 1_000, "conversations": 1_000,
+              "pages": 2_000, "tokens": 5_000, "requests": 2_000, "concurrency": 32},
+}
+# ==================
+
+
+class Workspace:
+    """
+    Synthetic data for one run, written under `root`, and the services
+    pointed at it through their own env settings (DB_PATH, CATALOG_PATHS,
+    OPPORTUNITY_FILES, SEARCH_SEGMENT_PATH, SMS_STATE_FILE), so nothing
+    under backend/ or ai/data is read or written.
+
+    Call prepare() before importing any service module: they read their
+    settings at import time.
+    """
+
+    def __init__(self, root: str, scale: str = "small", seed: int = generators.DEFAULT_SEED):
+        self.root = root
+        self.scale_name = scale
+        self.scale = SCALES[scale]
+        self.seed = seed
+        self.db_path = os.path.join(root, "db.json")
+        self.opportunities_path = os.path.join(root, "opportunities.json")
+
+    def prepare(self):
+        os.makedirs(self.root, exist_ok=True)
+        if not os.path.exists(self.db_path):
+            print(f"👥 Generating {self.scale['users']:,} users")
+            generators.write_users_db(self.db_path, self.scale["users"], self.seed)
+        with open(self.opportunities_path, "w", encoding="utf-8") as f:
+            json.dump(self.opportunities, f)
+        # Dialogs start over on every run
+        for name in ("user_sessions.json", "user_sessions.journal"):
+            path = os.path.join(self.root, name)
+            if os.path.exists(path):
+                os.remove(path)
+
+        os.environ.update({
+            "DB_PATH": self.db_path,
+            "CATALOG_PATHS": self.opportunities_path,
+            "CATALOG_RELOAD_SECONDS": "3600",
+            "OPPORTUNITY_FILES": self.opportunities_path,
+            "SEARCH_SEGMENT_PATH": os.path.join(self.root, "search.segment"),
+            "SMS_STATE_FILE": os.path.join(self.root, "user_sessions.json"),
+        })
+        for path in (SCRAPER_DIR, AI_DIR, BACKEND_DIR, CORE_DIR):
+            if path not in sys.path:
+                sys.path.insert(0, path)
+
+    # ---------- data ----------
+
+    @cached_property
+    def opportunities(self) -> List[Dict]:
+        print(f"📋 Generating {self.scale['opportunities']:,} opportunities")
+        return generators.opportunities(self.scale["opportunities"], self.seed)
+
+    @cached_property
+    def students(self) -> List[Dict]:
+        return generators.students(self.scale["students"], self.seed)
+
+    @cached_property
+    def conversations(self):
+        return generators.sms_conversations(self.scale["conversations"], self.seed)
+
+    @cached_property
+    def pages(self) -> List[Dict]:
+        return generators.scraped_pages(self.scale["pages"], self.seed)
+
+    def sample_user_ids(self, count: int) -> List[str]:
+        rng = random.Random(f"{self.seed}:sample")
+        picks = rng.sample(range(self.scale["users"]), min(count, self.scale["users"]))
+        return [f"user{n:07d}@example.com" for n in picks]
+
+    # ---------- services ----------
+
+    def backend(self):
+        """backend/main.py, running on the synthetic db.json and catalog."""
+        return importlib.import_module("backend.main")
+
+    def ai_service(self):
+        """ai/api/ai_service.py, running on the synthetic catalog."""
+        return importlib.import_module("api.ai_service")
+
+    def sms_app(self):
+        return importlib.import_module("ai.full_sms.main")
@@ -0,0 +1,16 @@
+from .atomic import atomic_write_bytes, atomic_write_json, atomic_write_text, fsync_dir
+from .locks import FileLock, KeyedLock
+from .group_commit import GroupCommitter
+from .stream import iter_json_array, iter_json_object
+
+__all__ = [
+    "atomic_write_bytes",
+    "atomic_write_json",
+    "atomic_write_text",
+    "fsync_dir",
+    "FileLock",
+    "KeyedLock",
+    "GroupCommitter",
+    "iter_json_array",
+    "iter_json_object",
+]
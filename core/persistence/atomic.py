@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+from typing import Any
+
+
+def fsync_dir(path: str):
+    """Persist a rename by syncing the containing directory (no-op on Windows)."""
+    if os.name != "posix":
+        return
+    fd = os.open(path or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """
+    Replace `path` in one step: write a temp file in the same folder,
+    fsync it, then rename over the target. Readers see the old or the
+    new file, never a torn one.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix="." + os.path.basename(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    fsync_dir(folder)
+
+
+def atomic_write_text(path: str, text: str, encoding: str = "utf-8"):
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_write_json(path: str, data: Any, indent: int = None):
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=indent))
@@ -0,0 +1,77 @@
+import threading
+from typing import Callable, List
+
+
+class GroupCommitter:
+    """
+    Batches writes that arrive within `window` seconds into one call of
+    `write_batch` (which should write everything and fsync once).
+
+    `submit()` blocks until its record is durable, so callers keep the
+    same guarantee as a per-write fsync at a fraction of the cost.
+    """
+
+    def __init__(self, write_batch: Callable[[List], None], window: float = 0.005, max_batch: int = 512):
+        self.write_batch = write_batch
+        self.window = window
+        self.max_batch = max_batch
+
+        self._cond = threading.Condition()
+        self._pending: List = []
+        self._waiters: List[dict] = []
+        self._closed = False
+        self.batches = 0
+        self.records = 0
+
+        self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+        self._thread.start()
+
+    def submit(self, record):
+        ticket = {"done": False, "error": None}
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("GroupCommitter is closed")
+            self._pending.append(record)
+            self._waiters.append(ticket)
+            self._cond.notify_all()
+            while not ticket["done"]:
+                self._cond.wait()
+        if ticket["error"] is not None:
+            raise ticket["error"]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+
+            # Let concurrent writers join this batch
+            if self.window > 0:
+                with self._cond:
+                    self._cond.wait_for(lambda: len(self._pending) >= self.max_batch or self._closed, self.window)
+
+            with self._cond:
+                batch, self._pending = self._pending, []
+                waiters, self._waiters = self._waiters, []
+
+            error = None
+            try:
+                self.write_batch(batch)
+            except Exception as e:
+                error = e
+
+            with self._cond:
+                self.batches += 1
+                self.records += len(batch)
+                for ticket in waiters:
+                    ticket["error"] = error
+                    ticket["done"] = True
+                self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
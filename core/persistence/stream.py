@@ -0,0 +1,116 @@
+import json
+import re
+from typing import Any, Iterator, Optional, Tuple
+
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+
+class _Reader:
+    """Buffered text reader that decodes one JSON value at a time."""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, got {self.peek()!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def separator(self, close: str) -> bool:
+        """Consume "," (True: another item follows) or the closing bracket (False)."""
+        char = self.peek()
+        self.pos += 1
+        if char == ",":
+            return True
+        if char == close:
+            return False
+        raise ValueError(f"Expected ',' or {close!r}, got {char!r}")
+
+
+def _object_items(reader: _Reader) -> Iterator[Tuple[str, Any]]:
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        yield key, reader
+        if not reader.separator("}"):
+            return
+
+
+def _array_items(reader: _Reader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if not reader.separator("]"):
+            return
+
+
+def iter_json_object(path: str) -> Iterator[Tuple[str, Any]]:
+    """
+    (key, value) pairs of a top-level JSON object, read incrementally:
+    memory holds one value at a time, not the whole file.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f)
+        for key, r in _object_items(reader):
+            yield key, r.value()
+
+
+def iter_json_array(path: str, key: Optional[str] = None) -> Iterator[Any]:
+    """
+    Items of a top-level JSON array, or of the array stored under `key`
+    in a top-level object ({"users": [...]}), read incrementally.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f)
+        if key is None:
+            yield from _array_items(reader)
+            return
+        for name, r in _object_items(reader):
+            if name == key:
+                yield from _array_items(r)
+            else:
+                r.value()   # skip
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional
+
+from persistence import atomic_write_json
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="ignore")).hexdigest()
+
+
+class CrawlState:
+    """
+    Per-URL validators from the previous run (ETag, Last-Modified) and
+    hashes of the raw body and of the extracted text.
+
+    Lets a run send conditional GETs and skip parsing pages that did not
+    change.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.urls: Dict[str, Dict] = {}
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.urls = json.load(f)
+
+    def headers_for(self, url: str) -> Dict[str, str]:
+        entry = self.urls.get(url, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def has_content(self, url: str) -> bool:
+        """True if a record for `url` was already written to the log."""
+        return "content_hash" in self.urls.get(url, {})
+
+    def known_urls(self):
+        return {url for url, entry in self.urls.items() if "content_hash" in entry}
+
+    def forget(self, url: str):
+        self.urls.pop(url, None)
+
+    def raw_unchanged(self, url: str, raw_hash: str) -> bool:
+        return self.urls.get(url, {}).get("raw_hash") == raw_hash
+
+    def content_unchanged(self, url: str, text_hash: str) -> bool:
+        return self.urls.get(url, {}).get("content_hash") == text_hash
+
+    def record(self, url: str, headers: Dict[str, str], raw_hash: Optional[str] = None,
+               text_hash: Optional[str] = None, changed: bool = False):
+        entry = self.urls.setdefault(url, {})
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        entry["checked_at"] = now
+
+        # `headers` uses lower-cased names (FetchResult.headers).
+        # Servers may drop validators on a 304; keep the old ones then
+        if headers.get("etag"):
+            entry["etag"] = headers["etag"]
+        if headers.get("last-modified"):
+            entry["last_modified"] = headers["last-modified"]
+        if raw_hash:
+            entry["raw_hash"] = raw_hash
+        if text_hash:
+            entry["content_hash"] = text_hash
+        if changed:
+            entry["changed_at"] = now
+
+    def save(self):
+        if self.path:
+            atomic_write_json(self.path, self.urls, indent=2)
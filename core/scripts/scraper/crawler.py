@@ -0,0 +1,193 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import aiohttp
+
+
+@dataclass
+class CrawlConfig:
+    concurrency: int = 32          # requests in flight across all hosts
+    per_host: int = 2              # requests in flight per host
+    host_delay: float = 2.0        # min seconds between request starts on one host
+    timeout: float = 10.0
+    retries: int = 3
+    backoff: float = 0.5           # first retry waits ~backoff, then doubles
+    max_backoff: float = 30.0
+    respect_robots: bool = True
+    verify_ssl: bool = False       # many government portals have broken chains
+    headers: Dict[str, str] = field(default_factory=lambda: {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+    })
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int = 0
+    text: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)   # lower-cased names
+    error: Optional[str] = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status < 300
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class _HostGate:
+    """Caps in-flight requests to one host and spaces out their start times."""
+
+    def __init__(self, per_host: int, delay: float):
+        self.slots = asyncio.Semaphore(per_host)
+        self.delay = delay
+        self.next_start = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait_turn(self):
+        async with self.lock:
+            now = time.monotonic()
+            wait = self.next_start - now
+            self.next_start = max(now, self.next_start) + self.delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class Crawler:
+    """
+    Async fetcher with one shared connection pool.
+
+    Throughput is bounded by the per-host limits, not by the slowest URL:
+    different hosts are fetched in parallel, while each host sees at most
+    `per_host` requests at a time, started `host_delay` seconds apart.
+
+        async with Crawler() as crawler:
+            async for result in crawler.crawl(urls):
+                ...
+    """
+
+    def __init__(self, config: CrawlConfig = None):
+        self.config = config or CrawlConfig()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._global = asyncio.Semaphore(self.config.concurrency)
+        self._hosts: Dict[str, _HostGate] = {}
+        self._robots: Dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.config.concurrency,
+            limit_per_host=self.config.per_host,
+            ssl=None if self.config.verify_ssl else False,
+            ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.config.headers,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._session.close()
+
+    def _gate(self, host: str) -> _HostGate:
+        gate = self._hosts.get(host)
+        if gate is None:
+            gate = self._hosts[host] = _HostGate(self.config.per_host, self.config.host_delay)
+        return gate
+
+    # ---------- robots.txt ----------
+
+    async def _load_robots(self, origin: str) -> Optional[RobotFileParser]:
+        try:
+            async with self._session.get(origin + "/robots.txt") as response:
+                if response.status >= 400:
+                    return None  # no robots.txt -> everything allowed
+                body = await response.text(errors="ignore")
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+        parser = RobotFileParser()
+        parser.parse(body.splitlines())
+        return parser
+
+    async def allowed(self, url: str) -> bool:
+        if not self.config.respect_robots:
+            return True
+
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        future = self._robots.get(origin)
+        if future is None:
+            # First caller fetches; concurrent callers for the same host await it
+            future = self._robots[origin] = asyncio.ensure_future(self._load_robots(origin))
+        parser = await future
+        return parser is None or parser.can_fetch(self.config.headers.get("User-Agent", "*"), url)
+
+    # ---------- fetching ----------
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.config.max_backoff)
+        delay = self.config.backoff * (2 ** (attempt - 1))
+        return min(delay, self.config.max_backoff) * random.uniform(0.8, 1.2)
+
+    async def fetch(self, url: str, headers: Dict[str, str] = None) -> FetchResult:
+        result = FetchResult(url=url)
+        if not await self.allowed(url):
+            result.error = "blocked by robots.txt"
+            return result
+
+        gate = self._gate(urlsplit(url).netloc)
+        for attempt in range(1, self.config.retries + 2):
+            result.attempts = attempt
+            retry_after = None
+            # Wait for the host first so a paced host doesn't hold a global slot
+            async with gate.slots:
+                await gate.wait_turn()
+                async with self._global:
+                    try:
+                        async with self._session.get(url, headers=headers) as response:
+                            result.status = response.status
+                            result.headers = {k.lower(): v for k, v in response.headers.items()}
+                            if response.status in RETRY_STATUSES:
+                                result.error = f"HTTP {response.status}"
+                                retry_after = result.headers.get("retry-after")
+                            elif response.status >= 400:
+                                result.error = f"HTTP {response.status}"
+                                return result
+                            else:
+                                result.text = await response.text(errors="ignore")
+                                result.error = None
+                                return result
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        result.error = f"{type(e).__name__}: {e}"
+
+            if attempt <= self.config.retries:
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+
+        return result
+
+    async def crawl(self, urls: Iterable[str], headers_for=None):
+        """
+        Fetch every URL concurrently, yielding FetchResults as they finish.
+
+        `headers_for(url)` may return extra request headers per URL.
+        """
+        tasks = [
+            asyncio.ensure_future(self.fetch(url, headers_for(url) if headers_for else None))
+            for url in urls
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
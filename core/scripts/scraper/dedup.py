@@ -0,0 +1,91 @@
+import re
+import zlib
+from typing import Dict, List, Optional, Set
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+
+
+def _norm(text: str) -> str:
+    return " ".join(re.sub(r"[^a-z0-9 ]+", " ", text.lower()).split())
+
+
+def shingles(text: str, size: int = 4) -> Set[int]:
+    """crc32 hashes of the character `size`-grams of normalized text."""
+    text = _norm(text)
+    if len(text) <= size:
+        return {zlib.crc32(text.encode())} if text else set()
+    return {zlib.crc32(text[i:i + size].encode()) for i in range(len(text) - size + 1)}
+
+
+class MinHashIndex:
+    """
+    Near-duplicate lookup with MinHash signatures and LSH banding.
+
+    Signatures are `bands * rows` ints per key; two keys become candidates
+    when any band matches exactly, and are duplicates when their estimated
+    Jaccard similarity reaches `threshold`. Lookups touch only the keys
+    sharing a band, not the whole catalog.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4, threshold: float = 0.7, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        # Deterministic (a, b) pairs so signatures are stable across runs
+        state = seed
+        self._params = []
+        for _ in range(bands * rows):
+            state = (state * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+            a = (state >> 3) % _PRIME or 1
+            state = (state * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+            self._params.append((a, (state >> 3) % _PRIME))
+        self._buckets: Dict[tuple, Set[str]] = {}
+        self._signatures: Dict[str, List[int]] = {}
+
+    def signature(self, features: Set[int]) -> List[int]:
+        if not features:
+            return [_MASK] * len(self._params)
+        return [min(((a * x + b) % _PRIME) & _MASK for x in features) for a, b in self._params]
+
+    def _bands(self, signature: List[int]):
+        for band in range(self.bands):
+            yield (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+
+    @staticmethod
+    def similarity(left: List[int], right: List[int]) -> float:
+        return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+    def find(self, signature: List[int]) -> Optional[str]:
+        """Key of the most similar indexed entry above the threshold, if any."""
+        best, best_score = None, self.threshold
+        seen = set()
+        for band in self._bands(signature):
+            for key in self._buckets.get(band, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                score = self.similarity(signature, self._signatures[key])
+                if score >= best_score:
+                    best, best_score = key, score
+        return best
+
+    def add(self, key: str, signature: List[int]):
+        self.remove(key)
+        self._signatures[key] = signature
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key: str):
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band in self._bands(signature):
+            bucket = self._buckets.get(band)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
+
+    def __len__(self):
+        return len(self._signatures)
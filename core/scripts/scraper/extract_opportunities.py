@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterable, List
+
+from dedup import MinHashIndex, shingles
+from field_patterns import (
+    find_age, find_amount, find_categories, find_deadline, find_education_level,
+    find_income_limit, find_titles, is_female_only
+)
+
+# ================== CONFIG ==================
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+DATA_DIR = os.path.join(PROJECT_ROOT, "data")
+COMPRESS = os.getenv("SCRAPER_COMPRESS", "0") == "1"
+LOG_FILE = os.path.join(DATA_DIR, "scraped_data.ndjson" + (".gz" if COMPRESS else ""))
+STATE_FILE = os.path.join(DATA_DIR, "extract_state.json")
+# The catalog the AI service loads (data/opportunities.json under core/ai)
+CATALOG_FILE = os.getenv(
+    "EXTRACT_CATALOG_FILE",
+    os.path.join(PROJECT_ROOT, "ai", "data", "opportunities.json")
+)
+
+# Scraper categories whose pages list schemes/scholarships worth extracting
+OPPORTUNITY_CATEGORIES = set(os.getenv(
+    "EXTRACT_CATEGORIES",
+    "SCHOLARSHIPS,INTERNSHIPS,FELLOWSHIPS,EDUCATION,SKILLS,SOCIAL_WELFARE,"
+    "STARTUPS,FINANCIAL,E_SERVICES,AGRICULTURE,BUSINESS"
+).split(","))
+CONTEXT_CHARS = int(os.getenv("EXTRACT_CONTEXT_CHARS", "600"))
+DEDUP_THRESHOLD = float(os.getenv("EXTRACT_DEDUP_THRESHOLD", "0.7"))
+# ============================================
+
+sys.path.insert(0, PROJECT_ROOT)
+
+from persistence import atomic_write_json
+from record_log import RecordLog
+
+FIELDS = ("deadline", "education_level", "amount")
+
+
+def opportunity_id(title: str) -> str:
+    key = " ".join(title.lower().split())
+    return "EXT-" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+
+
+def extract_from_text(text: str, url: str, source_category: str = "") -> List[Dict]:
+    """
+    Structured opportunities named in one page's text.
+
+    Each title found gets the text up to the next title (at most
+    CONTEXT_CHARS) as its context; fields are read from that window only,
+    so one listing page yields several independent records.
+    """
+    titles = list(find_titles(text))
+    records = {}
+    for n, (start, end, title, kind) in enumerate(titles):
+        stop = titles[n + 1][0] if n + 1 < len(titles) else len(text)
+        context = text[start:min(stop, start + CONTEXT_CHARS)]
+
+        rules = []
+        categories = find_categories(context)
+        if categories:
+            rules.append({"field": "category", "op": "in", "value": categories})
+        income = find_income_limit(context)
+        if income:
+            rules.append({"field": "income", "op": "lte", "value": income})
+        if is_female_only(context):
+            rules.append({"field": "gender", "op": "eq", "value": "female"})
+
+        record = {
+            "id": opportunity_id(title),
+            "title": title,
+            "category": kind,
+            "education_level": find_education_level(context),
+            "eligibility": find_age(context),
+            "deadline": find_deadline(context),
+            "amount": find_amount(context),
+            "link": url,
+            "rules": rules,
+            "source_category": source_category,
+        }
+
+        # A title repeated on the same page fills in whatever is missing
+        existing = records.get(record["id"])
+        if existing:
+            _fill(existing, record)
+        else:
+            records[record["id"]] = record
+    return list(records.values())
+
+
+def _fill(target: Dict, source: Dict):
+    for field in FIELDS:
+        if not target.get(field) and source.get(field):
+            target[field] = source[field]
+    for bound, value in (source.get("eligibility") or {}).items():
+        target.setdefault("eligibility", {}).setdefault(bound, value)
+    known = {rule["field"] for rule in target.get("rules", [])}
+    for rule in source.get("rules", []):
+        if rule["field"] not in known:
+            target.setdefault("rules", []).append(rule)
+
+
+class ExtractedCatalog:
+    """
+    The extracted opportunities plus which pages each one came from.
+
+    Pages are upserted one at a time: a changed page first withdraws the
+    records it contributed last run, then adds its new ones, merging into
+    near-duplicate titles already extracted from other portals.
+    """
+
+    def __init__(self, catalog_path: str, state_path: str, threshold: float = DEDUP_THRESHOLD):
+        self.catalog_path = catalog_path
+        self.state_path = state_path
+        self.records: Dict[str, Dict] = {}
+        self.pages: Dict[str, Dict] = {}       # url -> {"content_hash", "ids"}
+        self.index = MinHashIndex(threshold=threshold)
+        self.changed = False
+
+        if os.path.exists(catalog_path):
+            with open(catalog_path, "r", encoding="utf-8") as f:
+                for record in json.load(f):
+                    self.records[str(record["id"])] = record
+                    if record.get("sources"):
+                        self.index.add(str(record["id"]), self._signature(record["title"]))
+        if os.path.exists(state_path):
+            with open(state_path, "r", encoding="utf-8") as f:
+                self.pages = json.load(f)
+
+    def _signature(self, title: str):
+        return self.index.signature(shingles(title))
+
+    def unchanged(self, url: str, text_hash: str) -> bool:
+        return self.pages.get(url, {}).get("content_hash") == text_hash
+
+    def withdraw(self, url: str):
+        """Drop `url` as a source; records with no sources left are removed."""
+        page = self.pages.pop(url, None)
+        if not page:
+            return
+        for opp_id in page.get("ids", []):
+            record = self.records.get(opp_id)
+            if not record or url not in record.get("sources", []):
+                continue
+            record["sources"].remove(url)
+            if not record["sources"]:
+                del self.records[opp_id]
+                self.index.remove(opp_id)
+            elif record.get("link") == url:
+                record["link"] = record["sources"][0]
+        self.changed = True
+
+    def upsert_page(self, url: str, text_hash: str, extracted: Iterable[Dict]):
+        self.withdraw(url)
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        ids = []
+        for record in extracted:
+            signature = self._signature(record["title"])
+            match = self.index.find(signature)
+            if match is None and record["id"] in self.records:
+                match = record["id"]   # same id, unmanaged entry: take it over
+
+            if match is None:
+                record["sources"] = [url]
+                record["extracted_at"] = now
+                self.records[record["id"]] = record
+                self.index.add(record["id"], signature)
+                ids.append(record["id"])
+                continue
+
+            existing = self.records[match]
+            record_was_indexed = bool(existing.get("sources"))
+            _fill(existing, record)
+            sources = existing.setdefault("sources", [])
+            if url not in sources:
+                sources.append(url)
+            existing["extracted_at"] = now
+            if not record_was_indexed:
+                self.index.add(match, signature)
+            if match not in ids:
+                ids.append(match)
+
+        self.pages[url] = {"content_hash": text_hash, "ids": ids}
+        self.changed = True
+        return ids
+
+    def save(self):
+        if not self.changed:
+            return
+        records = sorted(self.records.values(), key=lambda r: str(r["id"]))
+        atomic_write_json(self.catalog_path, records, indent=2)
+        atomic_write_json(self.state_path, self.pages, indent=2)
+        self.changed = False
+
+
+def run(log: RecordLog, catalog: ExtractedCatalog, categories=OPPORTUNITY_CATEGORIES):
+    """Stream the current scraped corpus and upsert every changed page."""
+    stats = {"pages": 0, "skipped": 0, "extracted": 0, "removed": 0}
+    seen = set()
+
+    for record in log.iter_latest():
+        url = record["url"]
+        if record.get("category") not in categories:
+            continue
+        seen.add(url)
+        text_hash = record.get("content_hash") or hashlib.sha256(record["content"].encode()).hexdigest()
+        if catalog.unchanged(url, text_hash):
+            stats["skipped"] += 1
+            continue
+
+        ids = catalog.upsert_page(url, text_hash, extract_from_text(record["content"], url, record["category"]))
+        stats["pages"] += 1
+        stats["extracted"] += len(ids)
+        print(f"✅ {url}: {len(ids)} opportunities")
+
+    # Pages that disappeared from the corpus (or changed category)
+    for url in set(catalog.pages) - seen:
+        catalog.withdraw(url)
+        stats["removed"] += 1
+        print(f"🗑️ Withdrawn: {url}")
+
+    catalog.save()
+    return stats
+
+
+def main():
+    if not os.path.exists(LOG_FILE):
+        print(f"❌ {LOG_FILE} not found, run scrape_links.py first")
+        return
+
+    catalog = ExtractedCatalog(CATALOG_FILE, STATE_FILE)
+    stats = run(RecordLog(LOG_FILE), catalog)
+
+    print(f"\n🎉 DONE: {stats['pages']} pages extracted, {stats['skipped']} unchanged, "
+          f"{stats['removed']} withdrawn → {len(catalog.records)} opportunities")
+    print(f"📁 Catalog → {CATALOG_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import re
+from collections import Counter
+from datetime import date
+from typing import Dict, List, Optional
+
+# ================== TITLES ==================
+# "Post Matric Scholarship for SC Students", "PM-VIKAS Scheme",
+# "Pradhan Mantri Kaushal Vikas Yojana" ...
+KIND_WORDS = {
+    "scholarship": "Scholarship",
+    "scholarships": "Scholarship",
+    "fellowship": "Fellowship",
+    "fellowships": "Fellowship",
+    "internship": "Internship",
+    "internships": "Internship",
+    "scheme": "Scheme",
+    "schemes": "Scheme",
+    "yojana": "Scheme",
+    "loan": "Loan",
+}
+
+_NAME_WORD = r"(?:[A-Z][\w'&.\-]*|of|for|and|the|to)"
+TITLE_RE = re.compile(
+    r"((?:" + _NAME_WORD + r"\s+){1,8}"
+    r"(?:Scholarships?|Fellowships?|Internships?|Schemes?|Yojana|Loan)"
+    r"(?:\s+(?:for|to)\s+(?:[A-Z][\w\-]*\s*){1,5})?)"
+)
+
+MAX_NAME_WORDS = 6
+JOINERS = {"of", "for", "and", "the", "to"}
+# Menu/portal words that end a name when walking back from "Scheme" etc.
+NAV_WORDS = {"view", "all", "click", "here", "hear", "dashboard", "result", "results", "call",
+             "search", "home", "menu", "login", "register", "apply", "list", "resources",
+             "corner", "offices", "about", "us", "contact", "notice", "notices", "news",
+             "latest", "updates", "download", "downloads", "guidelines", "faq", "faqs",
+             "former", "secretaries", "monitoring", "evaluation", "applications", "application",
+             "or", "faq's", "features", "objective", "link", "create", "portal", "division",
+             "connection", "abhiyaan"}
+# Names made only of these say nothing about a specific opportunity
+GENERIC_WORDS = {"national", "revised", "new", "other", "major", "central", "sector", "the",
+                 "centrally", "sponsored", "government", "our", "and", "of", "for"}
+
+# ================== DATES ==================
+MONTHS = {m: i + 1 for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+)}
+
+_MONTH = r"(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+DATE_PATTERNS = [
+    (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"), ("y", "m", "d")),
+    (re.compile(r"(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{4})"), ("d", "m", "y")),
+    (re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s+" + _MONTH + r",?\s+(\d{4})", re.I), ("d", "M", "y")),
+    (re.compile(_MONTH + r"\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})", re.I), ("M", "d", "y")),
+]
+
+DEADLINE_CUE = re.compile(
+    r"(last date|deadline|closing date|apply by|apply before|closes on|extended (?:up ?to|till))",
+    re.I
+)
+
+# ================== MONEY / AGE / INCOME ==================
+MULTIPLIERS = {"lakh": 100000, "lakhs": 100000, "lac": 100000, "crore": 10000000, "k": 1000}
+
+AMOUNT_RE = re.compile(
+    r"((?:₹|rs\.?|inr)\s?([\d,]+(?:\.\d+)?)\s*(lakhs?|lac|crore|k)?(?:\s*(?:per|/)\s*(?:year|annum|month))?)",
+    re.I
+)
+AGE_RANGE_RE = re.compile(r"(\d{2})\s*(?:to|-|–|and)\s*(\d{2})\s*years", re.I)
+AGE_MAX_RE = re.compile(
+    r"(?:below|under|up ?to|not (?:more than|exceeding)|maximum age(?: of| limit)?|upper age limit(?: of)?)\s*(\d{2})\s*years",
+    re.I
+)
+AGE_MIN_RE = re.compile(r"(?:above|at least|minimum age(?: of)?)\s*(\d{2})\s*years", re.I)
+INCOME_RE = re.compile(
+    r"income[^.]{0,40}?(?:less than|below|not exceeding|not more than|up ?to|under|<|≤)\s*"
+    r"(?:₹|rs\.?|inr)?\s*([\d.,]+)\s*(lakhs?|lac|crore)?",
+    re.I
+)
+
+# ================== ELIGIBILITY WORDS ==================
+SOCIAL_CATEGORIES = [
+    (re.compile(r"\b(SC|[Ss]cheduled [Cc]astes?)\b"), "SC"),
+    (re.compile(r"\b(ST|[Ss]cheduled [Tt]ribes?)\b"), "ST"),
+    (re.compile(r"\b(OBC|other backward class(?:es)?)\b", re.I), "OBC"),
+    (re.compile(r"\bEWS\b"), "EWS"),
+    (re.compile(r"\bminorit(?:y|ies)\b", re.I), "Minority"),
+]
+FEMALE_RE = re.compile(r"\b(girls?|wom[ae]n|female)\b", re.I)
+EDUCATION_LEVELS = [
+    (re.compile(r"\b(ph\.?\s?d|doctoral)\b", re.I), "PhD"),
+    (re.compile(r"\b(post[\s-]?graduat\w*|PG|M\.?\s?Tech|masters?)\b"), "PG"),
+    (re.compile(r"\b(under[\s-]?graduat\w*|UG|B\.?\s?Tech|B\.?E\.|B\.?Sc|bachelor\w*|graduation)\b"), "UG"),
+    (re.compile(r"\b(diploma|polytechnic|ITI)\b", re.I), "Diploma"),
+    (re.compile(r"\b(class\s?(?:9|10|11|12|ix|x|xi|xii)|pre[\s-]?matric|post[\s-]?matric|school)\b", re.I), "School"),
+]
+
+
+def _to_number(value: str, unit: Optional[str]) -> Optional[int]:
+    try:
+        number = float(value.replace(",", ""))
+    except ValueError:
+        return None
+    return int(number * MULTIPLIERS.get((unit or "").lower(), 1))
+
+
+def parse_date(text: str) -> Optional[str]:
+    """First recognisable date in `text` as YYYY-MM-DD."""
+    best = None
+    for pattern, order in DATE_PATTERNS:
+        m = pattern.search(text)
+        if not m or (best and m.start() >= best[0]):
+            continue
+        parts = dict(zip(order, m.groups()))
+        try:
+            month = MONTHS[parts["M"][:3].lower()] if "M" in parts else int(parts["m"])
+            value = date(int(parts["y"]), month, int(parts["d"]))
+        except (KeyError, ValueError):
+            continue
+        best = (m.start(), value.isoformat())
+    return best[1] if best else None
+
+
+def find_deadline(text: str) -> Optional[str]:
+    for cue in DEADLINE_CUE.finditer(text):
+        found = parse_date(text[cue.end():cue.end() + 60])
+        if found:
+            return found
+    return None
+
+
+def find_amount(text: str) -> Optional[str]:
+    """First money figure that is not an income limit."""
+    limits = [m.span() for m in INCOME_RE.finditer(text)]
+    for m in AMOUNT_RE.finditer(text):
+        if not any(start <= m.start() < end for start, end in limits):
+            return m.group(1).strip()
+    return None
+
+
+def find_age(text: str) -> Dict[str, int]:
+    m = AGE_RANGE_RE.search(text)
+    if m:
+        low, high = sorted((int(m.group(1)), int(m.group(2))))
+        return {"min_age": low, "max_age": high}
+
+    ages = {}
+    m = AGE_MIN_RE.search(text)
+    if m:
+        ages["min_age"] = int(m.group(1))
+    m = AGE_MAX_RE.search(text)
+    if m:
+        ages["max_age"] = int(m.group(1))
+    return ages
+
+
+def find_income_limit(text: str) -> Optional[int]:
+    m = INCOME_RE.search(text)
+    return _to_number(m.group(1), m.group(2)) if m else None
+
+
+def find_categories(text: str) -> List[str]:
+    return [label for pattern, label in SOCIAL_CATEGORIES if pattern.search(text)]
+
+
+def find_education_level(text: str) -> Optional[str]:
+    counts = Counter()
+    for pattern, label in EDUCATION_LEVELS:
+        counts[label] += len(pattern.findall(text))
+    level, hits = counts.most_common(1)[0]
+    return level if hits else None
+
+
+def is_female_only(text: str) -> bool:
+    return bool(FEMALE_RE.search(text))
+
+
+def find_titles(text: str):
+    """(start, end, title, kind) for every opportunity-like name in `text`."""
+    for m in TITLE_RE.finditer(text):
+        words = m.group(1).split()
+        # The name ends at the last kind word before an optional "for ..." tail
+        anchor = max(i for i, w in enumerate(words) if w.lower().strip(".,") in KIND_WORDS
+                     and i > 0 and words[i - 1].lower() not in ("for", "to") or i == 0)
+        tail = words[anchor + 1:]
+
+        # Walk back from the anchor over the name itself; menu text ends it
+        head = []
+        for word in reversed(words[:anchor]):
+            lowered = word.lower()
+            if (lowered in NAV_WORDS or lowered in KIND_WORDS or word.endswith(".")
+                    or len(head) == MAX_NAME_WORDS):
+                break
+            head.insert(0, word)
+        while head and head[0].lower() in JOINERS:
+            head.pop(0)
+
+        kind_word = words[anchor].strip(".,")
+        if not head or kind_word.lower().endswith("s") and kind_word.lower() != "yojana":
+            continue  # a bare kind word or a plural section heading
+        if all(w.lower() in GENERIC_WORDS for w in head):
+            continue
+
+        title = " ".join(head + [kind_word] + tail).strip(" -.")
+        yield m.start(), m.end(), title, KIND_WORDS[kind_word.lower()]
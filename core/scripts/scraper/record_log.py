@@ -0,0 +1,201 @@
+import gzip
+import json
+import os
+import zlib
+from typing import Dict, Iterator
+
+from persistence import atomic_write_json, fsync_dir
+
+CHUNK_SIZE = 1 << 16
+
+
+def _open(path: str, mode: str, compressed: bool = None):
+    if compressed is None:
+        compressed = path.endswith(".gz")
+    if compressed:
+        # gzip members can be appended; readers see one continuous stream
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class RecordLog:
+    """
+    Append-only NDJSON log of scraped records (optionally gzip-compressed).
+
+    Every changed page is appended as soon as it is extracted, so memory
+    stays flat and a crash loses nothing already written. The current
+    corpus is the last line per URL; removed URLs get a tombstone line
+    ({"url": ..., "removed": true}).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self.appended = 0
+
+    def append(self, record: Dict):
+        if self._file is None:
+            self._repair()
+            self._file = _open(self.path, "a")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.appended += 1
+
+    def _repair(self):
+        """
+        Drop a record torn by a crash before appending again; otherwise the
+        next record is glued onto it (plain) or lands behind a truncated
+        gzip member (compressed), and readers never see it.
+        """
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+        if self.path.endswith(".gz"):
+            self._repair_gzip()
+            return
+
+        with open(self.path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            while pos > 0:
+                step = min(CHUNK_SIZE, pos)
+                f.seek(pos - step)
+                newline = f.read(step).rfind(b"\n")
+                if newline >= 0:
+                    pos = pos - step + newline + 1
+                    break
+                pos -= step
+            if pos < end:
+                print(f"⚠️ Dropping torn record at the end of {self.path}")
+                f.truncate(pos)
+
+    def _repair_gzip(self):
+        # A gzip file can't be checked without reading it, so this is one
+        # streaming pass; it only rewrites the file when the tail is torn
+        torn = False
+        with _open(self.path, "r") as f:
+            try:
+                for line in f:
+                    if not line.endswith("\n"):
+                        torn = True
+            except (EOFError, gzip.BadGzipFile, zlib.error):
+                torn = True
+        if not torn:
+            return
+
+        print(f"⚠️ Dropping torn record at the end of {self.path}")
+        tmp = self.path + ".repair"
+        with _open(tmp, "w", compressed=True) as out:
+            for line in self._lines():
+                out.write(line)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, self.path)
+        fsync_dir(os.path.dirname(os.path.abspath(self.path)))
+
+    def flush(self):
+        """Make every appended record durable (callers checkpoint after this)."""
+        if self._file is not None:
+            self._file.flush()   # gzip: also sync-flushes the compressor into the file
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- reading ----------
+
+    def _lines(self) -> Iterator[str]:
+        if not os.path.exists(self.path):
+            return
+        with _open(self.path, "r") as f:
+            try:
+                for line in f:
+                    if line.endswith("\n"):   # a torn last line is ignored
+                        yield line
+            except (EOFError, gzip.BadGzipFile, zlib.error):
+                pass  # truncated gzip member from a crash
+
+    def latest_lines(self) -> Dict[str, int]:
+        """url -> line number of its newest record (URLs only, no content)."""
+        latest = {}
+        for n, line in enumerate(self._lines()):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("removed"):
+                latest.pop(record["url"], None)
+            else:
+                latest[record["url"]] = n
+        return latest
+
+    def iter_latest(self) -> Iterator[Dict]:
+        """Current records, streamed one at a time (two passes over the log)."""
+        wanted = set(self.latest_lines().values())
+        for n, line in enumerate(self._lines()):
+            if n in wanted:
+                yield json.loads(line)
+
+    def line_count(self) -> int:
+        return sum(1 for _ in self._lines())
+
+    # ---------- maintenance ----------
+
+    def compact(self):
+        """Rewrite the log keeping only the newest record per URL."""
+        self.close()
+        tmp = self.path + ".compact"
+        with _open(tmp, "w", compressed=self.path.endswith(".gz")) as out:
+            for record in self.iter_latest():
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+        fsync_dir(os.path.dirname(os.path.abspath(self.path)))
+
+    def export_json(self, path: str):
+        """Write the current corpus as the legacy JSON array, record by record."""
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("[")
+            first = True
+            for record in self.iter_latest():
+                f.write("\n  " if first else ",\n  ")
+                f.write(json.dumps(
+                    {"category": record["category"], "url": record["url"], "content": record["content"]},
+                    ensure_ascii=False
+                ))
+                first = False
+            f.write("\n]\n" if not first else "]\n")
+        os.replace(tmp, path)
+
+
+class Checkpoint:
+    """URLs finished by an interrupted run, so the next run can resume."""
+
+    def __init__(self, path: str, run_key: str):
+        self.path = path
+        self.run_key = run_key
+        self.done = set()
+        self.resumed = False
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("run_key") == run_key:
+                self.done = set(data.get("done", []))
+                self.resumed = True
+
+    def mark(self, url: str):
+        self.done.add(url)
+
+    def save(self):
+        atomic_write_json(self.path, {"run_key": self.run_key, "done": sorted(self.done)})
+
+    def finish(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -1,10 +1,16 @@
+import asyncio
+import hashlib
 import requests
 from bs4 import BeautifulSoup
 import json
 import os
-import time
 import ssl
+import sys
+import time
 import urllib3
+from concurrent.futures import ProcessPoolExecutor
+
+from crawler import CrawlConfig, Crawler
 
 # ================== SAFETY ==================
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -18,22 +24,67 @@ PROJECT_ROOT = os.path.abspath(
 
 LINKS_FILE = os.path.join(PROJECT_ROOT, "links.txt")
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
-OUTPUT_FILE = os.path.join(DATA_DIR, "scraped_data.json")
+OUTPUT_FILE = os.path.join(DATA_DIR, "scraped_data.json")          # legacy export
+COMPRESS = os.getenv("SCRAPER_COMPRESS", "0") == "1"
+LOG_FILE = os.path.join(DATA_DIR, "scraped_data.ndjson" + (".gz" if COMPRESS else ""))
+DELTA_FILE = os.path.join(DATA_DIR, "scraped_delta.ndjson")
+STATE_FILE = os.path.join(DATA_DIR, "crawl_state.json")
+CHECKPOINT_FILE = os.path.join(DATA_DIR, "scrape_checkpoint.json")
 # ------------------------------------------
 
+# Shared helpers live in core/persistence
+sys.path.insert(0, PROJECT_ROOT)
+
+from crawl_state import CrawlState, content_hash
+from record_log import Checkpoint, RecordLog
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
 }
 
 TIMEOUT = 10
-DELAY = 2
+DELAY = 2               # politeness gap between requests to the SAME host
+CONCURRENCY = int(os.getenv("SCRAPER_CONCURRENCY", "32"))
+PER_HOST = int(os.getenv("SCRAPER_PER_HOST", "2"))
+RETRIES = int(os.getenv("SCRAPER_RETRIES", "3"))
+
+# HTML -> text runs in worker processes; 0 = extract in the event loop
+EXTRACT_WORKERS = int(os.getenv("SCRAPER_EXTRACT_WORKERS", str(os.cpu_count() or 1)))
+# "html.parser" (default), "lxml", or "selectolax" (fastest, optional)
+PARSER = os.getenv("SCRAPER_PARSER", "html.parser")
+CHECKPOINT_EVERY = int(os.getenv("SCRAPER_CHECKPOINT_EVERY", "25"))
+EXPORT_JSON = os.getenv("SCRAPER_EXPORT_JSON", "1") == "1"
 
 
 def clean_text(text: str) -> str:
     return " ".join(text.split())
 
 
+def _extract_selectolax(html: str) -> str:
+    from selectolax.parser import HTMLParser
+
+    tree = HTMLParser(html)
+    for node in tree.css("script, style, noscript, header, footer"):
+        node.decompose()
+
+    root = tree.body or tree.root
+    return clean_text(root.text(separator=" ")) if root else ""
+
+
+def extract_text(html: str, parser: str = PARSER) -> str:
+    if parser == "selectolax":
+        return _extract_selectolax(html)
+
+    soup = BeautifulSoup(html, parser)
+
+    for tag in soup(["script", "style", "noscript", "header", "footer"]):
+        tag.decompose()
+
+    return clean_text(soup.get_text(separator=" "))
+
+
 def scrape_url(url: str) -> str:
+    """Fetch and extract a single URL synchronously (handy for debugging)."""
     try:
         response = requests.get(
             url,
@@ -42,19 +93,164 @@ def scrape_url(url: str) -> str:
             verify=False
         )
         response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        for tag in soup(["script", "style", "noscript", "header", "footer"]):
-            tag.decompose()
-
-        return clean_text(soup.get_text(separator=" "))
+        return extract_text(response.text)
 
     except Exception as e:
         print(f"❌ Failed: {url} → {e}")
         return ""
 
 
+def read_links(path: str):
+    """(category, url) pairs from a links file, skipping invalid lines."""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+
+    for line in lines:
+        if "|" not in line:
+            print(f"⚠️ Skipping invalid line: {line}")
+            continue
+
+        category, url = line.split("|", 1)
+        entries.append((category.strip().upper(), url.strip()))
+    return entries
+
+
+def crawl_config() -> CrawlConfig:
+    return CrawlConfig(
+        concurrency=CONCURRENCY,
+        per_host=PER_HOST,
+        host_delay=DELAY,
+        timeout=TIMEOUT,
+        retries=RETRIES,
+        headers=HEADERS
+    )
+
+
+async def crawl(entries, log: RecordLog, delta: RecordLog = None, config: CrawlConfig = None,
+                state: CrawlState = None, checkpoint: Checkpoint = None, workers: int = EXTRACT_WORKERS):
+    """
+    Fetch all entries concurrently and stream changed pages to `log`
+    (and `delta`) as soon as they are extracted.
+
+    With a CrawlState, requests are conditional and pages whose body (or
+    extracted text) is unchanged are skipped before parsing. With a
+    Checkpoint, URLs finished by an interrupted run are not fetched again.
+
+    Returns counts of changed / unchanged / failed pages.
+    """
+    state = state or CrawlState(None)
+    categories = {}
+    for category, url in entries:
+        if checkpoint is None or url not in checkpoint.done:
+            categories.setdefault(url, category)
+
+    stats = {"changed": 0, "unchanged": 0, "failed": 0}
+    processed = 0
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    # Bounds how many fetched pages wait for a parser at once
+    parsing = asyncio.Semaphore(max(workers, 1) * 2)
+
+    def save_progress():
+        log.flush()
+        if delta:
+            delta.flush()
+        state.save()
+        if checkpoint:
+            checkpoint.save()
+
+    async def extract(html):
+        if pool is None:
+            return extract_text(html)
+        return await loop.run_in_executor(pool, extract_text, html)
+
+    async def process(result):
+        nonlocal processed
+        url = result.url
+        try:
+            if result.status == 304 and state.has_content(url):
+                state.record(url, result.headers)
+                stats["unchanged"] += 1
+                print(f"💤 Not modified: {url}")
+                return
+
+            if not result.ok:
+                # The last good record (if any) stays current in the log
+                stats["failed"] += 1
+                print(f"❌ Failed: {url} → {result.error}")
+                return
+
+            raw_hash = content_hash(result.text)
+            if state.has_content(url) and state.raw_unchanged(url, raw_hash):
+                state.record(url, result.headers, raw_hash)
+                stats["unchanged"] += 1
+                print(f"💤 Unchanged: {url}")
+                return
+
+            content = await extract(result.text)
+            if not content:
+                stats["failed"] += 1
+                print(f"⚠️ Empty content: {url}")
+                return
+
+            text_hash = content_hash(content)
+            if state.has_content(url) and state.content_unchanged(url, text_hash):
+                state.record(url, result.headers, raw_hash, text_hash)
+                stats["unchanged"] += 1
+                print(f"💤 Same text: {url}")
+                return
+
+            record = {
+                "category": categories[url],
+                "url": url,
+                "content": content,
+                "content_hash": text_hash,
+                "scraped_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            }
+            log.append(record)
+            if delta:
+                delta.append(record)
+            state.record(url, result.headers, raw_hash, text_hash, changed=True)
+            stats["changed"] += 1
+            print(f"✅ {url}: {len(content)} characters")
+        finally:
+            parsing.release()
+            if checkpoint:
+                checkpoint.mark(url)
+            processed += 1
+            if processed % CHECKPOINT_EVERY == 0:
+                save_progress()
+
+    tasks = []
+    try:
+        async with Crawler(config or crawl_config()) as crawler:
+            async for result in crawler.crawl(categories, state.headers_for):
+                await parsing.acquire()
+                tasks.append(asyncio.ensure_future(process(result)))
+            await asyncio.gather(*tasks)
+    finally:
+        if pool:
+            pool.shutdown()
+        save_progress()
+
+    return stats
+
+
+def import_legacy_json(path: str, log: RecordLog, state: CrawlState):
+    """One-off: seed an empty log from the old scraped_data.json."""
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+
+    for record in records:
+        text_hash = content_hash(record["content"])
+        log.append({**record, "content_hash": text_hash})
+        state.record(record["url"], {}, text_hash=text_hash)
+    log.flush()
+    state.save()
+    print(f"📥 Imported {len(records)} records from {path}")
+
+
 def main():
     print("📁 Project root:", PROJECT_ROOT)
     print("📄 links.txt:", LINKS_FILE)
@@ -67,41 +263,47 @@ def main():
     # Ensure data folder exists
     os.makedirs(DATA_DIR, exist_ok=True)
 
-    results = []
-
-    with open(LINKS_FILE, "r", encoding="utf-8") as f:
-        lines = [line.strip() for line in f if line.strip()]
+    entries = read_links(LINKS_FILE)
+    with open(LINKS_FILE, "rb") as f:
+        run_key = hashlib.sha1(f.read()).hexdigest()
 
-    for line in lines:
-        if "|" not in line:
-            print(f"⚠️ Skipping invalid line: {line}")
-            continue
+    state = CrawlState(STATE_FILE)
+    log = RecordLog(LOG_FILE)
+    if not os.path.exists(LOG_FILE) and os.path.exists(OUTPUT_FILE):
+        import_legacy_json(OUTPUT_FILE, log, state)
 
-        category, url = line.split("|", 1)
-        category = category.strip().upper()
-        url = url.strip()
+    checkpoint = Checkpoint(CHECKPOINT_FILE, run_key)
+    if checkpoint.resumed:
+        print(f"⏩ Resuming: {len(checkpoint.done)} links already done")
+    elif os.path.exists(DELTA_FILE):
+        os.remove(DELTA_FILE)
+    delta = RecordLog(DELTA_FILE)
 
-        print(f"\n🔎 Scraping: {url}")
-        content = scrape_url(url)
+    print(f"🔎 Scraping {len(entries)} links ({CONCURRENCY} at once, {PER_HOST} per host)")
+    stats = asyncio.run(crawl(entries, log, delta, state=state, checkpoint=checkpoint))
 
-        if content:
-            results.append({
-                "category": category,
-                "url": url,
-                "content": content
-            })
-            print(f"✅ Saved {len(content)} characters")
-        else:
-            print("⚠️ Empty content")
+    # Links dropped from links.txt get a tombstone
+    current = {url for _, url in entries}
+    for url in state.known_urls() - current:
+        tombstone = {"url": url, "removed": True}
+        log.append(tombstone)
+        delta.append(tombstone)
+        state.forget(url)
 
-        time.sleep(DELAY)
+    log.close()
+    delta.close()
+    state.save()
+    checkpoint.finish()
 
-    # SAVE STRICTLY INSIDE data/
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    latest = log.latest_lines()
+    if log.line_count() > 2 * len(latest) + 100:
+        log.compact()
+    if EXPORT_JSON:
+        log.export_json(OUTPUT_FILE)
 
-    print(f"\n🎉 DONE")
-    print(f"📁 File saved ONLY at → {OUTPUT_FILE}")
+    print(f"\n🎉 DONE: {stats['changed']} changed, {stats['unchanged']} unchanged, {stats['failed']} failed")
+    print(f"📁 Records log → {LOG_FILE}")
+    print(f"📁 Delta (changed only) → {DELTA_FILE}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+from .metrics import REGISTRY, Counter, Histogram, Registry
+from .middleware import SLO_SECONDS, MetricsMiddleware, instrument
+from .tracing import record, span, traced
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Histogram",
+    "Registry",
+    "SLO_SECONDS",
+    "MetricsMiddleware",
+    "instrument",
+    "record",
+    "span",
+    "traced",
+]
@@ -0,0 +1,101 @@
+import os
+import time
+from typing import Dict, Optional
+
+from .metrics import REGISTRY
+from .tracing import current_spans, end_trace, start_trace
+
+# ===== CONFIG =====
+# Latency targets from requirements.md (seconds)
+SLO_SECONDS = {
+    "dashboard": float(os.getenv("SLO_DASHBOARD_SECONDS", "2.0")),
+    "search": float(os.getenv("SLO_SEARCH_SECONDS", "1.0")),
+    "recommendations": float(os.getenv("SLO_RECOMMENDATIONS_SECONDS", "3.0")),
+    "voice": float(os.getenv("SLO_VOICE_SECONDS", "0.5")),
+}
+METRICS_PATH = "/metrics"
+# ==================
+
+REQUESTS = REGISTRY.counter(
+    "http_requests", "HTTP requests handled", ("service", "method", "route", "status")
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("service", "method", "route")
+)
+SLO_REQUESTS = REGISTRY.counter(
+    "slo_requests", "Requests counted against a latency target", ("service", "slo", "route")
+)
+SLO_BREACHES = REGISTRY.counter(
+    "slo_breaches", "Requests slower than their latency target", ("service", "slo", "route")
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware timing every HTTP request by route template
+    ("/users/{id}", not the raw path, so label counts stay bounded).
+
+    Routes mapped to an SLO in `slos` also count toward slo_requests and,
+    when slower than SLO_SECONDS[slo], slo_breaches. Spans recorded while
+    handling the request are returned in a Server-Timing header.
+    """
+
+    def __init__(self, app, service: str, slos: Optional[Dict[str, str]] = None):
+        self.app = app
+        self.service = service
+        self.slos = dict(slos or {})
+        unknown = set(self.slos.values()) - set(SLO_SECONDS)
+        if unknown:
+            raise ValueError(f"Unknown SLOs: {sorted(unknown)}")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        token = start_trace()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                spans = current_spans()
+                if spans:
+                    timing = ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in spans)
+                    message = {**message, "headers": list(message.get("headers", [])) +
+                               [(b"server-timing", timing.encode("latin-1"))]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_trace(token)
+            elapsed = time.perf_counter() - start
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+
+            REQUESTS.inc(service=self.service, method=method, route=template, status=str(status))
+            REQUEST_SECONDS.observe(elapsed, service=self.service, method=method, route=template)
+
+            slo = self.slos.get(template)
+            if slo:
+                SLO_REQUESTS.inc(service=self.service, slo=slo, route=template)
+                if elapsed > SLO_SECONDS[slo]:
+                    SLO_BREACHES.inc(service=self.service, slo=slo, route=template)
+                    print(f"🐢 SLO breach: {method} {template} took {elapsed:.2f}s "
+                          f"(target {SLO_SECONDS[slo]:.1f}s, {slo})")
+
+
+def instrument(app, service: str, slos: Optional[Dict[str, str]] = None):
+    """Add request metrics to a FastAPI app and serve them at /metrics."""
+    from fastapi.responses import PlainTextResponse
+
+    app.add_middleware(MetricsMiddleware, service=service, slos=slos)
+
+    @app.get(METRICS_PATH, include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+    return app
@@ -0,0 +1,70 @@
+import contextvars
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+from .metrics import REGISTRY
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "stage_duration_seconds", "Time spent in one named stage of a request", ("stage",)
+)
+
+# Spans of the request being handled (None outside a request)
+_trace: contextvars.ContextVar = contextvars.ContextVar("telemetry_trace", default=None)
+
+
+def start_trace() -> contextvars.Token:
+    return _trace.set([])
+
+
+def end_trace(token: contextvars.Token) -> List[Tuple[str, float]]:
+    spans = _trace.get() or []
+    _trace.reset(token)
+    return spans
+
+
+def current_spans() -> Optional[List[Tuple[str, float]]]:
+    return _trace.get()
+
+
+def record(stage: str, seconds: float):
+    """Record a duration measured elsewhere (histogram + current trace)."""
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    spans = _trace.get()
+    if spans is not None:
+        spans.append((stage, seconds))
+
+
+@contextmanager
+def span(stage: str):
+    """
+    Time the enclosed block as `stage`:
+
+        with span("db.load"):
+            user = db_engine.get_user(user_id)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start)
+
+
+def traced(stage: str):
+    """Decorator form of span(), for plain and async functions."""
+    def wrap(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(stage):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return wrap